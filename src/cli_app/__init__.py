@@ -0,0 +1,6 @@
+import sys
+
+# Imports are timed from the moment the package is imported, before cli_app.main pulls in the rest.
+if "--profile-startup" in sys.argv:
+    from cli_app.startup_profiler import startup_profiler
+    startup_profiler.enable()
@@ -0,0 +1,108 @@
+import io
+import sys
+from contextlib import redirect_stdout
+from typing import Iterable, Iterator, Optional, TextIO
+from cli_app.builtin_commands import run_builtin
+from cli_app.cli_helpers import is_help_input, show_help
+from cli_app.command_runner import parse_input, resolve_command, run_command
+from cli_app.config import BATCH_OUTPUT_BUFFER_SIZE, LOGGER_CONFIG
+from cli_app.parallel_runner import is_parallel_input, run_parallel
+from shared.logger import setup_logger
+
+logger = setup_logger(__name__, LOGGER_CONFIG)
+
+class BufferedOutput(io.StringIO):
+    """
+    Collects command output in memory and hands it to the real stream in large chunks.
+    """
+    def __init__(self, stream: TextIO, buffer_size: int = BATCH_OUTPUT_BUFFER_SIZE):
+        super().__init__()
+        self.stream = stream
+        self.buffer_size = buffer_size
+
+    def write(self, text: str) -> int:
+        written = super().write(text)
+        if self.tell() >= self.buffer_size:
+            self.flush()
+        return written
+
+    def flush(self) -> None:
+        text = self.getvalue()
+        if text:
+            self.stream.write(text)
+            self.stream.flush()
+            self.seek(0)
+            self.truncate()
+
+def read_batch(source: str) -> Iterator[str]:
+    """
+    Yields command lines from a file, or from stdin when source is '-'. Blank lines and # comments are skipped.
+    """
+    if source == "-":
+        yield from _command_lines(sys.stdin)
+        return
+    with open(source, 'r') as f:
+        yield from _command_lines(f)
+
+def _command_lines(lines: Iterable[str]) -> Iterator[str]:
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+def run_batch(
+    lines: Iterable[str],
+    folders: list[str],
+    commands: dict[str, dict[str, dict[str, str]]],
+    keep_going: bool = False,
+    output: Optional[TextIO] = None
+) -> int:
+    """
+    Runs command lines back to back against the loaded commands.
+    Returns 0 when every command succeeded, 1 otherwise; stops at the first failure unless keep_going is set.
+    """
+    selected_folder: Optional[str] = None
+    failures = 0
+    executed = 0
+    buffered_output = BufferedOutput(output or sys.stdout)
+
+    with redirect_stdout(buffered_output):
+        for index, user_input in enumerate(lines, start=1):
+            if user_input.lower() == "exit":
+                break
+
+            if is_help_input(user_input):
+                show_help(user_input, commands, selected_folder, page_size=None)
+                continue
+
+            if user_input.lower().startswith("set_folder"):
+                folder_name = user_input.split(maxsplit=1)[-1]
+                if folder_name in folders:
+                    selected_folder = folder_name
+                    continue
+                logger.error(f"Command {index}: folder '{folder_name}' not found.")
+                ok = False
+            elif is_parallel_input(user_input):
+                ok = run_parallel(user_input, commands, selected_folder)
+                executed += 1
+            else:
+                ok = run_builtin(user_input)
+                if ok is None:
+                    try:
+                        command, args = parse_input(user_input)
+                    except ValueError as e:
+                        logger.error(f"Command {index}: cannot parse '{user_input}': {e}")
+                        command, args = None, []
+                    folder = resolve_command(commands, command, selected_folder) if command else None
+                    ok = folder is not None and run_command(folder, command, args)
+                    executed += 1
+
+            if not ok:
+                failures += 1
+                logger.error(f"Command {index} failed: {user_input}")
+                if not keep_going:
+                    break
+
+    buffered_output.flush()
+    logger.info(f"Batch finished: {executed} command(s), {failures} failure(s).")
+    return 1 if failures else 0
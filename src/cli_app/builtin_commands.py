@@ -0,0 +1,20 @@
+from typing import Optional
+
+def run_builtin(user_input: str) -> Optional[bool]:
+    """
+    Runs the 'jobs', 'kill' and 'stats' built-ins, shared by the interactive loop, batch mode and the daemon.
+    Returns None when user_input is not one of them, otherwise whether it succeeded.
+    Their modules are imported on first use, so startup does not pay for them.
+    """
+    name = user_input.lower().split(maxsplit=1)[:1]
+    if name == ["jobs"]:
+        from cli_app.worker_pool import show_jobs
+        show_jobs()
+        return True
+    if name == ["kill"]:
+        from cli_app.worker_pool import kill_job
+        return kill_job(user_input)
+    if name == ["stats"]:
+        from cli_app.command_stats import show_stats
+        return show_stats(user_input)
+    return None
@@ -1,6 +1,7 @@
 import os
-from typing import Optional
-from cli_app.config import COMMAND_NAME_MAX_LENGTH
+import sys
+from typing import Callable, Iterator, Optional, TextIO
+from cli_app.config import COMMAND_NAME_MAX_LENGTH, HELP_PAGE_SIZE
 
 def generate_string(count: int, string: str = ' ', max_length: int = 1000) -> str:
     result = string * count
@@ -14,26 +15,129 @@ def generate_padding(length: int, string: str) -> str:
         return ''
     return generate_string(padding_length)
 
-def get_help(folders: dict[str, dict[str, dict[str, str]]], selected_folder: Optional[str]) -> None:
-    help = []
-    
-    help.append("Simple CLI App")
-    help.append("Commands:")
-    
+HelpLines = tuple[str, ...]
+
+_help_cache: dict[tuple[Optional[str], Optional[str]], HelpLines] = {}
+_help_cache_version: Optional[tuple[int, tuple]] = None
+
+def _help_entry(name: str, description: str) -> str:
+    # At least one space before the dash, even for names of COMMAND_NAME_MAX_LENGTH or more
+    return f"  {name.ljust(COMMAND_NAME_MAX_LENGTH - 1)} - {description}"
+
+def _describe(command_info: dict) -> str:
+    description = command_info['description']
+    if command_info.get('aliases'):
+        description += f" (aliases: {', '.join(command_info['aliases'])})"
+    flags = [flag for flag in ('background', 'cacheable') if command_info.get(flag) is True]
+    if flags:
+        description += f" [{', '.join(flags)}]"
+    return description
+
+def build_help_lines(
+    folders: dict[str, dict[str, dict[str, str]]],
+    selected_folder: Optional[str],
+    topic: Optional[str] = None
+) -> HelpLines:
+    """
+    Builds the help text line by line. topic limits the listing to one folder, or to commands starting with it.
+    """
     selected_folder_info = f" Selected folder: {selected_folder}" if selected_folder else " Selected folder: None"
-    help.append(f"\n  {selected_folder_info}")
-    
-    length = COMMAND_NAME_MAX_LENGTH
-    help.append(f"\n  help{generate_padding(length, 'help')}- Show this help message")
-    help.append(f"  exit{generate_padding(length, 'exit')}- Exit the program")
-    help.append(f"  set_folder [folder_name]{generate_padding(length, 'set_folder')}- Set folder context")
-    
-    for folder_name, commands in folders.items():
-        help.append(f"\n{folder_name} commands:")
-        for command_name, command_info in commands.items():
-            help.append(f"  {command_name}{generate_padding(length, command_name)}- {command_info['description']}")
-    
-    return "\n".join(help)
+    help = [
+        "Simple CLI App",
+        "Commands:",
+        "",
+        f"  {selected_folder_info}",
+        "",
+        _help_entry("help", "Show this help message"),
+        _help_entry("help [topic]", "Show one folder, or commands starting with topic"),
+        _help_entry("exit", "Exit the program"),
+        f"  set_folder [folder_name]{generate_padding(COMMAND_NAME_MAX_LENGTH, 'set_folder')}- Set folder context",
+        _help_entry("parallel cmd1 ; cmd2", "Run commands side by side"),
+        _help_entry("jobs", "List background jobs"),
+        _help_entry("kill [job_id]", "Stop a background job"),
+        _help_entry("stats [dump [file]]", "Show command timings, or write them as OpenMetrics"),
+    ]
+
+    if topic in folders:
+        sections = {topic: folders[topic]}
+    elif topic:
+        sections = {}
+        for folder_name, commands in folders.items():
+            matching = {name: info for name, info in commands.items() if name.startswith(topic)}
+            if matching:
+                sections[folder_name] = matching
+        if not sections:
+            help.extend(["", f"No folder or command matches '{topic}'."])
+    else:
+        sections = folders
+
+    # CommandFolders reads the metadata modules declare only now, on first help
+    details = getattr(folders, 'details', None)
+    for folder_name, commands in sections.items():
+        help.extend(["", f"{folder_name} commands:"])
+        help.extend(
+            _help_entry(command_name, _describe(details(folder_name, command_name) if details else command_info))
+            for command_name, command_info in commands.items()
+        )
+    return tuple(help)
+
+def get_help_lines(
+    folders: dict[str, dict[str, dict[str, str]]],
+    selected_folder: Optional[str],
+    topic: Optional[str] = None
+) -> HelpLines:
+    """
+    Returns the help lines, cached per command registry version (CommandFolders.version) and metadata signature,
+    selected folder and topic. Plain dicts carry no version and are rendered every time.
+    """
+    global _help_cache_version
+    if getattr(folders, 'version', None) is None:
+        return build_help_lines(folders, selected_folder, topic)
+    version = (folders.version, folders.metadata_signature())
+    if version != _help_cache_version:
+        _help_cache.clear()
+        _help_cache_version = version
+
+    key = (selected_folder, topic)
+    if key not in _help_cache:
+        _help_cache[key] = build_help_lines(folders, selected_folder, topic)
+    return _help_cache[key]
+
+def get_help(folders: dict[str, dict[str, dict[str, str]]], selected_folder: Optional[str], topic: Optional[str] = None) -> str:
+    return "\n".join(get_help_lines(folders, selected_folder, topic))
+
+def is_help_input(user_input: str) -> bool:
+    return user_input.lower().split(maxsplit=1)[:1] == ["help"]
+
+def help_pages(lines: HelpLines, page_size: int = HELP_PAGE_SIZE) -> Iterator[str]:
+    for start in range(0, len(lines), page_size):
+        yield "\n".join(lines[start:start + page_size])
+
+def show_help(
+    user_input: str,
+    folders: dict[str, dict[str, dict[str, str]]],
+    selected_folder: Optional[str],
+    page_size: Optional[int] = HELP_PAGE_SIZE,
+    output: Optional[TextIO] = None,
+    ask_more: Optional[Callable[[], bool]] = None
+) -> None:
+    """
+    Writes 'help [folder|prefix]' output to stdout a page at a time, without going through the logger.
+    Between pages ask_more is called, and a False answer stops the listing. Without ask_more every page is written.
+    """
+    output = output or sys.stdout
+    parts = user_input.split(maxsplit=1)
+    topic = parts[1].strip() if len(parts) > 1 else None
+    lines = get_help_lines(folders, selected_folder, topic)
+    pages = help_pages(lines, page_size or len(lines) or 1)
+    for number, page in enumerate(pages):
+        if number and ask_more is not None and not ask_more():
+            break
+        output.write(page + "\n")
+        output.flush()
+
+def ask_more_help() -> bool:
+    return input("-- more (Enter to continue, q to stop) --").strip().lower() != "q"
 
 def get_current_working_directory():
     current_folder = os.getcwd()
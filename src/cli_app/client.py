@@ -0,0 +1,72 @@
+"""
+Thin client for the command daemon (python -m cli_app.main --daemon).
+
+    python -m cli_app.client [--folder NAME] <command> [args...]
+
+Sends argv over the daemon's Unix socket, streams the command's output back and exits with its exit code.
+It imports only sys, os and socket (no json, and typing only under a type checker), so a call costs little more
+than interpreter startup.
+
+Wire format, shared with cli_app/daemon.py: the request is a 4-byte big-endian length followed by the folder
+(empty for none) and the arguments, NUL-separated and UTF-8 encoded. Responses are frames of one kind byte
+(o = stdout, e = stderr, x = exit code), a 4-byte big-endian length and the UTF-8 payload.
+"""
+from __future__ import annotations
+import os
+import socket
+import sys
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Optional
+
+DEFAULT_SOCKET = '.cache/cli_app.sock'  # same as DAEMON_SOCKET in cli_app/config.py, not imported to keep startup small
+
+def socket_path() -> str:
+    return os.environ.get('CLI_APP_SOCKET', DEFAULT_SOCKET)
+
+def encode_request(argv: list[str], folder: Optional[str] = None) -> bytes:
+    payload = "\0".join([folder or ""] + argv).encode()
+    return len(payload).to_bytes(4, 'big') + payload
+
+def read_exact(stream, size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise EOFError
+    return data
+
+def send_command(argv: list[str], folder: Optional[str] = None, path: Optional[str] = None, stdout=None, stderr=None) -> int:
+    stdout, stderr = stdout or sys.stdout, stderr or sys.stderr
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(path or socket_path())
+        connection.sendall(encode_request(argv, folder))
+        with connection.makefile('rb') as frames:
+            try:
+                while True:
+                    kind = read_exact(frames, 1)
+                    data = read_exact(frames, int.from_bytes(read_exact(frames, 4), 'big')).decode()
+                    if kind == b'x':
+                        return int(data)
+                    stream = stdout if kind == b'o' else stderr
+                    stream.write(data)
+                    stream.flush()
+            except EOFError:
+                stderr.write("Daemon closed the connection before the command finished.\n")
+                return 1
+
+def main(argv: Optional[list[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    folder = None
+    if argv[:1] in (["-f"], ["--folder"]) and len(argv) > 1:
+        folder, argv = argv[1], argv[2:]
+    if not argv:
+        sys.stderr.write("Usage: python -m cli_app.client [--folder NAME] <command> [args...]\n")
+        return 2
+    try:
+        return send_command(argv, folder)
+    except OSError as e:
+        sys.stderr.write(f"Cannot reach the daemon on {socket_path()}: {e}\n")
+        return 2
+
+if __name__ == "__main__":
+    raise SystemExit(main())
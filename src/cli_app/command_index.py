@@ -0,0 +1,136 @@
+import itertools
+from typing import Optional
+from cli_app.command_manifest import CommandManifest, stat_signature
+from cli_app.command_metadata import read_metadata
+
+class PrefixTrie:
+    """
+    Character trie over command names.
+    Each node keeps the number of names below it, so counting and completing a prefix cost O(len(prefix)) plus the output.
+    """
+    _END = ''
+
+    def __init__(self, words: Optional[list[str]] = None):
+        self._root: dict = {'#': 0}
+        for word in words or []:
+            self.insert(word)
+
+    def insert(self, word: str) -> None:
+        if word in self:
+            return
+        node = self._root
+        node['#'] += 1
+        for char in word:
+            node = node.setdefault(char, {'#': 0})
+            node['#'] += 1
+        node[self._END] = True
+
+    def _find_node(self, prefix: str) -> Optional[dict]:
+        node = self._root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return None
+        return node
+
+    def __contains__(self, word: str) -> bool:
+        node = self._find_node(word)
+        return node is not None and self._END in node
+
+    def count(self, prefix: str) -> int:
+        node = self._find_node(prefix)
+        return node['#'] if node is not None else 0
+
+    def complete(self, prefix: str, limit: Optional[int] = None) -> list[str]:
+        """
+        Returns the words starting with prefix in sorted order, at most limit of them.
+        """
+        node = self._find_node(prefix)
+        if node is None:
+            return []
+
+        words = []
+        stack = [(node, prefix)]
+        while stack and (limit is None or len(words) < limit):
+            node, word = stack.pop()
+            if self._END in node:
+                words.append(word)
+            for char in sorted((key for key in node if key not in (self._END, '#')), reverse=True):
+                stack.append((node[char], word + char))
+        return words
+
+    def unique_completion(self, prefix: str) -> Optional[str]:
+        """
+        Returns the only word starting with prefix, or None when there are none or several.
+        """
+        if self.count(prefix) != 1:
+            return None
+        return self.complete(prefix, limit=1)[0]
+
+class CommandIndex:
+    """
+    Inverted index from command name to the folders defining it, plus a prefix trie over command names.
+    """
+    def __init__(self, folders: dict[str, dict[str, dict[str, str]]]):
+        self.folders_by_command: dict[str, list[str]] = {}
+        for folder_name, commands in folders.items():
+            for command_name in commands:
+                self.folders_by_command.setdefault(command_name, []).append(folder_name)
+        self.trie = PrefixTrie(list(self.folders_by_command))
+
+    def find(self, command_name: str) -> list[str]:
+        return list(self.folders_by_command.get(command_name, []))
+
+    def complete(self, prefix: str, limit: Optional[int] = None) -> list[str]:
+        return self.trie.complete(prefix, limit)
+
+    def is_ambiguous(self, prefix: str) -> bool:
+        return self.trie.count(prefix) > 1
+
+_versions = itertools.count(1)
+
+class CommandFolders(dict):
+    """
+    Folder -> commands mapping returned by the loader, carrying a CommandIndex built once at load time.
+    Call reindex() after changing the mapping in place; it also gives the mapping a new version for caches keyed on it.
+
+    The loader also records each command's source file, so details() can read the metadata a module declares
+    when help asks for it instead of at load time.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.command_paths: dict[tuple[str, str], str] = {}
+        self.descriptions: dict = {}
+        self.manifest: Optional[CommandManifest] = None
+        self.reindex()
+
+    def reindex(self) -> None:
+        self.index = CommandIndex(self)
+        self.version = next(_versions)
+        self._details: dict[tuple[str, str], tuple[Optional[list[int]], dict]] = {}
+
+    def details(self, folder: str, command: str) -> dict:
+        """
+        Returns the command's entry with the module's metadata (see command_metadata) merged under the
+        descriptions file, which takes precedence. A module is read again only after its stat signature changed,
+        through the manifest when there is one.
+        """
+        key = (folder, command)
+        path = self.command_paths.get(key)
+        if path is None:
+            return self[folder][command]
+        signature = stat_signature(path)
+        cached = self._details.get(key)
+        if cached is None or cached[0] != signature:
+            info = dict(read_metadata(path, self.manifest))
+            info.update(self.descriptions.get(folder, {}).get(command, {}))
+            info.setdefault("description", self[folder][command]["description"])
+            cached = self._details[key] = (signature, info)
+        return cached[1]
+
+    def metadata_signature(self) -> tuple:
+        """
+        The stat signatures of the command modules. It changes when a module is edited, and with it the metadata
+        details() returns, while version stays the same.
+        """
+        return tuple(tuple(stat_signature(path) or ()) for path in self.command_paths.values())
@@ -1,55 +1,50 @@
 import json
+import os
+from fnmatch import fnmatch
 from pathlib import Path
-from cli_app.config import COMMAND_NAME_MAX_LENGTH, LOGGER_CONFIG
-from shared.logger import setup_logger
-import json
+from typing import Optional
+from cli_app.command_index import CommandFolders
+from cli_app.command_manifest import CommandManifest
+from cli_app.config import COMMAND_IGNORE_PATTERNS, COMMAND_NAME_MAX_LENGTH, LOGGER_CONFIG
+from cli_app.startup_profiler import startup_profiler
+from shared.logger import debug_lazy, setup_logger
 
 logger = setup_logger(__name__, LOGGER_CONFIG)
 
 def discover_folders_with_commands(
     src_folder_with_commands: str = ".",
-    ignore_these_folders: list[str] = ["cli_app", "shared", "lib", "tests"]
+    ignore_these_folders: list[str] = ["cli_app", "shared", "lib", "tests"],
+    manifest: Optional[CommandManifest] = None,
+    ignore_patterns: list[str] = COMMAND_IGNORE_PATTERNS
 ) -> list[str]:
-    src_path = Path(src_folder_with_commands)
-
-    if not src_path.is_dir():
+    if not Path(src_folder_with_commands).is_dir():
         logger.error(f"Specified source folder does not exist: {src_folder_with_commands}")
         return []
 
-    ignore_set = {folder.lower() for folder in ignore_these_folders}
-
-    folder_names = [
-        folder.name
-        for folder in src_path.rglob("*")
-        if folder.is_dir()
-        and folder.name.lower() not in ignore_set
-        and (folder / "__init__.py").exists()
-    ]
+    folder_names = sorted(walk_command_tree(src_folder_with_commands, ignore_these_folders, ignore_patterns, manifest))
 
-    logger.debug(f"Discovering folders...")
-    logger.debug(f"Root: {src_folder_with_commands}")
-    logger.debug(f"Ignored: {ignore_these_folders}")
-    logger.debug(f"Discovered folders: {folder_names}")
+    logger.debug("Discovering folders...")
+    debug_lazy(logger, "Root: {root}", root=src_folder_with_commands)
+    debug_lazy(logger, "Ignored: {ignored}", ignored=ignore_these_folders)
+    debug_lazy(logger, "Discovered folders: {folders}", folders=folder_names)
 
-    return sorted(folder_names)
+    return folder_names
 
 def load_commands(
-    folders: list[str], 
+    folders: list[str],
     descriptions_file: str = 'command_descriptions.json',
-    ignore_subfolders: list[str] = ["lib", "tests"]
+    ignore_subfolders: list[str] = ["lib", "tests"],
+    manifest: Optional[CommandManifest] = None,
+    ignore_patterns: list[str] = COMMAND_IGNORE_PATTERNS
 ) -> dict[str, dict[str, dict[str, str]]]:
-    
+
     if not isinstance(folders, list) or not all(isinstance(folder, str) for folder in folders):
         raise TypeError("The 'folders' parameter must be a list of folder names as strings.")
 
     folder_commands = {}
 
-    try:
-        with open(descriptions_file, 'r') as f:
-            descriptions_data = json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError) as e:
-        logger.error(f"Error reading descriptions file {descriptions_file}: {e}")
-        descriptions_data = {}
+    descriptions_data = load_descriptions(descriptions_file, manifest)
+    command_paths: dict[tuple[str, str], str] = {}
 
     for folder in folders:
         folder_path = Path(folder)
@@ -57,24 +52,161 @@ def load_commands(
             logger.warning(f"Folder does not exist or is not a directory: {folder}")
             continue
 
-        logger.debug(f"Processing folder: {folder}")
+        debug_lazy(logger, "Processing folder: {folder}", folder=folder)
+        command_names = walk_command_tree(folder, ignore_subfolders, ignore_patterns, manifest, root_folder=folder, command_paths=command_paths).get(folder, [])
+        folder_commands[folder] = describe_commands(folder, command_names, descriptions_data)
 
-        commands = {}
-        for subfolder in folder_path.rglob('*.py'):
-            logger.debug(f"file: {subfolder.name}")
-            if subfolder.is_dir() or subfolder.parent.name.lower() in ignore_subfolders:
-                logger.debug(f"Ignored: {subfolder.name}")
-                continue
+    debug_lazy(logger, "Discovered commands: {commands}", commands=folder_commands)
+    return with_metadata_sources(CommandFolders(folder_commands), command_paths, descriptions_data, manifest)
 
-            if subfolder.name != "__init__.py":
-                command_name = subfolder.stem
-                if len(command_name) > COMMAND_NAME_MAX_LENGTH:
-                    raise ValueError(f"Command name '{command_name}' is too long. Maximum allowed length is {COMMAND_NAME_MAX_LENGTH} characters.")
+def load_command_tree(
+    src_folder_with_commands: str = ".",
+    descriptions_file: str = 'command_descriptions.json',
+    ignore_these_folders: list[str] = ["cli_app", "shared", "lib", "tests"],
+    manifest: Optional[CommandManifest] = None,
+    ignore_patterns: list[str] = COMMAND_IGNORE_PATTERNS
+) -> tuple[list[str], dict[str, dict[str, dict[str, str]]]]:
+    """
+    Discovers folders and loads their commands in a single walk of the source tree.
+    Equivalent to load_commands(discover_folders_with_commands()) without walking each folder twice.
+    """
+    if not Path(src_folder_with_commands).is_dir():
+        logger.error(f"Specified source folder does not exist: {src_folder_with_commands}")
+        return [], CommandFolders()
+
+    command_paths: dict[tuple[str, str], str] = {}
+    with startup_profiler.phase("discovery"):
+        tree = walk_command_tree(src_folder_with_commands, ignore_these_folders, ignore_patterns, manifest, command_paths=command_paths)
+
+    with startup_profiler.phase("loading"):
+        descriptions_data = load_descriptions(descriptions_file, manifest)
+        folders = sorted(tree)
+        folder_commands = CommandFolders(
+            (folder, describe_commands(folder, tree[folder], descriptions_data)) for folder in folders
+        )
+        with_metadata_sources(folder_commands, command_paths, descriptions_data, manifest)
+
+    debug_lazy(logger, "Discovered folders: {folders}", folders=folders)
+    debug_lazy(logger, "Discovered commands: {commands}", commands=folder_commands)
+    return folders, folder_commands
+
+def walk_command_tree(
+    src_folder_with_commands: str,
+    ignore_these_folders: list[str],
+    ignore_patterns: list[str] = COMMAND_IGNORE_PATTERNS,
+    manifest: Optional[CommandManifest] = None,
+    root_folder: Optional[str] = None,
+    command_paths: Optional[dict[tuple[str, str], str]] = None
+) -> dict[str, list[str]]:
+    """
+    Walks the tree once with os.scandir and returns command names grouped by folder.
+
+    A folder is any directory below the root holding __init__.py; its commands are the .py files
+    in its subtree, up to the next nested folder. Directories matching an ignored name or glob pattern
+    are pruned before descending, so their contents are never listed.
+    When root_folder is given, the root itself is treated as that folder.
+    When command_paths is given, it is filled with the source file of each (folder, command).
+    """
+    ignore_set = {folder.lower() for folder in ignore_these_folders}
+    folder_commands: dict[str, list[str]] = {}
+    if root_folder is not None:
+        folder_commands[root_folder] = []
+
+    stack = [(src_folder_with_commands, root_folder)]
+    while stack:
+        path, owner = stack.pop()
+        subdirs, py_files = list_directory(path, manifest)
+
+        if path != src_folder_with_commands and "__init__.py" in py_files:
+            owner = os.path.basename(path)
+            folder_commands.setdefault(owner, [])
+
+        if owner is not None:
+            for file_name in py_files:
+                if file_name != "__init__.py":
+                    add_command(folder_commands[owner], file_name[:-3])
+                    if command_paths is not None:
+                        command_paths[(owner, file_name[:-3])] = os.path.join(path, file_name)
+
+        for subdir in subdirs:
+            if is_ignored(subdir, ignore_set, ignore_patterns):
+                debug_lazy(logger, "Ignored: {folder} in {root}", folder=subdir, root=path)
+                continue
+            stack.append((os.path.join(path, subdir), owner))
 
-                description = descriptions_data.get(folder, {}).get(command_name, f"Description for {command_name} not found")
-                commands[command_name] = description
+    for command_names in folder_commands.values():
+        command_names.sort()
+    return folder_commands
 
-        folder_commands[folder] = commands
+def list_directory(path: str, manifest: Optional[CommandManifest] = None) -> tuple[list[str], list[str]]:
+    """
+    Returns the subdirectory names and .py file names of a directory, served from the manifest while its mtime holds.
+    """
+    if manifest is not None:
+        cached = manifest.get_listing(path)
+        if cached is not None:
+            return cached
 
-    logger.debug(f"Discovered commands: {folder_commands}")
+    subdirs, py_files = [], []
+    try:
+        mtime = os.stat(path).st_mtime_ns
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.name)
+                elif entry.name.endswith(".py"):
+                    py_files.append(entry.name)
+    except OSError as e:
+        logger.warning(f"Could not list directory {path}: {e}")
+        return [], []
+
+    if manifest is not None and not manifest.contains(path):
+        manifest.set_listing(path, mtime, subdirs, py_files)
+    return subdirs, py_files
+
+def is_ignored(folder_name: str, ignore_set: set[str], ignore_patterns: list[str]) -> bool:
+    if folder_name.lower() in ignore_set:
+        return True
+    return any(fnmatch(folder_name, pattern) for pattern in ignore_patterns)
+
+def add_command(command_names: list[str], command_name: str) -> None:
+    if len(command_name) > COMMAND_NAME_MAX_LENGTH:
+        raise ValueError(f"Command name '{command_name}' is too long. Maximum allowed length is {COMMAND_NAME_MAX_LENGTH} characters.")
+    command_names.append(command_name)
+
+def load_descriptions(descriptions_file: str, manifest: Optional[CommandManifest] = None) -> dict:
+    descriptions_data = manifest.get_descriptions(descriptions_file) if manifest is not None else None
+    if descriptions_data is None:
+        descriptions_data = read_descriptions(descriptions_file)
+        if manifest is not None:
+            manifest.set_descriptions(descriptions_file, descriptions_data)
+    return descriptions_data
+
+def read_descriptions(descriptions_file: str) -> dict:
+    try:
+        with open(descriptions_file, 'r') as f:
+            return json.load(f)
+    except (json.JSONDecodeError, FileNotFoundError) as e:
+        logger.error(f"Error reading descriptions file {descriptions_file}: {e}")
+        return {}
+
+def describe_commands(folder: str, command_names: list[str], descriptions_data: dict) -> dict[str, dict[str, str]]:
+    folder_descriptions = descriptions_data.get(folder, {})
+    return {
+        command_name: folder_descriptions.get(command_name, {"description": f"Description for {command_name} not found"})
+        for command_name in command_names
+    }
+
+def with_metadata_sources(
+    folder_commands: CommandFolders,
+    command_paths: dict[tuple[str, str], str],
+    descriptions_data: dict,
+    manifest: Optional[CommandManifest] = None
+) -> CommandFolders:
+    """
+    Records where CommandFolders.details() finds module metadata. Nothing is read here; loading stays a directory walk.
+    """
+    folder_commands.command_paths = command_paths
+    folder_commands.descriptions = descriptions_data
+    folder_commands.manifest = manifest
     return folder_commands
@@ -0,0 +1,119 @@
+import json
+import os
+from typing import Optional
+from cli_app.config import LOGGER_CONFIG
+from shared.logger import setup_logger
+
+logger = setup_logger(__name__, LOGGER_CONFIG)
+
+MANIFEST_VERSION = 3
+
+def stat_signature(path: str) -> Optional[list[int]]:
+    """
+    Returns [mtime_ns, size] for a path, or None when it cannot be stat'ed.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+class CommandManifest:
+    """
+    On-disk cache of directory listings, the descriptions file and command module metadata.
+
+    Every directory visited by the command walk is stored with its mtime, its subdirectories and its .py files;
+    the descriptions file is keyed by mtime and size. A directory mtime changes whenever an entry is added,
+    removed or renamed in it, so a warm start only stats what was recorded and rescans the directories that changed.
+    """
+    def __init__(self, path: Optional[str] = None, data: Optional[dict] = None):
+        self.path = path
+        self.data = data if data is not None else self._empty()
+        self.dirty = False
+
+    @staticmethod
+    def _empty() -> dict:
+        return {'version': MANIFEST_VERSION, 'dirs': {}, 'descriptions': {}, 'metadata': {}}
+
+    @classmethod
+    def load(cls, path: str) -> 'CommandManifest':
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return cls(path)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Ignoring unreadable command manifest {path}: {e}")
+            return cls(path)
+
+        if not isinstance(data, dict) or data.get('version') != MANIFEST_VERSION:
+            logger.debug(f"Command manifest {path} has an old format, starting fresh.")
+            return cls(path)
+        return cls(path, data)
+
+    def save(self) -> None:
+        if not self.dirty or not self.path:
+            return
+
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        temp_path = f"{self.path}.tmp"
+        try:
+            with open(temp_path, 'w') as f:
+                json.dump(self.data, f)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write command manifest {self.path}: {e}")
+            return
+        self.dirty = False
+
+    def contains(self, path: str) -> bool:
+        """
+        Tells whether a directory holds the manifest itself, so its own writes never invalidate discovery.
+        """
+        if not self.path:
+            return False
+        manifest_dir = os.path.dirname(os.path.abspath(self.path))
+        return os.path.abspath(path) == manifest_dir
+
+    def get_listing(self, path: str) -> Optional[tuple[list[str], list[str]]]:
+        key = os.path.abspath(path)
+        entry = self.data['dirs'].get(key)
+        if entry is None:
+            return None
+
+        signature = stat_signature(key)
+        if signature is None:
+            del self.data['dirs'][key]
+            self.dirty = True
+            return None
+        if signature[0] != entry['mtime']:
+            return None
+        return entry['dirs'], entry['files']
+
+    def set_listing(self, path: str, mtime: int, subdirs: list[str], py_files: list[str]) -> None:
+        self.data['dirs'][os.path.abspath(path)] = {'mtime': mtime, 'dirs': subdirs, 'files': py_files}
+        self.dirty = True
+
+    def get_descriptions(self, descriptions_file: str) -> Optional[dict]:
+        entry = self.data['descriptions'].get(descriptions_file)
+        if entry is None or stat_signature(descriptions_file) != entry['signature']:
+            return None
+        return entry['data']
+
+    def set_descriptions(self, descriptions_file: str, descriptions_data: dict) -> None:
+        signature = stat_signature(descriptions_file)
+        if signature is None:
+            return
+        self.data['descriptions'][descriptions_file] = {'signature': signature, 'data': descriptions_data}
+        self.dirty = True
+
+    # Module paths are kept as the walk produced them, relative to the working directory like the manifest file:
+    # one abspath() per command module would cost more than the lookup it guards.
+    def get_metadata(self, path: str) -> Optional[dict]:
+        return self.data['metadata'].get(path)
+
+    def set_metadata(self, path: str, signature: list[int], digest: str, metadata: dict) -> None:
+        self.data['metadata'][path] = {'signature': signature, 'hash': digest, 'metadata': metadata}
+        self.dirty = True
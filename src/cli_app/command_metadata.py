@@ -0,0 +1,96 @@
+import ast
+import hashlib
+from typing import Optional
+from cli_app.command_manifest import CommandManifest, stat_signature
+from cli_app.config import LOGGER_CONFIG
+from shared.logger import setup_logger
+
+logger = setup_logger(__name__, LOGGER_CONFIG)
+
+METADATA_FIELDS = {
+    'description': str,
+    'aliases': (list, tuple),
+    'background': bool,
+    'cacheable': bool,
+}
+
+_metadata_by_hash: dict[str, dict] = {}
+
+def file_hash(source: bytes) -> str:
+    return hashlib.blake2b(source, digest_size=16).hexdigest()
+
+def extract_metadata(source: bytes, filename: str = "<command>") -> dict:
+    """
+    Reads literal module-level assignments of the metadata fields without importing the module.
+    Falls back to the first line of the module docstring for the description. Values that are not
+    literals of the expected type are skipped.
+    """
+    try:
+        tree = ast.parse(source, filename)
+    except (SyntaxError, ValueError) as e:
+        logger.warning(f"Cannot read metadata from {filename}: {e}")
+        return {}
+
+    metadata = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets = [node.target]
+        else:
+            continue
+
+        names = [target.id for target in targets if isinstance(target, ast.Name) and target.id in METADATA_FIELDS]
+        if not names:
+            continue
+        try:
+            value = ast.literal_eval(node.value)
+        except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+            continue
+        for name in names:
+            if not isinstance(value, METADATA_FIELDS[name]):
+                continue
+            if name == 'aliases':
+                if not all(isinstance(alias, str) for alias in value):
+                    continue
+                value = list(value)
+            metadata[name] = value
+
+    if 'description' not in metadata:
+        docstring = ast.get_docstring(tree)
+        if docstring and docstring.strip():
+            metadata['description'] = docstring.strip().splitlines()[0]
+    return metadata
+
+def read_metadata(path: str, manifest: Optional[CommandManifest] = None) -> dict:
+    """
+    Returns the metadata of a command module, parsed at most once per file content.
+    With a manifest, an unchanged stat signature skips reading the file, and a touched file whose
+    content hash is unchanged skips parsing it.
+    """
+    signature = stat_signature(path)
+    if signature is None:
+        return {}
+
+    entry = manifest.get_metadata(path) if manifest is not None else None
+    if entry is not None and entry['signature'] == signature:
+        return entry['metadata']
+
+    try:
+        with open(path, 'rb') as f:
+            source = f.read()
+    except OSError as e:
+        logger.warning(f"Cannot read metadata from {path}: {e}")
+        return {}
+
+    digest = file_hash(source)
+    if entry is not None and entry['hash'] == digest:
+        metadata = entry['metadata']
+    else:
+        metadata = _metadata_by_hash.get(digest)
+        if metadata is None:
+            metadata = _metadata_by_hash[digest] = extract_metadata(source, path)
+
+    if manifest is not None:
+        manifest.set_metadata(path, signature, digest, metadata)
+    return metadata
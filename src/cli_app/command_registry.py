@@ -0,0 +1,73 @@
+import importlib
+import os
+from types import ModuleType
+from typing import Callable, Optional
+
+def source_mtime(source: Optional[str]) -> Optional[int]:
+    if not isinstance(source, str):
+        return None
+    try:
+        return os.stat(source).st_mtime_ns
+    except OSError:
+        return None
+
+class CommandRegistry:
+    """
+    Maps (folder, command) to the resolved `run` callable of the command module.
+
+    An entry stays valid while the mtime of the module's source file is unchanged,
+    so repeated dispatch is a dict lookup and an edited command is reloaded on its next run.
+    """
+    def __init__(self):
+        self._commands: dict[tuple[str, str], tuple[ModuleType, Callable, Optional[str], Optional[int]]] = {}
+
+    def get(self, folder: str, command: str) -> Optional[Callable]:
+        """
+        Returns the cached `run` callable, or None when the command is unknown or its source changed.
+        """
+        entry = self._commands.get((folder, command))
+        if entry is None:
+            return None
+
+        _, run, source, mtime = entry
+        if source_mtime(source) != mtime:
+            return None
+        return run
+
+    def load(self, folder: str, command: str) -> ModuleType:
+        """
+        Imports the command module, reloading it when a registered copy went stale.
+        """
+        module = importlib.import_module(f"{folder}.{command}")
+        entry = self._commands.get((folder, command))
+        if entry is not None and entry[0] is module and source_mtime(entry[2]) != entry[3]:
+            module = importlib.reload(module)
+        return module
+
+    def register(self, folder: str, command: str, module: ModuleType) -> Callable:
+        source = getattr(module, '__file__', None)
+        self._commands[(folder, command)] = (module, module.run, source, source_mtime(source))
+        return module.run
+
+    def is_background(self, folder: str, command: str) -> bool:
+        """
+        Tells whether a registered command module declares `background = True`.
+        """
+        entry = self._commands.get((folder, command))
+        return entry is not None and getattr(entry[0], 'background', False) is True
+
+    def invalidate(self, folder: Optional[str] = None, command: Optional[str] = None) -> None:
+        """
+        Drops cached entries, all of them or those matching the given folder and/or command.
+        """
+        for key in list(self._commands):
+            if (folder is None or key[0] == folder) and (command is None or key[1] == command):
+                del self._commands[key]
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        return key in self._commands
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+command_registry = CommandRegistry()
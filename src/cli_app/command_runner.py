@@ -1,13 +1,17 @@
 import importlib.util
 import importlib
 import shlex
+import time
 from typing import Optional
+from cli_app.command_index import CommandFolders
+from cli_app.command_registry import command_registry
+from cli_app.command_stats import command_stats
 from cli_app.config import LOGGER_CONFIG
-from shared.logger import setup_logger
+from shared.logger import debug_lazy, setup_logger
 
 logger = setup_logger(__name__, LOGGER_CONFIG)
 
-def execute_user_input(user_input: str, folders: dict[str, dict[str, dict[str, str]]], selected_folder: str):
+def execute_user_input(user_input: str, folders: dict[str, dict[str, dict[str, str]]], selected_folder: str) -> bool:
     command, args = parse_input(user_input)
 
     matching_folders = find_command_in_folders(folders, command)
@@ -15,15 +19,17 @@ def execute_user_input(user_input: str, folders: dict[str, dict[str, dict[str, s
     if len(matching_folders) == 1:
         selected_folder = matching_folders[0]
         logger.info(f"Automatically selected folder: {selected_folder}")
-        run_command(selected_folder, command, args)
-        return
+        return run_command(selected_folder, command, args)
 
     if len(matching_folders) > 1:
         selected_folder = display_menu(matching_folders)
-        run_command(selected_folder, command, args)
-        return
+        return run_command(selected_folder, command, args)
 
     logger.info(f"Unknown command '{command}'. Type 'help' for a list of commands.")
+    suggestions = suggest_commands(folders, command)
+    if suggestions:
+        logger.info(f"Did you mean: {', '.join(suggestions)}?")
+    return False
 
 def parse_input(user_input: str) -> tuple[str, list[str]]:
     if not user_input.strip():
@@ -35,33 +41,80 @@ def parse_input(user_input: str) -> tuple[str, list[str]]:
     return command, args
 
 def find_command_in_folders(folders: dict[str, dict[str, dict[str, str]]], command_name: str) -> list[str]:
+    if isinstance(folders, CommandFolders):
+        return folders.index.find(command_name)
     return [folder_name for folder_name, commands in folders.items() if command_name in commands]
 
-def run_command(selected_folder: str, command: str, args: Optional[list[str]] = None) -> None:
+def suggest_commands(folders: dict[str, dict[str, dict[str, str]]], prefix: str, limit: int = 5) -> list[str]:
+    if not prefix or not isinstance(folders, CommandFolders):
+        return []
+    return folders.index.complete(prefix, limit)
+
+def resolve_command(folders: dict[str, dict[str, dict[str, str]]], command: str, selected_folder: Optional[str]) -> Optional[str]:
+    """
+    Picks the folder for a command without asking: the only match, or the selected folder when several match.
+    """
+    matching_folders = find_command_in_folders(folders, command)
+    if len(matching_folders) == 1:
+        return matching_folders[0]
+    if selected_folder in matching_folders:
+        return selected_folder
+    if matching_folders:
+        logger.error(f"Command '{command}' is defined in {matching_folders}; use set_folder to pick one.")
+    else:
+        logger.error(f"Unknown command '{command}'.")
+    return None
+
+def run_command(selected_folder: str, command: str, args: Optional[list[str]] = None) -> bool:
+    """
+    Runs a command's `run` function and tells whether it was found and finished without raising.
+    """
     args = args or []
     
     module_name = f"{selected_folder}.{command}"
-    logger.debug(f"Attempting to find module: {module_name}")
-    
-    spec = importlib.util.find_spec(module_name)
-    if spec is None:
-        logger.error(f"Command '{command}' not found in folder '{selected_folder}'.")
-        return
+    started = time.perf_counter()
+    run = command_registry.get(selected_folder, command)
 
-    try:
-        command_module = importlib.import_module(module_name)
-    except Exception as e:
-        logger.exception(f"Failed to import module '{module_name}'. Error: {e}")
-        return
+    if run is None:
+        debug_lazy(logger, "Attempting to find module: {module}", module=module_name)
 
-    if hasattr(command_module, 'run'):
+        spec = importlib.util.find_spec(module_name)
+        command_stats.record(selected_folder, command, 'lookup', time.perf_counter() - started, failed=spec is None)
+        if spec is None:
+            logger.error(f"Command '{command}' not found in folder '{selected_folder}'.")
+            return False
+
+        started = time.perf_counter()
         try:
-            logger.info(f"Running command '{command}' with arguments: {args}")
-            command_module.run(args)
+            command_module = command_registry.load(selected_folder, command)
         except Exception as e:
-            logger.exception(f"An error occurred while executing the 'run' function in '{module_name}'. Error: {e}")
+            command_stats.record(selected_folder, command, 'import', time.perf_counter() - started, failed=True)
+            logger.exception(f"Failed to import module '{module_name}'. Error: {e}")
+            return False
+        command_stats.record(selected_folder, command, 'import', time.perf_counter() - started, failed=not hasattr(command_module, 'run'))
+
+        if not hasattr(command_module, 'run'):
+            logger.warning(f"Command '{command}' does not have a 'run' function.")
+            return False
+
+        run = command_registry.register(selected_folder, command, command_module)
     else:
-        logger.warning(f"Command '{command}' does not have a 'run' function.")
+        command_stats.record(selected_folder, command, 'lookup', time.perf_counter() - started)
+
+    if command_registry.is_background(selected_folder, command):
+        from cli_app.worker_pool import worker_pool
+        job = worker_pool.submit(selected_folder, command, args)
+        logger.info(f"Started background job {job.id} for command '{command}' with arguments: {args}")
+        return True
+
+    try:
+        logger.info(f"Running command '{command}' with arguments: {args}")
+        with command_stats.timed(selected_folder, command, 'run'):
+            run(args)
+    except Exception as e:
+        logger.exception(f"An error occurred while executing the 'run' function in '{module_name}'. Error: {e}")
+        return False
+    return True
 
 def display_menu(options: list[str]) -> str:
     logger.info("Multiple folders contain this command:")
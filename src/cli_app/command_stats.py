@@ -0,0 +1,192 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from cli_app.config import LOGGER_CONFIG, STATS_BUCKETS, STATS_METRICS_FILE
+from shared.logger import setup_logger
+
+logger = setup_logger(__name__, LOGGER_CONFIG)
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram in seconds. Memory stays constant however many samples are recorded;
+    percentiles are interpolated within the bucket they fall in, clamped to the observed min and max.
+    """
+    def __init__(self, bounds: tuple[float, ...] = STATS_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        index = 0
+        while index < len(self.bounds) and seconds > self.bounds[index]:
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        lower = 0.0
+        for index, bucket_count in enumerate(self.counts):
+            upper = self.bounds[index] if index < len(self.bounds) else self.max
+            if bucket_count and cumulative + bucket_count >= rank:
+                low, high = max(lower, self.min), min(upper, self.max)
+                return low + (high - low) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+            lower = upper
+        return self.max
+
+    def cumulative_counts(self) -> list[tuple[str, int]]:
+        buckets, total = [], 0
+        for bound, bucket_count in zip(self.bounds, self.counts):
+            total += bucket_count
+            buckets.append((repr(float(bound)), total))
+        buckets.append(("+Inf", self.count))
+        return buckets
+
+class CommandStats:
+    """
+    In-memory latency histograms per command and phase (lookup, import, run), with call and error counts.
+    Safe to record from pool threads.
+    """
+    def __init__(self):
+        self.histograms: dict[tuple[str, str, str], LatencyHistogram] = {}
+        self.calls: dict[tuple[str, str], int] = {}
+        self.errors: dict[tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, folder: str, command: str, phase: str, seconds: float, failed: bool = False) -> None:
+        """
+        Adds one timing. A lookup marks the start of a call, so every call is counted exactly once.
+        """
+        with self._lock:
+            key = (folder, command)
+            if phase == 'lookup':
+                self.calls[key] = self.calls.get(key, 0) + 1
+            if failed:
+                self.errors[key] = self.errors.get(key, 0) + 1
+            histogram = self.histograms.get((folder, command, phase))
+            if histogram is None:
+                histogram = self.histograms[(folder, command, phase)] = LatencyHistogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def timed(self, folder: str, command: str, phase: str) -> Iterator[None]:
+        """
+        Records how long the block took; an exception leaving the block counts as a failure and is re-raised.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.record(folder, command, phase, time.perf_counter() - start, failed=True)
+            raise
+        self.record(folder, command, phase, time.perf_counter() - start)
+
+    def histogram(self, folder: str, command: str, phase: str) -> Optional[LatencyHistogram]:
+        return self.histograms.get((folder, command, phase))
+
+    def reset(self) -> None:
+        with self._lock:
+            self.histograms.clear()
+            self.calls.clear()
+            self.errors.clear()
+
+    def summary(self) -> list[str]:
+        """
+        Returns a table of calls, error rate and run latency percentiles per command.
+        """
+        with self._lock:
+            lines = [f"  {'command':<32}{'calls':>7}{'err rate':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'import ms':>11}"]
+            for (folder, command), calls in sorted(self.calls.items()):
+                errors = self.errors.get((folder, command), 0)
+                run = self.histograms.get((folder, command, 'run'))
+                imported = self.histograms.get((folder, command, 'import'))
+                percentiles = [_milliseconds(run.percentile(q) if run else None) for q in (0.5, 0.95, 0.99)]
+                import_time = _milliseconds(imported.sum / imported.count if imported else None)
+                lines.append(
+                    f"  {folder + '.' + command:<32}{calls:>7}{errors / calls:>10.1%}"
+                    f"{percentiles[0]:>10}{percentiles[1]:>10}{percentiles[2]:>10}{import_time:>11}"
+                )
+            return lines
+
+    def to_openmetrics(self) -> str:
+        """
+        Renders the histograms and counters in the OpenMetrics text format.
+        """
+        with self._lock:
+            lines = [
+                "# TYPE cli_command_duration_seconds histogram",
+                "# UNIT cli_command_duration_seconds seconds",
+                "# HELP cli_command_duration_seconds Time spent per command phase (lookup, import, run).",
+            ]
+            for (folder, command, phase), histogram in sorted(self.histograms.items()):
+                labels = _labels(folder=folder, command=command, phase=phase)
+                for bound, total in histogram.cumulative_counts():
+                    lines.append(f'cli_command_duration_seconds_bucket{{{labels},le="{bound}"}} {total}')
+                lines.append(f"cli_command_duration_seconds_count{{{labels}}} {histogram.count}")
+                lines.append(f"cli_command_duration_seconds_sum{{{labels}}} {histogram.sum!r}")
+
+            for name, counts, help in (
+                ('cli_command_calls', self.calls, "Commands dispatched."),
+                ('cli_command_errors', self.errors, "Commands that were not found, failed to import or raised."),
+            ):
+                lines.extend([f"# TYPE {name} counter", f"# HELP {name} {help}"])
+                for (folder, command), total in sorted(counts.items()):
+                    lines.append(f"{name}_total{{{_labels(folder=folder, command=command)}}} {total}")
+            lines.append("# EOF")
+            return "\n".join(lines) + "\n"
+
+    def write_openmetrics(self, path: str = STATS_METRICS_FILE) -> None:
+        """
+        Writes the OpenMetrics dump next to a temporary file and swaps it in, so a scraper never reads half a file.
+        """
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w') as f:
+            f.write(self.to_openmetrics())
+        os.replace(temp_path, path)
+
+def _milliseconds(seconds: Optional[float]) -> str:
+    return "-" if seconds is None else f"{seconds * 1000:.2f}"
+
+def _labels(**labels: str) -> str:
+    escaped = (value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for value in labels.values())
+    return ",".join(f'{name}="{value}"' for name, value in zip(labels, escaped))
+
+command_stats = CommandStats()
+
+def show_stats(user_input: str, stats: CommandStats = command_stats) -> bool:
+    """
+    Handles 'stats' (print the table) and 'stats dump [file]' (write OpenMetrics text).
+    The table goes to stdout like help, so batch mode, which only logs warnings, shows it too.
+    """
+    argument = user_input.split()[1:]
+    if argument[:1] == ["dump"]:
+        path = argument[1] if len(argument) > 1 else STATS_METRICS_FILE
+        try:
+            stats.write_openmetrics(path)
+        except OSError as e:
+            logger.error(f"Could not write metrics to {path}: {e}")
+            return False
+        logger.info(f"Metrics written to {path}")
+        return True
+    if argument:
+        logger.info("Usage: stats [dump [file]]")
+        return False
+    if not stats.calls:
+        print("No commands run yet.")
+        return True
+    print("Command statistics (run latency):\n" + "\n".join(stats.summary()))
+    return True
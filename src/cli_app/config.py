@@ -1,6 +1,9 @@
 import logging
+import os
 
 COMMAND_NAME_MAX_LENGTH = 20
+COMMAND_MANIFEST_FILE = '.cache/command_manifest.json'
+COMMAND_IGNORE_PATTERNS = ['.*', '__pycache__', 'logs', 'venv', 'env', '*.egg-info', 'node_modules', 'build', 'dist']
 LOGGER_CONFIG = {
             'log_file': 'logs/cli_app.log',
             'log_to_file': True,
@@ -10,4 +13,13 @@ LOGGER_CONFIG = {
             'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             'max_bytes': 10 * 1024 * 1024,  # 10 MB, you can adjust this
             'backup_count': 3, 
-        }
\ No newline at end of file
+            'use_queue': False,  # True hands records to a background thread that batches console and file writes
+        }
+BATCH_OUTPUT_BUFFER_SIZE = 64 * 1024
+PARALLEL_EXECUTOR = 'thread'  # 'thread' or 'process'
+PARALLEL_WORKERS = 4
+BACKGROUND_WORKERS = 2
+HELP_PAGE_SIZE = 40
+STATS_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)  # seconds
+STATS_METRICS_FILE = '.cache/command_metrics.prom'
+DAEMON_SOCKET = os.environ.get('CLI_APP_SOCKET', '.cache/cli_app.sock')  # cli_app/client.py uses the same default
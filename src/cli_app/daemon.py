@@ -0,0 +1,166 @@
+import os
+import shlex
+import signal
+import socket
+import socketserver
+import threading
+from typing import Optional
+from cli_app.builtin_commands import run_builtin
+from cli_app.cli_helpers import is_help_input, show_help
+from cli_app.command_runner import parse_input, resolve_command, run_command
+from cli_app.config import DAEMON_SOCKET, LOGGER_CONFIG
+from cli_app.parallel_runner import is_parallel_input, output_capture, run_parallel
+from shared.logger import setup_logger
+
+logger = setup_logger(__name__, LOGGER_CONFIG)
+
+class FrameStream:
+    """
+    File-like stream that sends every write to the client as a frame of the given kind (b'o' or b'e').
+    The wire format is described in cli_app/client.py.
+    """
+    def __init__(self, wfile, kind: bytes, lock: threading.Lock):
+        self.wfile = wfile
+        self.kind = kind
+        self.lock = lock
+
+    def write(self, text: str) -> int:
+        if text:
+            send_frame(self.wfile, self.lock, self.kind, text)
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+def send_frame(wfile, lock: threading.Lock, kind: bytes, text: str) -> None:
+    data = text.encode()
+    with lock:
+        wfile.write(kind + len(data).to_bytes(4, 'big') + data)
+        wfile.flush()
+
+def decode_request(payload: bytes) -> tuple[Optional[str], list[str]]:
+    folder, *argv = payload.decode().split("\0")
+    return folder or None, argv
+
+def join_argv(argv: list[str]) -> str:
+    """
+    Quotes argv back into a command line. A bare ';' argument separates the commands of 'parallel' and stays unquoted.
+    """
+    return " ".join(arg if arg == ";" else shlex.quote(arg) for arg in argv)
+
+class CommandRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Reads one request (folder and argv) and streams the command's stdout and log output back, then its exit code.
+    """
+    def handle(self) -> None:
+        lock = threading.Lock()
+        try:
+            size = int.from_bytes(self.rfile.read(4), 'big')
+            folder, argv = decode_request(self.rfile.read(size))
+        except UnicodeDecodeError as e:
+            send_frame(self.wfile, lock, b'e', f"Bad request: {e}\n")
+            send_frame(self.wfile, lock, b'x', "2")
+            return
+
+        stdout, stderr = FrameStream(self.wfile, b'o', lock), FrameStream(self.wfile, b'e', lock)
+        try:
+            with output_capture.capture(stdout, stderr):
+                code = self.server.run_line(join_argv(argv), stdout, folder)
+            send_frame(self.wfile, lock, b'x', str(code))
+        except OSError:
+            pass  # the client went away
+
+class CommandDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Keeps the loaded commands and imported command modules resident and runs command lines sent over a Unix socket.
+    Each connection runs on its own thread with its output captured per thread.
+    """
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, commands: dict[str, dict[str, dict[str, str]]]):
+        self.socket_path = socket_path
+        self.commands = commands
+        super().__init__(socket_path, CommandRequestHandler)
+
+    def server_bind(self) -> None:
+        # The socket is created with the umask applied, so it is never reachable by other users, not even briefly
+        previous_umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(previous_umask)
+
+    def run_line(self, command_line: str, stdout, selected_folder: Optional[str] = None) -> int:
+        """
+        Runs one command line like batch mode does and returns the exit code: 0 success, 1 command failed, 2 not run.
+        Each request stands alone, so set_folder is refused; the client's --folder selects the folder instead.
+        """
+        if is_help_input(command_line):
+            show_help(command_line, self.commands, selected_folder, page_size=None, output=stdout)
+            return 0
+        if command_line.lower().split(maxsplit=1)[:1] == ["set_folder"]:
+            logger.error("set_folder does not carry over between daemon requests; pass --folder to the client instead.")
+            return 2
+        if is_parallel_input(command_line):
+            return 0 if run_parallel(command_line, self.commands, selected_folder) else 1
+        builtin_ok = run_builtin(command_line)
+        if builtin_ok is not None:
+            return 0 if builtin_ok else 1
+        try:
+            command, args = parse_input(command_line)
+        except ValueError as e:
+            logger.error(f"Cannot parse '{command_line}': {e}")
+            return 2
+        if not command:
+            logger.error("No command given.")
+            return 2
+        folder = resolve_command(self.commands, command, selected_folder)
+        if folder is None:
+            return 2
+        return 0 if run_command(folder, command, args) else 1
+
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+def socket_in_use(socket_path: str) -> bool:
+    """
+    Tells whether a daemon answers on the socket; a leftover socket file from a crashed daemon is removed.
+    """
+    if not os.path.exists(socket_path):
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+            return True
+        except OSError:
+            os.remove(socket_path)
+            return False
+
+def _stop(signum, frame) -> None:
+    raise KeyboardInterrupt
+
+def serve_daemon(commands: dict[str, dict[str, dict[str, str]]], socket_path: str = DAEMON_SOCKET) -> int:
+    if not hasattr(socket, 'AF_UNIX'):
+        logger.error("Daemon mode needs Unix domain sockets, which this platform does not provide.")
+        return 1
+    if socket_in_use(socket_path):
+        logger.error(f"A daemon is already listening on {socket_path}.")
+        return 1
+    if os.path.dirname(socket_path):
+        os.makedirs(os.path.dirname(socket_path), exist_ok=True)
+
+    server = CommandDaemon(socket_path, commands)
+    signal.signal(signal.SIGTERM, _stop)
+    output_capture.install()
+    logger.info(f"Daemon listening on {socket_path}. Stop it with Ctrl+C or SIGTERM.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        output_capture.uninstall()
+        server.server_close()
+        logger.info("Daemon stopped.")
+    return 0
@@ -1,30 +1,92 @@
+import argparse
+import atexit
+import logging
+import sys
 from typing import Optional
-from cli_app.config import LOGGER_CONFIG
-from shared.logger import setup_logger
-from cli_app.cli_helpers import get_current_working_directory, get_help
-from cli_app.command_loader import discover_folders_with_commands, load_commands
+from cli_app.config import COMMAND_MANIFEST_FILE, LOGGER_CONFIG
+from shared.logger import set_console_level, setup_logger
+from cli_app.batch_runner import read_batch, run_batch
+from cli_app.builtin_commands import run_builtin
+from cli_app.cli_helpers import ask_more_help, get_current_working_directory, is_help_input, show_help
+from cli_app.command_index import CommandFolders
+from cli_app.command_loader import load_command_tree
+from cli_app.command_manifest import CommandManifest
 from cli_app.command_runner import execute_user_input
+from cli_app.parallel_runner import PARALLEL_COMMAND, is_parallel_input, run_parallel
+from cli_app.startup_profiler import PROFILE_STARTUP_FLAG, startup_profiler
 
 logger = setup_logger(__name__, LOGGER_CONFIG)
 
-def main() -> None:
+BUILTIN_COMMANDS = ["exit", "help", "jobs", "kill", PARALLEL_COMMAND, "set_folder", "stats"]
+
+def enable_completion(commands: CommandFolders) -> None:
+    try:
+        import readline
+    except ImportError:
+        return
+
+    def complete(text: str, state: int) -> Optional[str]:
+        if state == 0:
+            complete.matches = [name for name in BUILTIN_COMMANDS if name.startswith(text)] + commands.index.complete(text)
+        return complete.matches[state] if state < len(complete.matches) else None
+
+    readline.set_completer(complete)
+    readline.parse_and_bind("tab: complete")
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Simple CLI App")
+    parser.add_argument(PROFILE_STARTUP_FLAG, action="store_true", help="Report import and startup phase timings")
+    parser.add_argument("--batch", metavar="FILE", help="Run commands from FILE ('-' for stdin) instead of the interactive loop")
+    parser.add_argument("--keep-going", action="store_true", help="In batch mode, continue after a failing command")
+    parser.add_argument("--daemon", action="store_true", help="Keep commands loaded and serve them over a Unix socket (see cli_app.client)")
+    parser.add_argument("--metrics-file", metavar="FILE", help="Write command statistics in OpenMetrics format to FILE on exit")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.profile_startup:
+        startup_profiler.enable()
+    if args.batch:
+        set_console_level(logging.WARNING)
+    if args.metrics_file:
+        from cli_app.command_stats import command_stats
+        atexit.register(command_stats.write_openmetrics, args.metrics_file)
+
     logger.info("Welcome to the Simple CLI App! Type 'help' for commands.")
     logger.info(get_current_working_directory())
 
     selected_folder: Optional[str] = None
 
-    folders = discover_folders_with_commands()
-    commands = load_commands(folders)
+    with startup_profiler.phase("manifest"):
+        manifest = CommandManifest.load(COMMAND_MANIFEST_FILE)
+    folders, commands = load_command_tree(manifest=manifest)
+    with startup_profiler.phase("manifest"):
+        manifest.save()
+    # Help reads command metadata through the manifest later on; keep what it read for the next start
+    atexit.register(manifest.save)
+    enable_completion(commands)
+
+    if args.profile_startup:
+        # Straight to stderr: batch mode has lowered the console level below INFO by now
+        sys.stderr.write(startup_profiler.report() + "\n")
+        startup_profiler.disable()
+
+    if args.daemon:
+        from cli_app.daemon import serve_daemon
+        return serve_daemon(commands)
+
+    if args.batch:
+        return run_batch(read_batch(args.batch), folders, commands, keep_going=args.keep_going)
 
     while True:
         user_input = input("> ").strip()
 
         if user_input.lower() == "exit":
             logger.info("Exiting the application.")
-            break
+            return 0
 
-        elif user_input.lower() == "help":
-            logger.info(get_help(commands, selected_folder))
+        elif is_help_input(user_input):
+            show_help(user_input, commands, selected_folder, ask_more=ask_more_help)
 
         elif user_input.lower().startswith("set_folder"):
             folder_name = user_input.split(maxsplit=1)[-1]
@@ -33,8 +95,12 @@ def main() -> None:
                 logger.info(f"Folder context set to: {folder_name}")
             else:
                 logger.info(f"Folder '{folder_name}' not found. Available: {folders}")                
-        else:
+
+        elif is_parallel_input(user_input):
+            run_parallel(user_input, commands, selected_folder)
+
+        elif run_builtin(user_input) is None:
             execute_user_input(user_input, commands, selected_folder)
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -0,0 +1,220 @@
+import io
+import logging
+import sys
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator, Optional, TextIO
+from cli_app.command_runner import parse_input, resolve_command, run_command
+from cli_app.config import LOGGER_CONFIG, PARALLEL_EXECUTOR, PARALLEL_WORKERS
+from shared.logger import get_console_handlers, get_queue_handlers, setup_logger
+
+logger = setup_logger(__name__, LOGGER_CONFIG)
+
+PARALLEL_COMMAND = "parallel"
+
+class ThreadLocalStream:
+    """
+    Stand-in for sys.stdout that writes to the current thread's capture buffer, or to the real stream when there is none.
+    """
+    def __init__(self, stream, local: threading.local):
+        self.stream = stream
+        self.local = local
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self.local, 'stdout', None)
+        return (buffer if buffer is not None else self.stream).write(text)
+
+    def flush(self) -> None:
+        if getattr(self.local, 'stdout', None) is None:
+            self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+class CaptureLogHandler(logging.Handler):
+    """
+    Writes formatted records emitted by threads that are currently capturing to their capture stream.
+    """
+    def __init__(self, local: threading.local):
+        super().__init__()
+        self.local = local
+        self.setFormatter(logging.Formatter(LOGGER_CONFIG['format']))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        stream = getattr(self.local, 'stderr', None)
+        if stream is not None:
+            stream.write(self.format(record) + "\n")
+
+class OutputCapture:
+    """
+    Captures stdout and log output per thread, so commands running side by side keep their output apart.
+    While installed, console handlers drop records from capturing threads; the log file still gets everything.
+    With queued logging the console handler runs on the listener thread, so records are tagged before they are queued.
+    install() and uninstall() nest, so independent users can share the capture.
+    """
+    def __init__(self):
+        self.local = threading.local()
+        self.log_handler = CaptureLogHandler(self.local)
+        self.installed = False
+        self._users = 0
+        self._lock = threading.Lock()
+        self._stdout = None
+
+    def _is_capturing(self) -> bool:
+        return getattr(self.local, 'stderr', None) is not None
+
+    def _tag_captured(self, record: logging.LogRecord) -> bool:
+        record.captured_output = self._is_capturing()
+        return True
+
+    def _not_capturing(self, record: logging.LogRecord) -> bool:
+        return not getattr(record, 'captured_output', False) and not self._is_capturing()
+
+    def install(self) -> None:
+        with self._lock:
+            self._users += 1
+            if not self.installed:
+                self._install()
+
+    def uninstall(self) -> None:
+        with self._lock:
+            self._users = max(self._users - 1, 0)
+            if self.installed and not self._users:
+                self._uninstall()
+
+    def _install(self) -> None:
+        self._stdout = sys.stdout
+        sys.stdout = ThreadLocalStream(sys.stdout, self.local)
+        console_handlers = get_console_handlers()
+        self.log_handler.setLevel(min((handler.level for handler in console_handlers), default=logging.DEBUG))
+        logging.getLogger().addHandler(self.log_handler)
+        for handler in console_handlers:
+            handler.addFilter(self._not_capturing)
+        for handler in get_queue_handlers():
+            handler.addFilter(self._tag_captured)
+        self.installed = True
+
+    def _uninstall(self) -> None:
+        sys.stdout = self._stdout
+        logging.getLogger().removeHandler(self.log_handler)
+        for handler in get_console_handlers():
+            handler.removeFilter(self._not_capturing)
+        for handler in get_queue_handlers():
+            handler.removeFilter(self._tag_captured)
+        self.installed = False
+
+    @contextmanager
+    def capture(self, stdout: Optional[TextIO] = None, stderr: Optional[TextIO] = None) -> Iterator[tuple[TextIO, TextIO]]:
+        """
+        Sends this thread's stdout and log output to the given streams, or to new StringIO buffers.
+        """
+        self.local.stdout, self.local.stderr = stdout or io.StringIO(), stderr or io.StringIO()
+        try:
+            yield self.local.stdout, self.local.stderr
+        finally:
+            self.local.stdout, self.local.stderr = None, None
+
+output_capture = OutputCapture()
+
+_executors: dict[tuple[str, int], Executor] = {}
+
+def get_executor(kind: str = PARALLEL_EXECUTOR, workers: int = PARALLEL_WORKERS) -> Executor:
+    """
+    Returns a pool of the given kind ('thread' or 'process'), created on first use and reused afterwards.
+    """
+    if kind not in ('thread', 'process'):
+        raise ValueError(f"Unknown executor kind '{kind}'. Use 'thread' or 'process'.")
+    key = (kind, workers)
+    if key not in _executors:
+        _executors[key] = ThreadPoolExecutor(max_workers=workers) if kind == 'thread' else ProcessPoolExecutor(max_workers=workers)
+    return _executors[key]
+
+def run_captured(folder: str, command: str, args: list[str]) -> tuple[bool, str, str]:
+    """
+    Runs one command and returns (succeeded, stdout, log output). Runs in pool threads and pool processes.
+    """
+    if not output_capture.installed:
+        output_capture.install()
+    with output_capture.capture() as (stdout, stderr):
+        ok = run_command(folder, command, args)
+    return ok, stdout.getvalue(), stderr.getvalue().rstrip("\n")
+
+def split_commands(user_input: str) -> list[str]:
+    """
+    Splits 'parallel cmd1 ; cmd2' into its command lines, leaving quoted semicolons alone.
+    """
+    body = user_input.strip()[len(PARALLEL_COMMAND):]
+    parts, current, quote = [], [], None
+    for char in body:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == ';':
+            parts.append("".join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    parts.append("".join(current).strip())
+    return [part for part in parts if part]
+
+def is_parallel_input(user_input: str) -> bool:
+    return user_input.split(maxsplit=1)[:1] == [PARALLEL_COMMAND]
+
+def run_parallel(
+    user_input: str,
+    commands: dict[str, dict[str, dict[str, str]]],
+    selected_folder: Optional[str] = None,
+    kind: str = PARALLEL_EXECUTOR,
+    workers: int = PARALLEL_WORKERS
+) -> bool:
+    """
+    Runs 'parallel cmd1 ; cmd2 ; ...' on a pool and prints each command's output in the order given.
+    Folders are resolved up front, since a pool worker cannot ask which folder to use.
+    Returns True when every command succeeded.
+    """
+    command_lines = split_commands(user_input)
+    if not command_lines:
+        logger.info(f"Usage: {PARALLEL_COMMAND} command1 [args] ; command2 [args] ; ...")
+        return False
+
+    jobs = []
+    for command_line in command_lines:
+        try:
+            command, args = parse_input(command_line)
+        except ValueError as e:
+            logger.error(f"Cannot parse '{command_line}': {e}")
+            return False
+        folder = resolve_command(commands, command, selected_folder)
+        if folder is None:
+            return False
+        jobs.append((command_line, folder, command, args))
+
+    if kind == 'thread':
+        output_capture.install()
+    try:
+        executor = get_executor(kind, workers)
+        futures = [executor.submit(run_captured, folder, command, args) for _, folder, command, args in jobs]
+
+        all_ok = True
+        for (command_line, _, _, _), future in zip(jobs, futures):
+            try:
+                ok, stdout, log_output = future.result()
+            except Exception as e:
+                ok, stdout, log_output = False, "", f"Command '{command_line}' crashed in the pool: {e}"
+            all_ok = all_ok and ok
+            _print_result(command_line, stdout, log_output)
+    finally:
+        if kind == 'thread':
+            output_capture.uninstall()
+    return all_ok
+
+def _print_result(command_line: str, stdout: str, log_output: str) -> None:
+    if log_output:
+        sys.stderr.write(f"[{command_line}]\n{log_output}\n")
+        sys.stderr.flush()
+    if stdout:
+        sys.stdout.write(stdout)
+        sys.stdout.flush()
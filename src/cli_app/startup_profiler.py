@@ -0,0 +1,94 @@
+import builtins
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+PROFILE_STARTUP_FLAG = "--profile-startup"
+
+class StartupProfiler:
+    """
+    Records how long each module import and each named startup phase takes.
+    Disabled by default; while disabled, phase() is a no-op and imports are untouched.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.started_at = time.perf_counter()
+        self.phases: dict[str, float] = {}
+        self.imports: list[tuple[str, float, float]] = []
+        self._import_stack: list[float] = []
+        self._original_import = None
+        self._original_setup_logger = None
+
+    def enable(self) -> None:
+        if self.enabled:
+            return
+        self.enabled = True
+        self.started_at = time.perf_counter()
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+        self._time_logger_setup()
+
+    def disable(self) -> None:
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+        if self._original_setup_logger is not None:
+            import shared.logger
+            shared.logger.setup_logger = self._original_setup_logger
+            self._original_setup_logger = None
+        self.enabled = False
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level == 0 and name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        self._import_stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._import_stack.pop()
+            if self._import_stack:
+                self._import_stack[-1] += elapsed
+            self.imports.append((name, elapsed, elapsed - children))
+
+    def _time_logger_setup(self) -> None:
+        """
+        Wraps shared.logger.setup_logger so logger and handler setup done at import time shows up as its own phase.
+        Modules bind setup_logger when they are imported, so this has to run before they are.
+        """
+        import shared.logger
+
+        setup_logger = self._original_setup_logger = shared.logger.setup_logger
+
+        def timed_setup_logger(*args, **kwargs):
+            with self.phase("logger setup"):
+                return setup_logger(*args, **kwargs)
+
+        shared.logger.setup_logger = timed_setup_logger
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def report(self, limit: int = 20) -> str:
+        total = time.perf_counter() - self.started_at
+        lines = [f"Startup profile: {total * 1000:.1f} ms total", "Phases (ms):"]
+        for name, elapsed in self.phases.items():
+            lines.append(f"  {name:<24}{elapsed * 1000:>10.2f}")
+
+        lines.append(f"Slowest imports (ms, cumulative / self), {len(self.imports)} imported:")
+        for name, elapsed, self_time in sorted(self.imports, key=lambda item: item[1], reverse=True)[:limit]:
+            lines.append(f"  {name:<40}{elapsed * 1000:>10.2f}{self_time * 1000:>10.2f}")
+        return "\n".join(lines)
+
+startup_profiler = StartupProfiler()
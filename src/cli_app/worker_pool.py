@@ -0,0 +1,215 @@
+import atexit
+import multiprocessing
+import threading
+import time
+from multiprocessing.connection import Connection, wait
+from typing import Optional
+from cli_app.command_registry import command_registry
+from cli_app.config import BACKGROUND_WORKERS, LOGGER_CONFIG
+from shared.logger import setup_logger
+
+logger = setup_logger(__name__, LOGGER_CONFIG)
+
+def _worker_loop(conn: Connection) -> None:
+    """
+    Body of a worker process: runs one job at a time and keeps imported command modules between jobs.
+    """
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        if task is None:
+            return
+
+        job_id, folder, command, args = task
+        try:
+            run = command_registry.get(folder, command)
+            if run is None:
+                run = command_registry.register(folder, command, command_registry.load(folder, command))
+            run(args)
+        except Exception as e:
+            conn.send(('failed', job_id, f"{type(e).__name__}: {e}"))
+        else:
+            conn.send(('done', job_id, None))
+
+class Job:
+    def __init__(self, job_id: int, folder: str, command: str, args: list[str]):
+        self.id = job_id
+        self.folder = folder
+        self.command = command
+        self.args = args
+        self.status = 'queued'
+        self.pid: Optional[int] = None
+        self.error: Optional[str] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def describe(self) -> str:
+        elapsed = ""
+        if self.started_at is not None:
+            elapsed = f" {(self.finished_at or time.monotonic()) - self.started_at:.1f}s"
+        pid = f" pid={self.pid}" if self.pid else ""
+        error = f" ({self.error})" if self.error else ""
+        return f"[{self.id}] {self.status:<9}{self.folder}.{self.command} {self.args}{pid}{elapsed}{error}"
+
+class Worker:
+    def __init__(self, context):
+        self.conn, worker_conn = context.Pipe()
+        self.process = context.Process(target=_worker_loop, args=(worker_conn,), daemon=True)
+        self.process.start()
+        worker_conn.close()
+        self.job: Optional[Job] = None
+
+class WorkerPool:
+    """
+    Bounded set of persistent worker processes for commands marked `background = True`.
+
+    Workers start on the first background job and are reused, so a command's heavy imports happen once per worker.
+    Jobs beyond the pool size wait in a queue. A monitor thread collects results and hands out queued jobs.
+    """
+    def __init__(self, size: int = BACKGROUND_WORKERS):
+        self.size = size
+        self.jobs: dict[int, Job] = {}
+        self._pending: list[Job] = []
+        self._workers: list[Worker] = []
+        self._next_id = 1
+        self._lock = threading.RLock()
+        self._context = multiprocessing.get_context()
+        self._monitor: Optional[threading.Thread] = None
+        self._closed = False
+        atexit.register(self.shutdown)
+
+    def _start(self) -> None:
+        if self._workers:
+            return
+        self._workers = [Worker(self._context) for _ in range(self.size)]
+        self._closed = False
+        self._monitor = threading.Thread(target=self._monitor_loop, name="worker-pool-monitor", daemon=True)
+        self._monitor.start()
+
+    def submit(self, folder: str, command: str, args: list[str]) -> Job:
+        with self._lock:
+            self._start()
+            job = Job(self._next_id, folder, command, args)
+            self._next_id += 1
+            self.jobs[job.id] = job
+            self._pending.append(job)
+            self._dispatch()
+            return job
+
+    def _dispatch(self) -> None:
+        for worker in self._workers:
+            if not self._pending:
+                return
+            if worker.job is None:
+                job = self._pending.pop(0)
+                worker.job = job
+                job.status, job.pid, job.started_at = 'running', worker.process.pid, time.monotonic()
+                worker.conn.send((job.id, job.folder, job.command, job.args))
+
+    def _monitor_loop(self) -> None:
+        while not self._closed:
+            with self._lock:
+                connections = [worker.conn for worker in self._workers]
+            try:
+                ready = wait(connections, timeout=0.2)
+            except OSError:
+                continue
+            for conn in ready:
+                with self._lock:
+                    worker = next((worker for worker in self._workers if worker.conn is conn), None)
+                    if worker is not None:
+                        self._collect(worker)
+
+    def _collect(self, worker: Worker) -> None:
+        try:
+            status, job_id, error = worker.conn.recv()
+        except (EOFError, OSError):
+            self._replace(worker, 'failed', "worker process exited")
+            return
+
+        job = self.jobs[job_id]
+        job.status, job.error, job.finished_at = status, error, time.monotonic()
+        worker.job = None
+        if status == 'failed':
+            logger.error(f"Background job {job.id} ({job.folder}.{job.command}) failed: {error}")
+        self._dispatch()
+
+    def _replace(self, worker: Worker, status: str, error: Optional[str] = None) -> None:
+        if worker.job is not None:
+            worker.job.status, worker.job.error, worker.job.finished_at = status, error, time.monotonic()
+        if worker.process.is_alive():
+            worker.process.terminate()
+        worker.process.join(timeout=1)
+        worker.conn.close()
+        self._workers[self._workers.index(worker)] = Worker(self._context)
+        self._dispatch()
+
+    def kill(self, job_id: int) -> bool:
+        """
+        Stops a job: a queued job is dropped, a running one has its worker terminated and replaced.
+        """
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is None or job.status not in ('queued', 'running'):
+                return False
+            if job.status == 'queued':
+                self._pending.remove(job)
+                job.status = 'killed'
+                return True
+            worker = next(worker for worker in self._workers if worker.job is job)
+            self._replace(worker, 'killed')
+            return True
+
+    def list_jobs(self) -> list[Job]:
+        with self._lock:
+            return list(self.jobs.values())
+
+    def process_count(self) -> int:
+        with self._lock:
+            return sum(1 for worker in self._workers if worker.process.is_alive())
+
+    def shutdown(self, timeout: float = 1.0) -> None:
+        with self._lock:
+            if not self._workers:
+                return
+            self._closed = True
+            for worker in self._workers:
+                try:
+                    worker.conn.send(None)
+                except OSError:
+                    pass
+            for worker in self._workers:
+                worker.process.join(timeout=timeout)
+                if worker.process.is_alive():
+                    worker.process.terminate()
+                worker.conn.close()
+            self._workers = []
+        if self._monitor is not None:
+            self._monitor.join(timeout=timeout)
+            self._monitor = None
+
+worker_pool = WorkerPool()
+
+def show_jobs(pool: WorkerPool = worker_pool) -> None:
+    jobs = pool.list_jobs()
+    # Printed like help and stats, so batch mode, which only logs warnings, shows the list too
+    if not jobs:
+        print("No background jobs.")
+        return
+    print(f"Background jobs ({pool.process_count()}/{pool.size} worker processes):")
+    for job in jobs:
+        print(f"  {job.describe()}")
+
+def kill_job(user_input: str, pool: WorkerPool = worker_pool) -> bool:
+    argument = user_input.split(maxsplit=1)[1:]
+    if not argument or not argument[0].isdigit():
+        logger.info("Usage: kill <job_id>")
+        return False
+    job_id = int(argument[0])
+    if not pool.kill(job_id):
+        logger.info(f"No queued or running job with id {job_id}.")
+        return False
+    logger.info(f"Killed background job {job_id}.")
+    return True
@@ -1,7 +1,8 @@
-from editor.lib.md_to_text_converter import run_app
-import multiprocessing
+# Runs in a reused background worker process instead of blocking the command loop.
+background = True
 
 def run(_ = None):
-    process = multiprocessing.Process(target=run_app)
-    process.daemon = True  # This ensures the process will be killed when the main program exits
-    process.start()
+    # tkinter, markdown and bs4 are only imported once the command actually runs.
+    from editor.lib.md_to_text_converter import run_app
+
+    run_app()
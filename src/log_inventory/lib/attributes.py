@@ -0,0 +1,158 @@
+from bisect import bisect_left, bisect_right
+import re
+from typing import NamedTuple, Optional
+
+# Declared attribute types: key -> unit its values are in ('' for plain counts)
+ATTRIBUTE_UNITS = {
+    'quantity': '',
+    'resistance': 'ohm',
+    'voltage': 'v',
+    'current': 'a',
+    'capacitance': 'f',
+    'frequency': 'hz',
+    'power': 'w',
+}
+
+# Parts with a quantity below this show up in the low-stock report
+LOW_STOCK_THRESHOLD = 5
+
+PREFIXES = {'p': 1e-12, 'n': 1e-9, 'u': 1e-6, 'µ': 1e-6, 'm': 1e-3, '': 1.0, 'k': 1e3, 'K': 1e3, 'M': 1e6, 'G': 1e9}
+UNITS = {'ohm': 'ohm', 'ohms': 'ohm', 'ω': 'ohm', 'r': 'ohm', 'v': 'v', 'a': 'a', 'f': 'f', 'hz': 'hz', 'w': 'w'}
+
+NUMBER = re.compile(r"\s*([-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)\s*([pnuµmkKMG]?)\s*(ohms?|Ω|[rRvVaAfFwW]|[hH][zZ])?\s*")
+# Resistor code notation such as 4k7 (4.7k) or 4R7 (4.7 ohm)
+CODE_NUMBER = re.compile(r"\s*(\d+)([kKMR])(\d+)\s*")
+RANGE_TERM = re.compile(r"(\w+)\s*(<=|>=|<|>)\s*(\S+)|(\w+)=(\S+?)\.\.(\S+)")
+
+class RangeTerm(NamedTuple):
+    key: str
+    low: Optional[float]
+    high: Optional[float]
+    low_inclusive: bool = True
+    high_inclusive: bool = True
+
+def parse_number(text: str) -> Optional[tuple[float, Optional[str]]]:
+    """
+    Parses a value such as '12', '4.7k', '100nF', '3.3V' or '4k7' into (number in base units, unit or None).
+    Returns None for anything else, ranges like '4.5-16V' included.
+    """
+    match = NUMBER.fullmatch(text)
+    if match is not None:
+        number, prefix, unit = match.groups()
+        return float(number) * PREFIXES[prefix], UNITS[unit.lower()] if unit else None
+    match = CODE_NUMBER.fullmatch(text)
+    if match is not None:
+        whole, prefix, fraction = match.groups()
+        number = float(f"{whole}.{fraction}")
+        return (number, 'ohm') if prefix == 'R' else (number * PREFIXES[prefix], None)
+    return None
+
+def typed_value(key: str, value, bound: bool = False) -> Optional[float]:
+    """
+    The numeric value of an attribute, or None when it has none. Declared keys only accept their own unit
+    (or no unit); quantities must be whole numbers unless the value is a query bound. Other keys are
+    inferred from any value that parses.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    parsed = parse_number(str(value))
+    if parsed is None:
+        return None
+    number, unit = parsed
+    declared = ATTRIBUTE_UNITS.get(key.strip().lower())
+    if declared is None:
+        return number
+    if declared == '':
+        return number if unit is None and (bound or number.is_integer()) else None
+    return number if unit in (None, declared) else None
+
+def split_range_terms(query: str) -> tuple[list[RangeTerm], str]:
+    """
+    Takes the range terms (quantity<5, voltage>=3.3, voltage=3.3..5) out of a query and returns them with
+    the rest of the query. Bounds use the same units as values; terms whose bound does not parse stay text.
+    """
+    terms = []
+    rest = []
+    for word in query.split():
+        match = RANGE_TERM.fullmatch(word)
+        term = _range_term(match) if match is not None else None
+        if term is None:
+            rest.append(word)
+        else:
+            terms.append(term)
+    return terms, " ".join(rest)
+
+def _range_term(match: re.Match) -> Optional[RangeTerm]:
+    if match.group(1) is not None:
+        key, operator, bound = match.group(1, 2, 3)
+        number = typed_value(key, bound, bound=True)
+        if number is None:
+            return None
+        if operator[0] == '<':
+            return RangeTerm(key.lower(), None, number, high_inclusive=operator == '<=')
+        return RangeTerm(key.lower(), number, None, low_inclusive=operator == '>=')
+    key, low, high = match.group(4, 5, 6)
+    low_number, high_number = typed_value(key, low, bound=True), typed_value(key, high, bound=True)
+    if low_number is None or high_number is None:
+        return None
+    return RangeTerm(key.lower(), low_number, high_number)
+
+class AttributeIndex:
+    """
+    Sorted (value, part name) column per attribute key with a numeric value, for range queries in
+    O(log n + k). Updated one part at a time.
+    """
+    def __init__(self):
+        self._columns: dict[str, list[tuple[float, str]]] = {}
+        # The values of each column alone, in the same order, so bounds are bisected without bisect's key=
+        self._values: dict[str, list[float]] = {}
+        self._entries: dict[str, list[tuple[str, float]]] = {}
+
+    def add(self, part_name: str, details: dict) -> None:
+        self.remove(part_name)
+        entries = []
+        for key, value in details.items():
+            number = typed_value(str(key), value)
+            if number is not None:
+                entries.append((str(key).strip().lower(), number))
+        entries = list(dict.fromkeys(entries))
+        for key, number in entries:
+            column = self._columns.setdefault(key, [])
+            position = bisect_left(column, (number, part_name))
+            column.insert(position, (number, part_name))
+            self._values.setdefault(key, []).insert(position, number)
+        if entries:
+            self._entries[part_name] = entries
+
+    def remove(self, part_name: str) -> None:
+        for key, number in self._entries.pop(part_name, ()):
+            column = self._columns[key]
+            position = bisect_left(column, (number, part_name))
+            del column[position]
+            del self._values[key][position]
+            if not column:
+                del self._columns[key]
+                del self._values[key]
+
+    def range(self, term: RangeTerm) -> list[tuple[str, float]]:
+        """
+        Returns (part name, value) for the parts whose value for the key lies within the term's bounds,
+        in ascending value order.
+        """
+        column = self._columns.get(term.key, [])
+        values = self._values.get(term.key, [])
+        if term.low is None:
+            start = 0
+        elif term.low_inclusive:
+            start = bisect_left(values, term.low)
+        else:
+            start = bisect_right(values, term.low)
+        if term.high is None:
+            end = len(column)
+        elif term.high_inclusive:
+            end = bisect_right(values, term.high)
+        else:
+            end = bisect_left(values, term.high)
+        return [(part_name, value) for value, part_name in column[start:end]]
@@ -0,0 +1,227 @@
+from abc import abstractmethod
+from collections.abc import MutableMapping
+import csv
+from itertools import islice
+import json
+import os
+import re
+from typing import IO, Iterable, Iterator
+from log_inventory.lib.attributes import LOW_STOCK_THRESHOLD, RangeTerm, split_range_terms
+
+# Parts written per transaction by bulk upserts and imports
+BATCH_SIZE = 1000
+
+# File extensions opened with the SQLite backend
+SQLITE_EXTENSIONS = ('.db', '.sqlite', '.sqlite3')
+
+WHITESPACE = re.compile(r"\s*")
+
+class InventoryBackend(MutableMapping):
+    """
+    Storage for the inventory: a mapping of part name to a details dict, plus bulk operations.
+    Backends implement the mapping methods and close(); the bulk methods below work on any of them and
+    are overridden where the backend can batch better.
+    """
+    def upsert_many(self, parts: Iterable[tuple[str, dict]], batch_size: int = BATCH_SIZE) -> int:
+        """
+        Adds or replaces the parts and returns how many were written. The input is consumed batch by batch.
+        """
+        count = 0
+        for part_name, details in parts:
+            self[part_name] = details
+            count += 1
+        return count
+
+    def delete_many(self, part_names: Iterable[str], batch_size: int = BATCH_SIZE) -> int:
+        """
+        Removes the parts that exist and returns how many were removed. Missing names are ignored.
+        """
+        count = 0
+        for part_name in part_names:
+            if self.pop(part_name, None) is not None:
+                count += 1
+        return count
+
+    def pages(self, page_size: int) -> Iterator[list[tuple[str, dict]]]:
+        """
+        Yields the parts as lists of (name, details) of at most page_size, reading one page at a time.
+        """
+        return iter_pages(self, page_size)
+
+    def import_file(self, path: str, batch_size: int = BATCH_SIZE) -> int:
+        """
+        Streams parts from a CSV or JSON file into the inventory and returns how many were imported.
+        """
+        with open(path, 'r', encoding='utf-8', newline='') as file:
+            if path.lower().endswith('.csv'):
+                return self.upsert_many(iter_csv_parts(file), batch_size)
+            return self.upsert_many(iter_json_parts(file), batch_size)
+
+    def export_json(self, path: str, page_size: int = BATCH_SIZE) -> int:
+        """
+        Writes the inventory as a JSON object of part name to details, one part per line, through a
+        temporary file renamed over path. Returns how many parts were written.
+        """
+        temp_path = f"{path}.tmp"
+        count = 0
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            file.write("{")
+            for page in self.pages(page_size):
+                for part_name, details in page:
+                    file.write(f"{',' if count else ''}\n  {json.dumps(part_name)}: {json.dumps(details)}")
+                    count += 1
+            file.write("\n}\n")
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+        return count
+
+    @abstractmethod
+    def search(self, query: str) -> list[str]:
+        """
+        Returns the names of the parts matching the text query; see SearchIndex for the syntax.
+        """
+
+    @abstractmethod
+    def range_query(self, term: RangeTerm) -> list[tuple[str, float]]:
+        """
+        Returns (part name, value) for the parts whose typed value for term.key lies within its bounds,
+        in ascending value order.
+        """
+
+    def low_stock(self, threshold: float = LOW_STOCK_THRESHOLD) -> list[tuple[str, float]]:
+        """
+        Returns (part name, quantity) for the parts with a quantity below the threshold, lowest first.
+        """
+        return self.range_query(RangeTerm('quantity', None, threshold, high_inclusive=False))
+
+    def find(self, query: str) -> list[str]:
+        """
+        Runs a search query that may also hold range terms such as quantity<5 or voltage=3.3..5;
+        returns the sorted names of the parts matching all of them.
+        """
+        terms, text = split_range_terms(query)
+        found = set(self.search(text)) if text.strip() or not terms else None
+        for term in terms:
+            matched = {part_name for part_name, _ in self.range_query(term)}
+            found = matched if found is None else found & matched
+        return sorted(found)
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> 'InventoryBackend':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+def open_inventory(path: str) -> InventoryBackend:
+    """
+    Opens the SQLite backend for .db/.sqlite files and the JSON snapshot and change log store otherwise.
+    """
+    if path.lower().endswith(SQLITE_EXTENSIONS):
+        from log_inventory.lib.sqlite_inventory import SqliteInventory
+        return SqliteInventory(path)
+    from log_inventory.lib.inventory_store import InventoryStore
+    return InventoryStore(path)
+
+def iter_pages(inventory, page_size: int) -> Iterator[list[tuple[str, dict]]]:
+    page = []
+    for part_name in inventory:
+        page.append((part_name, inventory[part_name]))
+        if len(page) == page_size:
+            yield page
+            page = []
+    if page:
+        yield page
+
+def batches(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+def iter_csv_parts(file: IO[str]) -> Iterator[tuple[str, dict]]:
+    """
+    Reads parts from CSV with a header row. The part name comes from a 'part' or 'name' column, or else the
+    first column; the other non-empty columns become the part's details.
+    """
+    reader = csv.DictReader(file)
+    if not reader.fieldnames:
+        return
+    lowered = {field.strip().lower(): field for field in reader.fieldnames}
+    name_field = lowered.get('part') or lowered.get('name') or reader.fieldnames[0]
+    for row in reader:
+        part_name = (row.get(name_field) or "").strip()
+        if not part_name:
+            continue
+        details = {
+            key.strip(): value.strip()
+            for key, value in row.items()
+            if key is not None and key != name_field and value is not None and value.strip()
+        }
+        yield part_name, details
+
+def iter_json_parts(file: IO[str], chunk_size: int = 65536) -> Iterator[tuple[str, dict]]:
+    """
+    Reads the members of a top-level JSON object (the export format) one at a time, holding at most one
+    part plus a read chunk in memory instead of the whole document.
+    """
+    decoder = json.JSONDecoder()
+    buffer, position, at_end = "", 0, False
+
+    def fill() -> None:
+        nonlocal buffer, position, at_end
+        chunk = file.read(chunk_size)
+        buffer, position, at_end = buffer[position:] + chunk, 0, not chunk
+
+    def skip_whitespace() -> None:
+        nonlocal position
+        while True:
+            position = WHITESPACE.match(buffer, position).end()
+            if position < len(buffer) or at_end:
+                return
+            fill()
+
+    def expect(characters: str) -> str:
+        nonlocal position
+        skip_whitespace()
+        if position >= len(buffer) or buffer[position] not in characters:
+            found = repr(buffer[position]) if position < len(buffer) else "end of file"
+            raise ValueError(f"Expected one of {characters!r} in inventory JSON, found {found}.")
+        position += 1
+        return buffer[position - 1]
+
+    def read_value():
+        nonlocal position
+        skip_whitespace()
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if at_end:
+                    raise
+                fill()
+                continue
+            if end == len(buffer) and not at_end:
+                # A number could continue in the next chunk
+                fill()
+                continue
+            position = end
+            return value
+
+    expect("{")
+    skip_whitespace()
+    if buffer[position:position + 1] == "}":
+        return
+    while True:
+        part_name = read_value()
+        if not isinstance(part_name, str):
+            raise ValueError("Part names in inventory JSON must be strings.")
+        expect(":")
+        details = read_value()
+        if not isinstance(details, dict):
+            raise ValueError(f"Details of part '{part_name}' must be a JSON object.")
+        yield part_name, details
+        if expect(",}") == "}":
+            return
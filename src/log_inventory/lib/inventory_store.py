@@ -0,0 +1,205 @@
+import json
+import logging
+import os
+import threading
+from typing import Iterable, Iterator, Optional
+from log_inventory.lib.attributes import AttributeIndex, RangeTerm
+from log_inventory.lib.inventory_backend import BATCH_SIZE, InventoryBackend, batches
+from log_inventory.lib.search_index import SearchIndex
+from shared.jsonl_log import replay_jsonl
+
+logger = logging.getLogger(__name__)
+
+# Change log size, in bytes, past which it is folded into the snapshot
+COMPACT_THRESHOLD = 1024 * 1024
+
+class InventoryStore(InventoryBackend):
+    """
+    Inventory of parts (name -> details dict) kept as a JSON snapshot plus an append-only change log.
+
+    Setting or deleting a part appends one line to "<snapshot>.log", so an edit costs O(1) whatever the
+    inventory size. Loading reads the snapshot and replays the log. Once the log passes compact_threshold
+    bytes it is renamed to "<snapshot>.log.compacting" and a background thread writes a new snapshot
+    (temp file, fsync, rename) before removing it; a crash at any point leaves a state that replays correctly.
+    """
+    def __init__(self, path: str, compact_threshold: int = COMPACT_THRESHOLD, sync: bool = True):
+        self.path = path
+        self.log_path = f"{path}.log"
+        self.compacting_path = f"{path}.log.compacting"
+        self.compact_threshold = compact_threshold
+        self.sync = sync
+        self._parts: dict[str, dict] = {}
+        self._lock = threading.RLock()
+        self._compaction: Optional[threading.Thread] = None
+        self.search_index = SearchIndex()
+        self.attribute_index = AttributeIndex()
+        self._load()
+        for part_name, details in self._parts.items():
+            self._index(part_name, details)
+        self._log = open(self.log_path, 'a', encoding='utf-8')
+        self._log_size = self._log.tell()
+
+    def _load(self) -> None:
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        if os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8') as file:
+                self._parts = json.load(file)
+        for log_path in (self.compacting_path, self.log_path):
+            if os.path.exists(log_path):
+                self._replay(log_path)
+        if os.path.exists(self.compacting_path):
+            # A compaction was cut short; finish it before the next one reuses the file name
+            write_snapshot(self.path, self._parts)
+            os.remove(self.compacting_path)
+
+    def _replay(self, log_path: str) -> None:
+        replay_jsonl(log_path, self._apply)
+
+    def _apply(self, entry: dict) -> None:
+        if entry.get('deleted'):
+            self._parts.pop(entry['part'], None)
+        else:
+            self._parts[entry['part']] = entry['details']
+
+    def _append(self, *entries: dict) -> None:
+        lines = "".join(json.dumps(entry) + "\n" for entry in entries)
+        self._log.write(lines)
+        self._log.flush()
+        if self.sync:
+            os.fsync(self._log.fileno())
+        self._log_size += len(lines.encode('utf-8'))
+
+    def _compact_if_due(self) -> None:
+        # Called once the appended entries are applied, so a compaction started now snapshots them
+        if self._log_size >= self.compact_threshold:
+            self.compact(wait=False)
+
+    def _index(self, part_name: str, details: dict) -> None:
+        self.search_index.add(part_name, details)
+        self.attribute_index.add(part_name, details)
+
+    def _unindex(self, part_name: str) -> None:
+        self.search_index.remove(part_name)
+        self.attribute_index.remove(part_name)
+
+    def __getitem__(self, part_name: str) -> dict:
+        return self._parts[part_name]
+
+    def __setitem__(self, part_name: str, details: dict) -> None:
+        with self._lock:
+            self._append({'part': part_name, 'details': details})
+            self._parts[part_name] = details
+            self._index(part_name, details)
+            self._compact_if_due()
+
+    def __delitem__(self, part_name: str) -> None:
+        with self._lock:
+            if part_name not in self._parts:
+                raise KeyError(part_name)
+            self._append({'part': part_name, 'deleted': True})
+            del self._parts[part_name]
+            self._unindex(part_name)
+            self._compact_if_due()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._parts)
+
+    def __len__(self) -> int:
+        return len(self._parts)
+
+    def upsert_many(self, parts: Iterable[tuple[str, dict]], batch_size: int = BATCH_SIZE) -> int:
+        """
+        Appends each batch to the change log with a single write and fsync.
+        """
+        count = 0
+        for batch in batches(parts, batch_size):
+            with self._lock:
+                self._append(*({'part': part_name, 'details': details} for part_name, details in batch))
+                for part_name, details in batch:
+                    self._parts[part_name] = details
+                    self._index(part_name, details)
+                self._compact_if_due()
+            count += len(batch)
+        return count
+
+    def delete_many(self, part_names: Iterable[str], batch_size: int = BATCH_SIZE) -> int:
+        """
+        Appends the deletes of each batch to the change log with a single write and fsync.
+        """
+        count = 0
+        for batch in batches(part_names, batch_size):
+            with self._lock:
+                batch = [part_name for part_name in dict.fromkeys(batch) if part_name in self._parts]
+                if not batch:
+                    continue
+                self._append(*({'part': part_name, 'deleted': True} for part_name in batch))
+                for part_name in batch:
+                    del self._parts[part_name]
+                    self._unindex(part_name)
+                self._compact_if_due()
+            count += len(batch)
+        return count
+
+    def search(self, query: str) -> list[str]:
+        return self.search_index.search(query)
+
+    def range_query(self, term: RangeTerm) -> list[tuple[str, float]]:
+        return self.attribute_index.range(term)
+
+    def compact(self, wait: bool = True) -> None:
+        """
+        Folds the change log into a new snapshot. Without wait the snapshot is written on a background thread;
+        a compaction already running is not started twice.
+        """
+        with self._lock:
+            running = self._compaction is not None and self._compaction.is_alive()
+            if not running and os.path.exists(self.compacting_path):
+                # An earlier snapshot failed and the rotated entries are only on disk in that file; write the
+                # whole state now rather than rotating over them
+                self._compact_now()
+            elif not running:
+                # Rotate the log and copy the state together, so the snapshot holds exactly the rotated entries
+                self._log.close()
+                os.replace(self.log_path, self.compacting_path)
+                self._log = open(self.log_path, 'a', encoding='utf-8')
+                self._log_size = 0
+                parts = {part_name: dict(details) for part_name, details in self._parts.items()}
+                self._compaction = threading.Thread(
+                    target=self._write_snapshot, args=(parts,), name="inventory-compaction", daemon=True
+                )
+                self._compaction.start()
+        if wait and self._compaction is not None:
+            self._compaction.join()
+
+    def _compact_now(self) -> None:
+        try:
+            write_snapshot(self.path, self._parts)
+            os.remove(self.compacting_path)
+            self._log.truncate(0)
+            self._log_size = 0
+        except OSError as e:
+            logger.error(f"Could not compact {self.log_path} into {self.path}: {e}")
+
+    def _write_snapshot(self, parts: dict[str, dict]) -> None:
+        try:
+            write_snapshot(self.path, parts)
+            os.remove(self.compacting_path)
+        except OSError as e:
+            logger.error(f"Could not compact {self.log_path} into {self.path}: {e}")
+
+    def close(self) -> None:
+        if self._compaction is not None:
+            self._compaction.join()
+        self._log.close()
+
+def write_snapshot(path: str, parts: dict[str, dict]) -> None:
+    """
+    Writes the inventory to a temporary file, fsyncs it and renames it over path.
+    """
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as file:
+        json.dump(parts, file, indent=2)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
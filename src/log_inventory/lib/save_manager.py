@@ -0,0 +1,114 @@
+import threading
+from typing import Iterable, Iterator, Optional
+from log_inventory.lib.attributes import RangeTerm
+from log_inventory.lib.inventory_backend import BATCH_SIZE, InventoryBackend
+
+# Seconds without edits after which pending edits are written
+SAVE_DELAY = 2.0
+
+class SaveManager(InventoryBackend):
+    """
+    Wraps a backend and holds edits in memory until no edit came in for `delay` seconds, then writes
+    them as one batch: a single append and fsync for the JSON store, a single transaction for SQLite.
+    Reads see pending edits; anything that reads many parts flushes first. close() flushes as well.
+    Edits stay pending until the backend has written them, so a failed write is retried by the next flush.
+    """
+    def __init__(self, backend: InventoryBackend, delay: float = SAVE_DELAY):
+        self.backend = backend
+        self.delay = delay
+        self._pending: dict[str, Optional[dict]] = {}
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+
+    def _schedule(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(self.delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self) -> int:
+        """
+        Writes the pending edits now and returns how many parts they touched.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            pending = self._pending
+            if not pending:
+                return 0
+            self.backend.upsert_many(
+                ((part_name, details) for part_name, details in pending.items() if details is not None),
+                len(pending),
+            )
+            self.backend.delete_many(
+                (part_name for part_name, details in pending.items() if details is None), len(pending)
+            )
+            self._pending = {}
+            return len(pending)
+
+    def __getitem__(self, part_name: str) -> dict:
+        with self._lock:
+            if part_name in self._pending:
+                details = self._pending[part_name]
+                if details is None:
+                    raise KeyError(part_name)
+                return details
+            return self.backend[part_name]
+
+    def __setitem__(self, part_name: str, details: dict) -> None:
+        with self._lock:
+            self._pending[part_name] = details
+            self._schedule()
+
+    def __delitem__(self, part_name: str) -> None:
+        with self._lock:
+            if part_name not in self:
+                raise KeyError(part_name)
+            self._pending[part_name] = None
+            self._schedule()
+
+    def __contains__(self, part_name: object) -> bool:
+        with self._lock:
+            if part_name in self._pending:
+                return self._pending[part_name] is not None
+            return part_name in self.backend
+
+    def __iter__(self) -> Iterator[str]:
+        self.flush()
+        return iter(self.backend)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self.flush()
+            return len(self.backend)
+
+    def upsert_many(self, parts: Iterable[tuple[str, dict]], batch_size: int = BATCH_SIZE) -> int:
+        with self._lock:
+            self.flush()
+            return self.backend.upsert_many(parts, batch_size)
+
+    def delete_many(self, part_names: Iterable[str], batch_size: int = BATCH_SIZE) -> int:
+        with self._lock:
+            self.flush()
+            return self.backend.delete_many(part_names, batch_size)
+
+    def pages(self, page_size: int) -> Iterator[list[tuple[str, dict]]]:
+        self.flush()
+        return self.backend.pages(page_size)
+
+    def search(self, query: str) -> list[str]:
+        with self._lock:
+            self.flush()
+            return self.backend.search(query)
+
+    def range_query(self, term: RangeTerm) -> list[tuple[str, float]]:
+        with self._lock:
+            self.flush()
+            return self.backend.range_query(term)
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush()
+            self.backend.close()
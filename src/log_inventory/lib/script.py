@@ -1,9 +1,17 @@
+import argparse
 import json
 import os
+from log_inventory.lib.attributes import LOW_STOCK_THRESHOLD
+from log_inventory.lib.inventory_backend import InventoryBackend, iter_pages, open_inventory
+from log_inventory.lib.inventory_store import write_snapshot
+from log_inventory.lib.save_manager import SaveManager
 
 # Path for the JSON inventory file
 INVENTORY_FILE = 'arduino_inventory.json'
 
+# Parts shown per page by view_inventory
+VIEW_PAGE_SIZE = 20
+
 def load_inventory():
     """Load existing inventory from JSON file."""
     if os.path.exists(INVENTORY_FILE):
@@ -12,16 +20,15 @@ def load_inventory():
     return {}
 
 def save_inventory(inventory):
-    """Save inventory to JSON file."""
-    with open(INVENTORY_FILE, 'w') as file:
-        json.dump(inventory, file, indent=2)
+    """Save inventory to JSON file through a temporary file and an atomic rename."""
+    write_snapshot(INVENTORY_FILE, inventory)
 
 def add_part(inventory):
     """Add a new part to the inventory."""
     part_name = input("Enter the part name: ").strip()
     if not part_name:
         print("Part name cannot be empty.")
-        return
+        return inventory
 
     # Initialize or update part details
     part_details = inventory.get(part_name, {})
@@ -38,32 +45,89 @@ def add_part(inventory):
     print(f"Part '{part_name}' has been added/updated.")
     return inventory
 
-def view_inventory(inventory):
-    """Display current inventory."""
+def view_inventory(inventory, page_size=VIEW_PAGE_SIZE):
+    """Display current inventory, one page at a time."""
     if not inventory:
         print("Inventory is empty.")
-    else:
-        print("\nCurrent Inventory:")
-        for part_name, details in inventory.items():
+        return
+    print("\nCurrent Inventory:")
+    pages = inventory.pages(page_size) if isinstance(inventory, InventoryBackend) else iter_pages(inventory, page_size)
+    page = next(pages, None)
+    while page is not None:
+        for part_name, details in page:
             print(f"\n{part_name}:")
             for key, value in details.items():
                 print(f"  {key}: {value}")
+        page = next(pages, None)
+        if page is not None and input("\nPress Enter for more, q to stop: ").strip().lower() == 'q':
+            break
+
+def search_inventory(inventory):
+    """Display the parts matching a search query."""
+    query = input("Search (words, key=<key>, value=<value>, * for prefix, quantity<5, voltage=3.3..5): ").strip()
+    part_names = inventory.find(query)
+    if not part_names:
+        print("No matching parts.")
+        return
+    print(f"\n{len(part_names)} matching part(s):")
+    for part_name in part_names:
+        print(f"\n{part_name}:")
+        for key, value in inventory[part_name].items():
+            print(f"  {key}: {value}")
+
+def low_stock_report(inventory, threshold=LOW_STOCK_THRESHOLD):
+    """Display the parts with a quantity below the threshold, lowest first."""
+    parts = inventory.low_stock(threshold)
+    if not parts:
+        print(f"No parts with a quantity below {threshold:g}.")
+        return
+    print(f"\nLow stock (quantity below {threshold:g}):")
+    for part_name, quantity in parts:
+        print(f"  {part_name}: {quantity:g}")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Arduino inventory manager")
+    parser.add_argument("--file", default=INVENTORY_FILE, help="Inventory file; .db or .sqlite uses the SQLite backend")
+    parser.add_argument("--import", dest="import_path", help="Import parts from a CSV or JSON file and exit")
+    parser.add_argument("--export", dest="export_path", help="Export the inventory as JSON and exit")
+    parser.add_argument("--low-stock", type=float, nargs="?", const=LOW_STOCK_THRESHOLD, help="Show parts with a quantity below this (default %(const)s) and exit")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.import_path or args.export_path or args.low_stock is not None:
+        with open_inventory(args.file) as inventory:
+            if args.import_path:
+                print(f"Imported {inventory.import_file(args.import_path)} part(s) from {args.import_path}.")
+            if args.export_path:
+                print(f"Exported {inventory.export_json(args.export_path)} part(s) to {args.export_path}.")
+            if args.low_stock is not None:
+                low_stock_report(inventory, args.low_stock)
+        return
+
+    # Consecutive edits are written together once the session has been idle for a moment, and on exit
+    with SaveManager(open_inventory(args.file)) as inventory:
+        run_menu(inventory)
 
-def main():
-    inventory = load_inventory()
+def run_menu(inventory):
     while True:
         print("\nArduino Inventory Manager")
         print("1. Add/Update Part")
         print("2. View Inventory")
-        print("3. Exit")
+        print("3. Search Inventory")
+        print("4. Low Stock Report")
+        print("5. Exit")
         choice = input("Select an option: ").strip()
 
         if choice == '1':
             inventory = add_part(inventory)
-            save_inventory(inventory)
         elif choice == '2':
             view_inventory(inventory)
         elif choice == '3':
+            search_inventory(inventory)
+        elif choice == '4':
+            low_stock_report(inventory)
+        elif choice == '5':
             print("Exiting...")
             break
         else:
@@ -0,0 +1,127 @@
+from bisect import bisect_left, insort
+import re
+import shlex
+from typing import Optional
+
+TOKEN = re.compile(r"\w+(?:\.\w+)*")
+
+def tokenize(text: str) -> list[str]:
+    """Lower-cased words of the text; dotted numbers such as 3.3v stay one token."""
+    return TOKEN.findall(text.lower())
+
+class _Postings:
+    """Token -> part names, with the tokens also kept sorted so prefix patterns are a range lookup."""
+    def __init__(self):
+        self.parts: dict[str, set[str]] = {}
+        self.tokens: list[str] = []
+
+    def add(self, token: str, part_name: str) -> None:
+        parts = self.parts.get(token)
+        if parts is None:
+            parts = self.parts[token] = set()
+            insort(self.tokens, token)
+        parts.add(part_name)
+
+    def remove(self, token: str, part_name: str) -> None:
+        parts = self.parts[token]
+        parts.discard(part_name)
+        if not parts:
+            del self.parts[token]
+            del self.tokens[bisect_left(self.tokens, token)]
+
+    def match(self, pattern: str) -> set[str]:
+        """Parts for the token, or for every token starting with it when the pattern ends in '*'."""
+        if not pattern.endswith("*"):
+            return self.parts.get(pattern, set())
+        prefix = pattern[:-1]
+        found: set[str] = set()
+        for index in range(bisect_left(self.tokens, prefix), len(self.tokens)):
+            token = self.tokens[index]
+            if not token.startswith(prefix):
+                break
+            found |= self.parts[token]
+        return found
+
+class SearchIndex:
+    """
+    Inverted index over inventory parts, updated one part at a time.
+
+    Plain terms match tokens of part names, attribute keys and values; key=K matches parts with that key,
+    value=V matches attribute values, and key=K value=V matches values of that key only. A trailing '*'
+    makes a term a prefix. All terms of a query must match.
+    """
+    def __init__(self):
+        self._terms = _Postings()
+        self._keys = _Postings()
+        self._values = _Postings()
+        self._key_values = _Postings()
+        self._entries: dict[str, list[tuple[_Postings, str]]] = {}
+
+    def add(self, part_name: str, details: dict) -> None:
+        """Indexes the part, replacing what was indexed for it before."""
+        self.remove(part_name)
+        entries = [(self._terms, token) for token in tokenize(part_name)]
+        for key, value in details.items():
+            key_name = str(key).strip().lower()
+            value_tokens = tokenize(str(value))
+            entries.append((self._keys, key_name))
+            entries.extend((self._terms, token) for token in tokenize(key_name) + value_tokens)
+            entries.extend((self._values, token) for token in value_tokens)
+            entries.extend((self._key_values, f"{key_name}={token}") for token in value_tokens)
+
+        entries = list(dict.fromkeys(entries))
+        for postings, token in entries:
+            postings.add(token, part_name)
+        self._entries[part_name] = entries
+
+    def remove(self, part_name: str) -> None:
+        for postings, token in self._entries.pop(part_name, ()):
+            postings.remove(token, part_name)
+
+    def search(self, query: str) -> list[str]:
+        """
+        Returns the names of the parts matching every term of the query, sorted. An empty query matches nothing.
+        """
+        try:
+            words = shlex.split(query)
+        except ValueError:
+            words = query.split()
+
+        key: Optional[str] = None
+        value: Optional[str] = None
+        groups: list[set[str]] = []
+        for word in words:
+            if word.lower().startswith("key="):
+                key = word[4:].strip().lower()
+            elif word.lower().startswith("value="):
+                value = word[6:]
+            else:
+                groups.extend(self._match_text(self._terms, word))
+
+        if key is not None and value is not None:
+            groups.extend(self._match_text(self._key_values, value, prefix=f"{key}="))
+        elif key is not None:
+            groups.append(self._keys.match(key))
+        elif value is not None:
+            groups.extend(self._match_text(self._values, value))
+
+        if not groups:
+            return []
+        groups.sort(key=len)
+        found = set(groups[0])
+        for group in groups[1:]:
+            found &= group
+            if not found:
+                break
+        return sorted(found)
+
+    def _match_text(self, postings: _Postings, text: str, prefix: str = "") -> list[set[str]]:
+        tokens = tokenize(text)
+        if not tokens:
+            return [set()]
+        if text.endswith("*"):
+            tokens[-1] += "*"
+        return [postings.match(prefix + token) for token in tokens]
+
+    def __len__(self) -> int:
+        return len(self._entries)
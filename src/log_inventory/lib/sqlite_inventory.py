@@ -0,0 +1,164 @@
+import json
+import os
+import sqlite3
+from typing import Iterable, Iterator, Optional
+from log_inventory.lib.attributes import RangeTerm, typed_value
+from log_inventory.lib.inventory_backend import BATCH_SIZE, InventoryBackend, batches
+from log_inventory.lib.search_index import SearchIndex
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS parts (
+    name TEXT PRIMARY KEY,
+    details TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+# Typed attribute values, one row per part and numeric attribute, indexed for range queries
+ATTRIBUTES_SCHEMA = """
+CREATE TABLE attributes (
+    key TEXT NOT NULL,
+    value REAL NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (key, value, name)
+) WITHOUT ROWID;
+CREATE INDEX attributes_by_name ON attributes (name);
+"""
+
+UPSERT = "INSERT INTO parts (name, details) VALUES (?, ?) ON CONFLICT (name) DO UPDATE SET details = excluded.details"
+
+class SqliteInventory(InventoryBackend):
+    """
+    Inventory in a local SQLite database, one row per part with its details as JSON.
+    Only the rows asked for are read; bulk upserts run one transaction per batch.
+    The search index is built on the first search and kept current afterwards.
+    """
+    def __init__(self, path: str):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        # Callers such as SaveManager may write from a timer thread; they serialize access themselves
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        with self._connection:
+            self._connection.execute(SCHEMA)
+            if not self._connection.execute("SELECT 1 FROM sqlite_master WHERE name = 'attributes'").fetchone():
+                self._create_attributes()
+        self._search_index: Optional[SearchIndex] = None
+
+    def _create_attributes(self) -> None:
+        # executescript would commit the open transaction, so run the statements one by one
+        for statement in ATTRIBUTES_SCHEMA.split(";"):
+            if statement.strip():
+                self._connection.execute(statement)
+        for (part_name, details) in self._connection.execute("SELECT name, details FROM parts").fetchall():
+            self._write_attributes(part_name, json.loads(details))
+
+    def _write_attributes(self, part_name: str, details: dict) -> None:
+        self._connection.execute("DELETE FROM attributes WHERE name = ?", (part_name,))
+        rows = {
+            (str(key).strip().lower(), number, part_name)
+            for key, value in details.items()
+            if (number := typed_value(str(key), value)) is not None
+        }
+        self._connection.executemany("INSERT INTO attributes (key, value, name) VALUES (?, ?, ?)", rows)
+
+    def __getitem__(self, part_name: str) -> dict:
+        row = self._connection.execute("SELECT details FROM parts WHERE name = ?", (part_name,)).fetchone()
+        if row is None:
+            raise KeyError(part_name)
+        return json.loads(row[0])
+
+    def __setitem__(self, part_name: str, details: dict) -> None:
+        with self._connection:
+            self._connection.execute(UPSERT, (part_name, json.dumps(details)))
+            self._write_attributes(part_name, details)
+        if self._search_index is not None:
+            self._search_index.add(part_name, details)
+
+    def __delitem__(self, part_name: str) -> None:
+        with self._connection:
+            cursor = self._connection.execute("DELETE FROM parts WHERE name = ?", (part_name,))
+            self._connection.execute("DELETE FROM attributes WHERE name = ?", (part_name,))
+        if cursor.rowcount == 0:
+            raise KeyError(part_name)
+        if self._search_index is not None:
+            self._search_index.remove(part_name)
+
+    def __iter__(self) -> Iterator[str]:
+        for (part_name,) in self._connection.execute("SELECT name FROM parts ORDER BY name"):
+            yield part_name
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM parts").fetchone()[0]
+
+    def __contains__(self, part_name: object) -> bool:
+        return self._connection.execute("SELECT 1 FROM parts WHERE name = ?", (part_name,)).fetchone() is not None
+
+    def upsert_many(self, parts: Iterable[tuple[str, dict]], batch_size: int = BATCH_SIZE) -> int:
+        count = 0
+        for batch in batches(parts, batch_size):
+            with self._connection:
+                self._connection.executemany(UPSERT, ((part_name, json.dumps(details)) for part_name, details in batch))
+                for part_name, details in batch:
+                    self._write_attributes(part_name, details)
+            if self._search_index is not None:
+                for part_name, details in batch:
+                    self._search_index.add(part_name, details)
+            count += len(batch)
+        return count
+
+    def delete_many(self, part_names: Iterable[str], batch_size: int = BATCH_SIZE) -> int:
+        count = 0
+        for batch in batches(part_names, batch_size):
+            rows = [(part_name,) for part_name in batch]
+            with self._connection:
+                count += self._connection.executemany("DELETE FROM parts WHERE name = ?", rows).rowcount
+                self._connection.executemany("DELETE FROM attributes WHERE name = ?", rows)
+            if self._search_index is not None:
+                for (part_name,) in rows:
+                    self._search_index.remove(part_name)
+        return count
+
+    def pages(self, page_size: int) -> Iterator[list[tuple[str, dict]]]:
+        """
+        Pages in name order by keyset: each page starts after the last name of the previous one.
+        """
+        last = None
+        while True:
+            if last is None:
+                rows = self._connection.execute(
+                    "SELECT name, details FROM parts ORDER BY name LIMIT ?", (page_size,)
+                ).fetchall()
+            else:
+                rows = self._connection.execute(
+                    "SELECT name, details FROM parts WHERE name > ? ORDER BY name LIMIT ?", (last, page_size)
+                ).fetchall()
+            if not rows:
+                return
+            yield [(part_name, json.loads(details)) for part_name, details in rows]
+            last = rows[-1][0]
+
+    def search(self, query: str) -> list[str]:
+        if self._search_index is None:
+            self._search_index = SearchIndex()
+            for page in self.pages(BATCH_SIZE):
+                for part_name, details in page:
+                    self._search_index.add(part_name, details)
+        return self._search_index.search(query)
+
+    def range_query(self, term: RangeTerm) -> list[tuple[str, float]]:
+        conditions, parameters = ["key = ?"], [term.key]
+        if term.low is not None:
+            conditions.append("value >= ?" if term.low_inclusive else "value > ?")
+            parameters.append(term.low)
+        if term.high is not None:
+            conditions.append("value <= ?" if term.high_inclusive else "value < ?")
+            parameters.append(term.high)
+        rows = self._connection.execute(
+            f"SELECT name, value FROM attributes WHERE {' AND '.join(conditions)} ORDER BY value, name", parameters
+        )
+        return rows.fetchall()
+
+    def close(self) -> None:
+        self._connection.close()
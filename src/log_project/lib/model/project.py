@@ -1,6 +1,9 @@
 from datetime import date
+from functools import lru_cache
+from itertools import compress
 import logging
-from typing import Optional
+import sys
+from typing import Callable, Iterable, Optional, Union
 from urllib.parse import urlparse, ParseResult
 from log_project.lib.model.status import Status
 from shared.validator.validator import Validator
@@ -9,7 +12,25 @@ from shared.validator.validator_enum import ValidatorEnum
 
 logger = logging.getLogger(__name__)
 
+# Status codes: the string values first, then the Status members, so a status reads back as the type it was given
+_STATUS_VALUES = tuple(status.value for status in Status) + tuple(Status)
+_STATUS_CODES = {value: code for code, value in enumerate(_STATUS_VALUES)}
+
+@lru_cache(maxsize=1024)
+def _parse_url(repo_link: str) -> ParseResult:
+    return urlparse(repo_link)
+
+@lru_cache(maxsize=1024)
+def _url_string(repo_link: ParseResult) -> str:
+    return sys.intern(repo_link.geturl())
+
 class Project:
+    """
+    A project kept compact in memory: no __dict__, the repo link as an interned string parsed on access,
+    the status as a small code and dates as ordinals. The attributes read and accept the same types as before.
+    """
+    __slots__ = ('id', 'name', 'description', '_repo_link', '_status', '_start_date', '_end_date')
+
     def __init__(
         self, id: int, name: str, description: str, repo_link: Optional[ParseResult] = None,
         status: Optional[Status] = None,
@@ -24,7 +45,43 @@ class Project:
         self.status = status
         self.start_date = start_date
         self.end_date = end_date
-        
+
+    @property
+    def repo_link(self) -> Optional[ParseResult]:
+        return _parse_url(self._repo_link) if self._repo_link is not None else None
+
+    @repo_link.setter
+    def repo_link(self, repo_link: Union[ParseResult, str, None]) -> None:
+        if repo_link is None or isinstance(repo_link, str):
+            self._repo_link = sys.intern(repo_link) if repo_link else None
+        else:
+            self._repo_link = _url_string(repo_link)
+
+    @property
+    def status(self) -> Union[Status, str, None]:
+        status = self._status
+        return _STATUS_VALUES[status] if type(status) is int else status
+
+    @status.setter
+    def status(self, status: Union[Status, str, None]) -> None:
+        self._status = _STATUS_CODES.get(status, status)
+
+    @property
+    def start_date(self) -> Optional[date]:
+        return date.fromordinal(self._start_date) if self._start_date is not None else None
+
+    @start_date.setter
+    def start_date(self, start_date: Optional[date]) -> None:
+        self._start_date = start_date.toordinal() if start_date is not None else None
+
+    @property
+    def end_date(self) -> Optional[date]:
+        return date.fromordinal(self._end_date) if self._end_date is not None else None
+
+    @end_date.setter
+    def end_date(self, end_date: Optional[date]) -> None:
+        self._end_date = end_date.toordinal() if end_date is not None else None
+
     @staticmethod
     def _parse_and_validate_data(id: int, name: str, description: str, repo_link: str, status: str, start_date: str, end_date: str) -> dict:
         if id < 0:
@@ -83,6 +140,36 @@ class Project:
         )
         return cls(**parsed_data)
 
+    @classmethod
+    def from_records(
+        cls, records: Iterable[dict], columns: bool = False, errors: Optional[dict[int, str]] = None
+    ) -> Union[list['Project'], 'ProjectColumns']:
+        """
+        Validates many project dicts at once, with the same rules and messages as from_dict.
+
+        Names and descriptions are validated as whole columns, and repo links, statuses and dates are parsed
+        once per distinct value, which pays off on history data where those values repeat a lot.
+
+        :param records: The project dicts to load.
+        :param columns: Return a ProjectColumns table instead of a list of Projects.
+        :param errors: When given, invalid records are skipped and their first error is stored here by record index.
+        :return: The loaded projects, in record order.
+        :raises ValueError: If a record is invalid and no errors dict was given.
+        """
+        records = records if isinstance(records, list) else list(records)
+        validated, row_errors = _validate_columns(records)
+        if row_errors and errors is None:
+            index = min(row_errors)
+            raise ValueError(f"Record {index}: {row_errors[index]}")
+        if errors is not None:
+            errors.update(row_errors)
+
+        if row_errors:
+            valid = [index not in row_errors for index in range(len(records))]
+            validated = tuple(list(compress(column, valid)) for column in validated)
+        table = ProjectColumns(*validated)
+        return table if columns else table.to_projects()
+
     def to_dict(self) -> dict:
         """
         Converts the Project object to a dictionary.
@@ -99,3 +186,107 @@ class Project:
     
     def __repr__(self):
         return (f"Project(id={self.id}), name={self.name}, description={self.description}, repo_link={self.repo_link.geturl() if self.repo_link else None}, status={self.status}, start_date={self.start_date}, end_date={self.end_date})")
+
+class ProjectColumns:
+    """
+    Projects stored column by column: one list per field instead of one object per project.
+    """
+    FIELDS = ('id', 'name', 'description', 'repo_link', 'status', 'start_date', 'end_date')
+
+    def __init__(self, *columns: list):
+        for index, field in enumerate(self.FIELDS):
+            setattr(self, field, columns[index] if index < len(columns) else [])
+
+    def row(self, index: int) -> Project:
+        return Project(*(getattr(self, field)[index] for field in self.FIELDS))
+
+    def to_projects(self) -> list[Project]:
+        return [Project(*row) for row in zip(*(getattr(self, field) for field in self.FIELDS))]
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+def _memoized(validate: Callable) -> Callable:
+    """
+    Wraps a single-value validator so each distinct value is validated once; errors are cached too.
+    """
+    cache: dict = {}
+
+    def validate_once(value):
+        if value not in cache:
+            try:
+                cache[value] = (validate(value), None)
+            except ValueError as e:
+                cache[value] = (None, str(e))
+        return cache[value]
+    return validate_once
+
+def _parse_repo_link(repo_link: str) -> ParseResult:
+    parsed_url = urlparse(repo_link.strip())
+    if not parsed_url.scheme or not parsed_url.netloc:
+        raise ValueError(f"Invalid repository link: {repo_link}")
+    return parsed_url
+
+def _validate_columns(records: list[dict]) -> tuple[tuple[list, ...], dict[int, str]]:
+    """
+    Validates records column by column. Returns the validated columns and the first error of each invalid record,
+    checking fields in the order from_dict does so that both report the same error.
+    """
+    errors: dict[int, str] = {}
+    count = len(records)
+
+    def fail(index: int, message: str) -> None:
+        errors.setdefault(index, message)
+
+    ids = [record.get('id') for record in records]
+    names = [record.get('name') for record in records]
+    descriptions = [record.get('description') for record in records]
+    for index, (id, name, description) in enumerate(zip(ids, names, descriptions)):
+        if id is None:
+            fail(index, "Project id is required")
+        elif id < 0:
+            fail(index, "Project id must be greater than or equal to 0")
+        if not name:
+            fail(index, "Project name cannot be None or empty")
+        if not description:
+            fail(index, "Project description cannot be None or empty")
+
+    names, name_errors = Validator.validate_many([(name or "").strip() for name in names], Validator.compile_name())
+    descriptions, description_errors = Validator.validate_many(
+        [(description or "").strip() for description in descriptions], Validator.compile_description()
+    )
+    for column_errors in (name_errors, description_errors):
+        for index, message in column_errors.items():
+            fail(index, message)
+
+    parse_repo_link = _memoized(_parse_repo_link)
+    allowed_statuses = [status.value for status in Status]
+    validate_status = _memoized(lambda status: ValidatorEnum.validate_enum_by_list(status.strip(), allowed_statuses))
+    validate_date = _memoized(lambda value: ValidatorDate.validate_date(value.strip()))
+
+    repo_links, statuses, start_dates, end_dates = [None] * count, [None] * count, [None] * count, [None] * count
+    for index, record in enumerate(records):
+        repo_link, status = record.get('repo_link'), record.get('status')
+        if repo_link is not None:
+            repo_links[index], message = parse_repo_link(repo_link)
+            if message:
+                fail(index, message)
+        if status is not None:
+            statuses[index], message = validate_status(status)
+            if message:
+                fail(index, message)
+        for field, column in (('start_date', start_dates), ('end_date', end_dates)):
+            value = record.get(field)
+            if isinstance(value, str):
+                column[index], message = validate_date(value)
+                if message:
+                    fail(index, message)
+            elif isinstance(value, date):
+                column[index] = value
+        if start_dates[index] is not None and end_dates[index] is not None:
+            try:
+                ValidatorDate.validate_relation(start_dates[index], end_dates[index])
+            except ValueError as e:
+                fail(index, str(e))
+
+    return (ids, names, descriptions, repo_links, statuses, start_dates, end_dates), errors
@@ -0,0 +1,179 @@
+from bisect import bisect_left, bisect_right, insort
+from datetime import date
+import json
+import logging
+import os
+from typing import Iterator, Optional
+from log_project.lib.model.project import Project
+from log_project.lib.timeline import Timeline
+from shared.jsonl_log import replay_jsonl
+
+logger = logging.getLogger(__name__)
+
+# Path for the JSONL project store
+PROJECTS_FILE = 'projects.jsonl'
+
+DATE_FIELDS = ('start_date', 'end_date')
+
+class ProjectStore:
+    """
+    Projects persisted as an append-only JSONL log and indexed in memory.
+
+    Every write appends one line, {"op": "put", "project": {...}} or {"op": "delete", "id": n}; the file is
+    never rewritten except by an explicit compact(). On open the log is replayed, last write per id wins.
+    Indexes: id -> project, status -> ids, and one sorted (date, id) list per date field for range queries.
+    With read_only the store never touches the disk beyond reading the log: a missing file stays missing,
+    a torn tail is skipped but left in place, and writes raise ValueError.
+    """
+    def __init__(self, path: str = PROJECTS_FILE, sync: bool = False, read_only: bool = False):
+        self.path = path
+        self.sync = sync
+        self.read_only = read_only
+        self._by_id: dict[int, Project] = {}
+        self._by_status: dict[Optional[str], dict[int, None]] = {}
+        self._by_date: dict[str, list[tuple[date, int]]] = {field: [] for field in DATE_FIELDS}
+        self._timeline: Optional[Timeline] = None
+        self._load()
+        self._file = open(path, 'a', encoding='utf-8') if not read_only else None
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            if os.path.dirname(self.path) and not self.read_only:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            return
+
+        latest: dict[int, Optional[dict]] = {}
+
+        def apply(entry: dict) -> None:
+            if entry['op'] == 'put':
+                latest[entry['project']['id']] = entry['project']
+            elif entry['op'] == 'delete':
+                latest[entry['id']] = None
+
+        replay_jsonl(self.path, apply, repair=not self.read_only)
+
+        errors: dict[int, str] = {}
+        records = [record for record in latest.values() if record is not None]
+        projects = Project.from_records(records, errors=errors)
+        for project in projects:
+            self._by_id[project.id] = project
+            self._by_status.setdefault(project.status, {})[project.id] = None
+        for field in DATE_FIELDS:
+            self._by_date[field] = sorted(
+                (getattr(project, field), project.id) for project in projects if getattr(project, field) is not None
+            )
+        for index, message in errors.items():
+            logger.warning(f"Skipping invalid project {records[index].get('id')} in {self.path}: {message}")
+
+    def _writable(self) -> None:
+        if self._file is None:
+            raise ValueError(f"Project store {self.path} is open read-only.")
+
+    def _append(self, entry: dict) -> None:
+        self._writable()
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+        if self.sync:
+            os.fsync(self._file.fileno())
+
+    def _index(self, project: Project) -> None:
+        self._timeline = None
+        self._by_id[project.id] = project
+        self._by_status.setdefault(project.status, {})[project.id] = None
+        for field in DATE_FIELDS:
+            value = getattr(project, field)
+            if value is not None:
+                insort(self._by_date[field], (value, project.id))
+
+    def _unindex(self, project: Project) -> None:
+        self._timeline = None
+        del self._by_id[project.id]
+        bucket = self._by_status[project.status]
+        del bucket[project.id]
+        if not bucket:
+            del self._by_status[project.status]
+        for field in DATE_FIELDS:
+            value = getattr(project, field)
+            if value is not None:
+                entries = self._by_date[field]
+                del entries[bisect_left(entries, (value, project.id))]
+
+    def put(self, project: Project) -> None:
+        """
+        Adds a project or replaces the one with the same id.
+        """
+        self._append({'op': 'put', 'project': project.to_dict()})
+        if project.id in self._by_id:
+            self._unindex(self._by_id[project.id])
+        self._index(project)
+
+    def delete(self, project_id: int) -> bool:
+        project = self._by_id.get(project_id)
+        if project is None:
+            return False
+        self._append({'op': 'delete', 'id': project_id})
+        self._unindex(project)
+        return True
+
+    def get(self, project_id: int) -> Optional[Project]:
+        return self._by_id.get(project_id)
+
+    def by_status(self, status: Optional[str]) -> list[Project]:
+        """
+        Returns the projects with the given status value (e.g. 'In Progress'), or without one for None.
+        """
+        return [self._by_id[project_id] for project_id in self._by_status.get(status, ())]
+
+    def date_range(self, field: str, start: Optional[date] = None, end: Optional[date] = None) -> list[Project]:
+        """
+        Returns the projects whose start_date or end_date lies within [start, end], ordered by that date.
+        An open bound is unlimited; projects without the date are left out.
+        """
+        if field not in DATE_FIELDS:
+            raise ValueError(f"Field must be one of the following: {', '.join(DATE_FIELDS)}.")
+        entries = self._by_date[field]
+        low = bisect_left(entries, (start,)) if start is not None else 0
+        high = bisect_right(entries, (end, float('inf'))) if end is not None else len(entries)
+        return [self._by_id[project_id] for _, project_id in entries[low:high]]
+
+    def timeline(self) -> Timeline:
+        """
+        Returns the interval tree over the projects' date ranges, rebuilt on first use after a change.
+        """
+        if self._timeline is None:
+            self._timeline = Timeline(self._by_id.values())
+        return self._timeline
+
+    def compact(self) -> None:
+        """
+        Rewrites the log with one put per live project, dropping replaced and deleted entries.
+        """
+        self._writable()
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for project in self._by_id.values():
+                f.write(json.dumps({'op': 'put', 'project': project.to_dict()}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._file.close()
+        os.replace(temp_path, self.path)
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+    def __enter__(self) -> 'ProjectStore':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, project_id: int) -> bool:
+        return project_id in self._by_id
+
+    def __iter__(self) -> Iterator[Project]:
+        return iter(self._by_id.values())
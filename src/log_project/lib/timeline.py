@@ -0,0 +1,109 @@
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Iterable, Optional
+from log_project.lib.model.project import Project
+
+# Ordinal used for the end of a project that has not ended yet
+OPEN_END = date.max.toordinal()
+
+class _Node:
+    __slots__ = ('center', 'by_start', 'by_end', 'left', 'right')
+
+    def __init__(self, center: int, by_start: list, by_end: list, left: Optional['_Node'], right: Optional['_Node']):
+        self.center = center
+        self.by_start = by_start
+        self.by_end = by_end
+        self.left = left
+        self.right = right
+
+class Timeline:
+    """
+    Centered interval tree over project date ranges. Each node keeps the intervals that contain its center,
+    sorted by start and by end, so overlap and point queries cost O(log n + k). Concurrency counts come from
+    two sorted endpoint arrays in O(log n). Projects without a start date are left out; a project without
+    an end date is ongoing. The tree is built once; rebuild it after the projects change.
+    """
+    def __init__(self, projects: Iterable[Project]):
+        intervals = []
+        for project in projects:
+            if project.start_date is None:
+                continue
+            end = project.end_date.toordinal() if project.end_date is not None else OPEN_END
+            intervals.append((project.start_date.toordinal(), end, project))
+        self._starts = sorted(start for start, _, _ in intervals)
+        self._ends = sorted(end for _, end, _ in intervals)
+        self._root = _build(intervals)
+
+    def overlapping(self, start: date, end: Optional[date] = None) -> list[Project]:
+        """
+        Returns the projects active at any day in [start, end], both inclusive; without end, on the start day.
+        """
+        low = start.toordinal()
+        high = end.toordinal() if end is not None else low
+        if high < low:
+            raise ValueError("End date must be on or after start date.")
+        found: list[Project] = []
+        _query(self._root, low, high, found)
+        return found
+
+    def active_on(self, day: date) -> list[Project]:
+        return self.overlapping(day)
+
+    def overlapping_project(self, project: Project) -> list[Project]:
+        """
+        Returns the other projects whose date range overlaps the given project's range.
+        """
+        if project.start_date is None:
+            return []
+        low = project.start_date.toordinal()
+        high = project.end_date.toordinal() if project.end_date is not None else OPEN_END
+        found: list[Project] = []
+        _query(self._root, low, high, found)
+        return [other for other in found if other.id != project.id]
+
+    def count_active(self, day: date) -> int:
+        """
+        Number of projects active on the day: started on or before it and not ended before it.
+        """
+        ordinal = day.toordinal()
+        return bisect_right(self._starts, ordinal) - bisect_left(self._ends, ordinal)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+def _build(intervals: list[tuple[int, int, Project]]) -> Optional[_Node]:
+    if not intervals:
+        return None
+    endpoints = sorted(point for start, end, _ in intervals for point in (start, end))
+    center = endpoints[len(endpoints) // 2]
+    left, here, right = [], [], []
+    for interval in intervals:
+        if interval[1] < center:
+            left.append(interval)
+        elif interval[0] > center:
+            right.append(interval)
+        else:
+            here.append(interval)
+    by_start = sorted(here, key=lambda interval: interval[0])
+    by_end = sorted(here, key=lambda interval: interval[1], reverse=True)
+    return _Node(center, by_start, by_end, _build(left), _build(right))
+
+def _query(node: Optional[_Node], low: int, high: int, found: list[Project]) -> None:
+    while node is not None:
+        if high < node.center:
+            # Every interval here ends at or after the center, so it overlaps when it starts by high
+            for start, _, project in node.by_start:
+                if start > high:
+                    break
+                found.append(project)
+            node = node.left
+        elif low > node.center:
+            for _, end, project in node.by_end:
+                if end < low:
+                    break
+                found.append(project)
+            node = node.right
+        else:
+            found.extend(project for _, _, project in node.by_start)
+            _query(node.left, low, high, found)
+            node = node.right
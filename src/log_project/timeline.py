@@ -0,0 +1,58 @@
+"""Timeline queries over the project store."""
+from datetime import date
+
+description = "Projects active on a day, in a window or overlapping a project, and concurrency counts"
+
+USAGE = """Usage:
+  timeline active <YYYY-MM-DD>                projects active on a day
+  timeline window <YYYY-MM-DD> <YYYY-MM-DD>   projects active at any day in a window
+  timeline overlaps <project id>              projects overlapping a project's date range
+  timeline count <YYYY-MM-DD>                 number of projects active on a day"""
+
+def format_project(project) -> str:
+    end = project.end_date.isoformat() if project.end_date is not None else "ongoing"
+    return f"{project.id}: {project.name} ({project.start_date.isoformat()} - {end})"
+
+def print_projects(projects) -> None:
+    if not projects:
+        print("No projects found.")
+    for project in sorted(projects, key=lambda project: (project.start_date, project.id)):
+        print(format_project(project))
+
+def run(args = None):
+    from log_project.lib.project_store import ProjectStore
+
+    args = args or []
+    query, values = (args[0], args[1:]) if args else (None, [])
+    try:
+        if query in ("active", "count") and len(values) == 1:
+            day = date.fromisoformat(values[0])
+        elif query == "window" and len(values) == 2:
+            start, end = date.fromisoformat(values[0]), date.fromisoformat(values[1])
+        elif query == "overlaps" and len(values) == 1:
+            project_id = int(values[0])
+        else:
+            print(USAGE)
+            return
+    except ValueError as e:
+        print(f"Invalid argument: {e}")
+        print(USAGE)
+        return
+
+    with ProjectStore(read_only=True) as store:
+        timeline = store.timeline()
+        if query == "active":
+            print_projects(timeline.active_on(day))
+        elif query == "count":
+            print(f"{timeline.count_active(day)} project(s) active on {day.isoformat()}")
+        elif query == "window":
+            if end < start:
+                print("End date must be on or after start date.")
+                return
+            print_projects(timeline.overlapping(start, end))
+        else:
+            project = store.get(project_id)
+            if project is None:
+                print(f"No project with id {project_id}.")
+                return
+            print_projects(timeline.overlapping_project(project))
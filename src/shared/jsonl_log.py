@@ -0,0 +1,35 @@
+import json
+import logging
+import os
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+def replay_jsonl(path: str, apply: Callable[[dict], None], repair: bool = True) -> None:
+    """
+    Passes each entry of an append-only JSON Lines log to apply, in order. Lines that do not parse, or that
+    apply rejects with ValueError, KeyError, TypeError or AttributeError, are skipped with a warning.
+
+    A last line without its newline is what a crash mid-append leaves behind. With repair it is cut off when
+    unreadable, so the next append starts on a line of its own, and given its newline otherwise.
+    """
+    # Bytes read so far, and whether a write cut short left a partial last line
+    size, torn, line = 0, False, b""
+    with open(path, 'rb') as file:
+        for line_number, line in enumerate(file, start=1):
+            torn = False
+            try:
+                apply(json.loads(line))
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                logger.warning(f"Skipping unreadable line {line_number} of {path}: {e}")
+                torn = not line.endswith(b"\n")
+            size += len(line)
+
+    if not repair or not line or line.endswith(b"\n"):
+        return
+    if torn:
+        with open(path, 'r+b') as file:
+            file.truncate(size - len(line))
+    else:
+        with open(path, 'ab') as file:
+            file.write(b"\n")
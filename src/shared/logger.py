@@ -1,7 +1,92 @@
+import atexit
 import logging
 import os
-from typing import Optional
-from logging.handlers import RotatingFileHandler
+import queue
+from typing import Any, Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+_shared_handlers: dict[tuple, list[logging.Handler]] = {}
+_listeners: list['BatchingQueueListener'] = []
+
+class LazyMessage:
+    """
+    Log message rendered from a template and structured fields only when a handler formats the record.
+    Callable field values are called at that point too, so expensive values are never computed for dropped records.
+    """
+    __slots__ = ('template', 'fields', '_text')
+
+    def __init__(self, template: str, fields: dict[str, Any]):
+        self.template = template
+        self.fields = fields
+        self._text: Optional[str] = None
+
+    def resolved_fields(self) -> dict[str, Any]:
+        return {name: value() if callable(value) else value for name, value in self.fields.items()}
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = self.template.format(**self.resolved_fields())
+        return self._text
+
+def log_lazy(logger: logging.Logger, level: int, template: str, stacklevel: int = 2, **fields: Any) -> None:
+    """
+    Logs template.format(**fields) without rendering it unless a handler emits the record.
+    The fields stay available on the record as `record.fields` for structured handlers.
+    """
+    if logger.isEnabledFor(level):
+        logger.log(level, LazyMessage(template, fields), extra={'fields': fields}, stacklevel=stacklevel)
+
+def debug_lazy(logger: logging.Logger, template: str, **fields: Any) -> None:
+    log_lazy(logger, logging.DEBUG, template, stacklevel=3, **fields)
+
+class BatchFlushMixin:
+    """
+    Skips the flush StreamHandler does after every record; the queue listener flushes once per batch instead.
+    """
+    def flush(self) -> None:
+        pass
+
+    def flush_batch(self) -> None:
+        super().flush()
+
+class BatchStreamHandler(BatchFlushMixin, logging.StreamHandler):
+    pass
+
+class BatchRotatingFileHandler(BatchFlushMixin, RotatingFileHandler):
+    pass
+
+class BatchingQueueListener(QueueListener):
+    """
+    QueueListener that drains all queued records at once, hands them to its handlers and flushes them once per batch.
+    """
+    def __init__(self, record_queue: queue.SimpleQueue, *handlers: logging.Handler, batch_size: int = 512):
+        super().__init__(record_queue, *handlers, respect_handler_level=True)
+        self.batch_size = batch_size
+
+    def _monitor(self) -> None:
+        while True:
+            batch = [self.dequeue(True)]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.dequeue(False))
+                except queue.Empty:
+                    break
+
+            stop = False
+            for record in batch:
+                if record is self._sentinel:
+                    stop = True
+                    continue
+                self.handle(record)
+
+            for handler in self.handlers:
+                if isinstance(handler, BatchFlushMixin):
+                    handler.flush_batch()
+                else:
+                    handler.flush()
+
+            if stop:
+                return
 
 def setup_logger(name: str, config: Optional[dict[str, Optional[object]]]=None) -> logging.Logger:
     if config is None:
@@ -20,28 +105,118 @@ def setup_logger(name: str, config: Optional[dict[str, Optional[object]]]=None)
     logger.setLevel(config.get('mainLevel', logging.DEBUG))
 
     if not logger.hasHandlers():
-        # Console handler setup
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(config.get('consoleLevel', logging.DEBUG))
-        console_formatter = logging.Formatter(config.get('format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-        console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
-
-        # File handler setup with rotation
-        if config.get('log_to_file', True):
-            log_file = config.get('log_file', 'logs/app.log')
-            if os.path.dirname(log_file):
-                os.makedirs(os.path.dirname(log_file), exist_ok=True)
-            
-            # Rotating file handler setup
-            file_handler = RotatingFileHandler(
-                log_file,
-                maxBytes=config.get('max_bytes', 10 * 1024 * 1024),  # Default 10MB
-                backupCount=config.get('backup_count', 3)             # Default 5 backups
-            )
-            file_handler.setLevel(config.get('fileLevel', logging.DEBUG))
-            file_formatter = logging.Formatter(config.get('format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-            file_handler.setFormatter(file_formatter)
-            logger.addHandler(file_handler)
+        for handler in get_handlers(config):
+            logger.addHandler(handler)
 
     return logger
+
+def get_handlers(config: dict[str, Optional[object]]) -> list[logging.Handler]:
+    """
+    Returns the console and file handlers for a config, creating them once and sharing them between all loggers using it.
+    The log file is opened on the first record written, not at import time.
+
+    With 'use_queue' set in the config, loggers only get a QueueHandler; one background listener owns
+    the console and file handlers and writes records in batches, off the calling thread.
+    """
+    key = tuple(sorted((name, repr(value)) for name, value in config.items()))
+    if key in _shared_handlers:
+        return _shared_handlers[key]
+
+    if config.get('use_queue', False):
+        handlers = [start_queue_listener(build_handlers(config, batched=True))]
+    else:
+        handlers = build_handlers(config)
+
+    _shared_handlers[key] = handlers
+    return handlers
+
+def build_handlers(config: dict[str, Optional[object]], batched: bool = False) -> list[logging.Handler]:
+    handlers = []
+
+    # Console handler setup
+    console_handler = BatchStreamHandler() if batched else logging.StreamHandler()
+    console_handler.setLevel(config.get('consoleLevel', logging.DEBUG))
+    console_formatter = logging.Formatter(config.get('format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    console_handler.setFormatter(console_formatter)
+    handlers.append(console_handler)
+
+    # File handler setup with rotation
+    if config.get('log_to_file', True):
+        log_file = config.get('log_file', 'logs/app.log')
+        if os.path.dirname(log_file):
+            os.makedirs(os.path.dirname(log_file), exist_ok=True)
+        
+        # Rotating file handler setup
+        file_handler_class = BatchRotatingFileHandler if batched else RotatingFileHandler
+        file_handler = file_handler_class(
+            log_file,
+            maxBytes=config.get('max_bytes', 10 * 1024 * 1024),  # Default 10MB
+            backupCount=config.get('backup_count', 3),            # Default 5 backups
+            delay=True
+        )
+        file_handler.setLevel(config.get('fileLevel', logging.DEBUG))
+        file_formatter = logging.Formatter(config.get('format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+        file_handler.setFormatter(file_formatter)
+        handlers.append(file_handler)
+
+    return handlers
+
+def start_queue_listener(handlers: list[logging.Handler]) -> QueueHandler:
+    record_queue = queue.SimpleQueue()
+    listener = BatchingQueueListener(record_queue, *handlers)
+    listener.queue_handler = QueueHandler(record_queue)
+    _sync_queue_level(listener)
+    listener.start()
+    if not _listeners:
+        atexit.register(stop_queue_listeners)
+    _listeners.append(listener)
+    return listener.queue_handler
+
+def _sync_queue_level(listener: 'BatchingQueueListener') -> None:
+    # QueueHandler renders every message it accepts, so it only accepts what some listener handler will write.
+    listener.queue_handler.setLevel(min(handler.level for handler in listener.handlers))
+
+def stop_queue_listeners() -> None:
+    """
+    Writes out every queued record and stops the background listeners. Their QueueHandlers are detached
+    from the loggers and dropped from the shared handlers, so the next setup_logger starts a new listener.
+    """
+    while _listeners:
+        listener = _listeners.pop()
+        listener.stop()
+        for key in [key for key, handlers in _shared_handlers.items() if listener.queue_handler in handlers]:
+            del _shared_handlers[key]
+        loggers = [logger for logger in logging.Logger.manager.loggerDict.values() if isinstance(logger, logging.Logger)]
+        for logger in [logging.getLogger(), *loggers]:
+            logger.removeHandler(listener.queue_handler)
+        for handler in listener.handlers:
+            handler.close()
+
+def get_queue_handlers() -> list[QueueHandler]:
+    return [
+        handler
+        for handlers in _shared_handlers.values()
+        for handler in handlers
+        if isinstance(handler, QueueHandler)
+    ]
+
+def get_console_handlers() -> list[logging.Handler]:
+    """
+    Returns the shared console handlers, including those owned by queue listeners.
+    """
+    all_handlers = [handler for handlers in _shared_handlers.values() for handler in handlers]
+    all_handlers += [handler for listener in _listeners for handler in listener.handlers]
+    return [
+        handler
+        for handler in all_handlers
+        if isinstance(handler, logging.StreamHandler) and not isinstance(handler, logging.FileHandler)
+    ]
+
+def set_console_level(level: int) -> None:
+    """
+    Changes the level of every shared console handler, leaving file handlers as configured.
+    """
+    for handler in get_console_handlers():
+        handler.setLevel(level)
+    for listener in _listeners:
+        _sync_queue_level(listener)
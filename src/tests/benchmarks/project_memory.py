@@ -0,0 +1,95 @@
+"""
+Memory used per Project, for the compact slotted representation and for the plain-object layout it replaced.
+
+Run from src:
+    python -m tests.benchmarks.project_memory [--count 100000] [--output FILE]
+"""
+import argparse
+import gc
+import json
+import tracemalloc
+from datetime import date
+from typing import Callable, Optional
+from urllib.parse import urlparse
+from log_project.lib.model.project import Project
+
+STATUSES = ["Not Started", "In Progress", "Completed", "On Hold"]
+
+class DictProject:
+    """
+    The previous Project layout: a __dict__ per instance, a ParseResult per repo link, a date object per date.
+    """
+    def __init__(self, id, name, description, repo_link=None, status=None, start_date=None, end_date=None):
+        self.id = id
+        self.name = name
+        self.description = description
+        self.repo_link = repo_link
+        self.status = status
+        self.start_date = start_date
+        self.end_date = end_date
+
+def project_records(count: int) -> list[dict]:
+    """
+    Synthetic project history: repo links, statuses and dates repeat the way real history does.
+    """
+    return [
+        {
+            'id': index,
+            'name': f"Project {index}",
+            'description': f"History entry number {index}",
+            'repo_link': f"https://github.com/org{index % 50}/repo{index % 2000}",
+            'status': STATUSES[index % len(STATUSES)],
+            'start_date': f"2023-{1 + index % 12:02d}-{1 + index % 28:02d}",
+            'end_date': f"2024-{1 + index % 12:02d}-{1 + index % 28:02d}",
+        }
+        for index in range(count)
+    ]
+
+def load_dict_projects(records: list[dict]) -> list[DictProject]:
+    return [
+        DictProject(
+            record['id'], record['name'], record['description'], urlparse(record['repo_link']), record['status'],
+            date.fromisoformat(record['start_date']), date.fromisoformat(record['end_date'])
+        )
+        for record in records
+    ]
+
+def bytes_per_project(load: Callable[[list[dict]], list], records: list[dict]) -> float:
+    """
+    Returns the memory the loaded objects hold on to, per record. Strings shared with the records are not counted.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        projects = load(records)
+        gc.collect()
+        used = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del projects
+    return used / len(records)
+
+def measure(count: int) -> dict[str, float]:
+    records = project_records(count)
+    return {
+        f"project_bytes_dict/{count}": bytes_per_project(load_dict_projects, records),
+        f"project_bytes_slotted/{count}": bytes_per_project(Project.from_records, records),
+    }
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure memory per Project object")
+    parser.add_argument("--count", type=int, default=100000, help="Number of projects to load")
+    parser.add_argument("--output", help="Also write the results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    results = measure(args.count)
+    for name, size in results.items():
+        print(f"{name:<40}{size:>10.1f} bytes")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'results': results}, f, indent=2, sort_keys=True)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
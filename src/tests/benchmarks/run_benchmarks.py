@@ -0,0 +1,169 @@
+"""
+Benchmarks for command discovery, loading, lookup, parsing, dispatch and startup on synthetic command trees.
+
+Run from src:
+    python -m tests.benchmarks.run_benchmarks [--sizes 10 1000 50000] [--update-baseline]
+
+Results are written as JSON (seconds per operation, keyed "<benchmark>/<tree size>") and compared
+against tests/benchmarks/baseline.json; the exit code is 1 when a benchmark got slower than the tolerance allows.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+from cli_app.command_loader import discover_folders_with_commands, load_commands
+from cli_app.command_registry import command_registry
+from cli_app.command_runner import find_command_in_folders, parse_input, run_command
+from tests.benchmarks.synthetic_tree import build_command_tree
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+RESULTS_FILE = ".cache/benchmark_results.json"
+DEFAULT_SIZES = [10, 1000, 50000]
+TOLERANCE = 0.5
+NOISE_FLOOR = 0.001
+
+def measure(func: Callable[[], object], number: int = 1, repeat: int = 3) -> float:
+    """
+    Returns the best time per call, in seconds, over repeat rounds of number calls.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+@contextmanager
+def command_tree(modules: int) -> Iterator[dict[str, list[str]]]:
+    """
+    Builds a synthetic tree in a temporary directory and makes it the working directory and an import root.
+    Log output is switched off meanwhile, so the numbers measure the code and not log I/O.
+    """
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as root:
+        tree = build_command_tree(root, modules)
+        os.chdir(root)
+        sys.path.insert(0, root)
+        logging.disable(logging.INFO)
+        try:
+            yield tree
+        finally:
+            logging.disable(logging.NOTSET)
+            sys.path.remove(root)
+            os.chdir(cwd)
+            for folder in tree:
+                command_registry.invalidate(folder)
+                for name in [name for name in sys.modules if name == folder or name.startswith(f"{folder}.")]:
+                    del sys.modules[name]
+
+def time_startup(root: str, repeat: int, keep_manifest: bool) -> float:
+    """
+    Times `python -m cli_app.main --batch -` exiting right away, which covers imports, discovery and loading.
+    Without keep_manifest the command manifest is removed before each run, so every run walks the tree.
+    """
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    manifest_dir = os.path.join(root, ".cache")
+
+    def start() -> None:
+        if not keep_manifest and os.path.isdir(manifest_dir):
+            for name in os.listdir(manifest_dir):
+                os.remove(os.path.join(manifest_dir, name))
+        subprocess.run([sys.executable, "-m", "cli_app.main", "--batch", "-"], input="exit\n",
+                       cwd=root, env=env, capture_output=True, text=True, check=True)
+
+    if keep_manifest:
+        start()
+    return measure(start, repeat=repeat)
+
+def run_benchmarks(sizes: list[int], repeat: int = 3, startup: bool = True) -> dict[str, float]:
+    results: dict[str, float] = {}
+    for size in sizes:
+        with command_tree(size) as tree:
+            root = os.getcwd()
+            folder, commands = next(reversed(tree.items()))
+            command = commands[-1]
+            lookups = 1000
+
+            results[f"discover_folders_with_commands/{size}"] = measure(discover_folders_with_commands, repeat=repeat)
+            folders = discover_folders_with_commands()
+            results[f"load_commands/{size}"] = measure(lambda: load_commands(folders), repeat=repeat)
+            loaded = load_commands(folders)
+            results[f"find_command_in_folders/{size}"] = measure(lambda: find_command_in_folders(loaded, command), lookups, repeat)
+            results[f"parse_input/{size}"] = measure(lambda: parse_input(f'{command} --name "two words" 42'), lookups, repeat)
+            results[f"run_command_first/{size}"] = measure(lambda: run_command(folder, command, []), repeat=1)
+            results[f"run_command/{size}"] = measure(lambda: run_command(folder, command, ["a"]), lookups, repeat)
+            if startup:
+                results[f"startup_cold/{size}"] = time_startup(root, repeat, keep_manifest=False)
+                results[f"startup_warm/{size}"] = time_startup(root, repeat, keep_manifest=True)
+    return results
+
+def compare(results: dict[str, float], baseline: dict[str, float], tolerance: float = TOLERANCE, noise_floor: float = NOISE_FLOOR) -> list[str]:
+    """
+    Lists the benchmarks slower than baseline * (1 + tolerance). Differences below noise_floor seconds are ignored.
+    """
+    regressions = []
+    for name, seconds in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        if seconds > expected * (1 + tolerance) and seconds - expected > noise_floor:
+            regressions.append(f"{name}: {seconds * 1000:.3f} ms vs baseline {expected * 1000:.3f} ms ({seconds / expected:.1f}x)")
+    return regressions
+
+def load_results(path: str) -> dict[str, float]:
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)['results']
+    except (OSError, ValueError, KeyError):
+        return {}
+
+def save_results(path: str, results: dict[str, float]) -> None:
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the CLI on synthetic command trees")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Numbers of command modules to generate")
+    parser.add_argument("--repeat", type=int, default=3, help="Rounds per benchmark; the best round counts")
+    parser.add_argument("--output", default=RESULTS_FILE, help="Where to write the JSON results")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="Allowed slowdown, 0.5 meaning 50%%")
+    parser.add_argument("--update-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--no-startup", action="store_true", help="Skip the startup benchmarks, which run the CLI as a subprocess")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    results = run_benchmarks(args.sizes, args.repeat, startup=not args.no_startup)
+    save_results(args.output, results)
+    for name, seconds in results.items():
+        print(f"{name:<40}{seconds * 1000:>12.4f} ms")
+
+    if args.update_baseline:
+        save_results(args.baseline, {**load_results(args.baseline), **results})
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    regressions = compare(results, load_results(args.baseline), args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,35 @@
+import json
+import os
+
+COMMANDS_PER_FOLDER = 500
+
+COMMAND_SOURCE = '''def run(args):
+    return args
+'''
+
+def build_command_tree(root: str, modules: int, per_folder: int = COMMANDS_PER_FOLDER) -> dict[str, list[str]]:
+    """
+    Writes a synthetic source tree with the given number of command modules under root, plus a descriptions file.
+    Folder names carry the tree size, so trees of different sizes can be imported in the same process.
+    Returns the command names grouped by folder.
+    """
+    tree: dict[str, list[str]] = {}
+    for index in range(modules):
+        folder = f"bench{modules}_{index // per_folder:04d}"
+        if folder not in tree:
+            tree[folder] = []
+            os.makedirs(os.path.join(root, folder))
+            with open(os.path.join(root, folder, "__init__.py"), 'w'):
+                pass
+        command = f"cmd{index:06d}"
+        tree[folder].append(command)
+        with open(os.path.join(root, folder, f"{command}.py"), 'w') as f:
+            f.write(COMMAND_SOURCE)
+
+    descriptions = {
+        folder: {command: {"description": f"Synthetic command {command}"} for command in commands[::10]}
+        for folder, commands in tree.items()
+    }
+    with open(os.path.join(root, "command_descriptions.json"), 'w') as f:
+        json.dump(descriptions, f)
+    return tree
@@ -0,0 +1,6 @@
+from tests.benchmarks.project_memory import measure
+
+def test_slotted_projects_use_less_memory():
+    # Enough records for repo links and dates to repeat, as they do in real history
+    results = measure(10000)
+    assert results["project_bytes_slotted/10000"] < results["project_bytes_dict/10000"]
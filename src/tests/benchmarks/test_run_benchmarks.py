@@ -0,0 +1,43 @@
+import json
+import os
+from tests.benchmarks.run_benchmarks import compare, main, run_benchmarks
+from tests.benchmarks.synthetic_tree import build_command_tree
+
+def test_build_command_tree(tmp_path):
+    tree = build_command_tree(str(tmp_path), 12, per_folder=5)
+
+    assert list(tree) == ["bench12_0000", "bench12_0001", "bench12_0002"]
+    assert sum(len(commands) for commands in tree.values()) == 12
+    assert (tmp_path / "bench12_0002" / "cmd000011.py").is_file()
+    assert (tmp_path / "command_descriptions.json").is_file()
+
+def test_run_benchmarks_small_tree():
+    cwd = os.getcwd()
+    results = run_benchmarks([10], repeat=1, startup=False)
+
+    assert os.getcwd() == cwd
+    assert set(results) == {
+        "discover_folders_with_commands/10", "load_commands/10", "find_command_in_folders/10",
+        "parse_input/10", "run_command_first/10", "run_command/10",
+    }
+    assert all(seconds > 0 for seconds in results.values())
+
+def test_compare_reports_only_real_regressions():
+    baseline = {"fast/10": 0.010, "tiny/10": 0.0001, "gone/10": 1.0}
+    results = {"fast/10": 0.030, "tiny/10": 0.0005, "new/10": 5.0}
+
+    regressions = compare(results, baseline, tolerance=0.5, noise_floor=0.001)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("fast/10")
+
+def test_main_writes_results_and_compares_to_baseline(tmp_path):
+    output, baseline = tmp_path / "results.json", tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({"results": {"load_commands/10": 1e-9}}))
+
+    code = main(["--sizes", "10", "--repeat", "1", "--no-startup", "--output", str(output), "--baseline", str(baseline), "--tolerance", "0"])
+
+    assert "load_commands/10" in json.loads(output.read_text())["results"]
+    assert code == 0  # below the noise floor
+
+    assert main(["--sizes", "10", "--repeat", "1", "--no-startup", "--output", str(output), "--baseline", str(tmp_path / "missing.json")]) == 0
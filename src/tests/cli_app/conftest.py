@@ -0,0 +1,10 @@
+import pytest
+from cli_app.command_registry import command_registry
+
+# run_command caches command modules in the process-wide registry; tests patch those modules with mocks,
+# so every test starts and ends with an empty registry
+@pytest.fixture(autouse=True)
+def clean_registry():
+    command_registry.invalidate()
+    yield command_registry
+    command_registry.invalidate()
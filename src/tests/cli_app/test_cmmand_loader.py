@@ -1,7 +1,6 @@
 import json
-from pathlib import Path
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from cli_app.command_loader import load_commands
 
 def test_load_commands_empty_folders():
@@ -24,47 +23,47 @@ def test_load_commands_missing_file_logs_error(caplog):
     
     assert "Error reading descriptions file command_descriptions.json" in caplog.text
 
-def test_load_commands_command_name_too_long():
+def test_load_commands_command_name_too_long(tmp_path, monkeypatch):
     descriptions_data = {
         "folder1": {
             "commanddddddddddddddddddddddddddddd": { "description": "Clear the console screen" }
         }
     }
 
-    mock_open = MagicMock()
-    mock_open.return_value.__enter__.return_value.read.return_value = json.dumps(descriptions_data)
+    (tmp_path / "folder1").mkdir()
+    (tmp_path / "folder1" / "commanddddddddddddddddddddddddddddd.py").touch()
+    (tmp_path / "command_descriptions.json").write_text(json.dumps(descriptions_data))
+    monkeypatch.chdir(tmp_path)
 
-    mock_rglob = MagicMock()
-
-    mock_subfolder = MagicMock(spec=Path)
-    mock_subfolder.stem = "commanddddddddddddddddddddddddddddd"
-    mock_subfolder.is_dir.return_value = False
-    mock_rglob.return_value = [mock_subfolder]
-
-    with patch("builtins.open", mock_open), patch("pathlib.Path.is_dir", return_value=True), patch("pathlib.Path.rglob", mock_rglob):
-        with pytest.raises(ValueError):
-            load_commands(['folder1'], descriptions_file='command_descriptions.json')
-
-def test_load_commands_valid_folder():
-    mock_subfolder = MagicMock(is_dir=MagicMock(return_value=False))
-    mock_subfolder.stem = 'command'
-    mock_subfolder.name = 'command.py'
+    with pytest.raises(ValueError):
+        load_commands(['folder1'], descriptions_file='command_descriptions.json')
 
+def test_load_commands_valid_folder(tmp_path, monkeypatch):
     descriptions_data = {
         "valid_folder": {
             "command": { "description": "Clear the console screen" }
         }
     }
 
-    mock_open = MagicMock()
-    mock_open.return_value.__enter__.return_value.read.return_value = json.dumps(descriptions_data)
-
-    mock_rglob = MagicMock()
-    mock_rglob.return_value = [mock_subfolder]
+    (tmp_path / "valid_folder").mkdir()
+    (tmp_path / "valid_folder" / "__init__.py").touch()
+    (tmp_path / "valid_folder" / "command.py").touch()
+    (tmp_path / "command_descriptions.json").write_text(json.dumps(descriptions_data))
+    monkeypatch.chdir(tmp_path)
 
-    with patch("builtins.open", mock_open), patch("pathlib.Path.is_dir", return_value=True), patch("pathlib.Path.rglob", mock_rglob):
-        result = load_commands(['valid_folder'])
+    result = load_commands(['valid_folder'])
 
     assert 'valid_folder' in result
     assert 'command' in result['valid_folder']
     assert result['valid_folder']['command'] == { "description": "Clear the console screen" }
+
+def test_load_commands_skips_lib_subfolders(tmp_path, monkeypatch):
+    (tmp_path / "folder1" / "lib" / "model").mkdir(parents=True)
+    (tmp_path / "folder1" / "command.py").touch()
+    (tmp_path / "folder1" / "lib" / "helper.py").touch()
+    (tmp_path / "folder1" / "lib" / "model" / "project.py").touch()
+    monkeypatch.chdir(tmp_path)
+
+    result = load_commands(['folder1'])
+
+    assert list(result['folder1']) == ['command']
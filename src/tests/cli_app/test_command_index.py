@@ -0,0 +1,50 @@
+from cli_app.command_index import CommandFolders, PrefixTrie
+from cli_app.command_runner import find_command_in_folders, suggest_commands
+
+def sample_folders() -> CommandFolders:
+    return CommandFolders({
+        "commands": {
+            "clear": { "description": "Clear the console screen" },
+            "example": { "description": "Prints a simple example message" }
+        },
+        "log_project": {
+            "example": { "description": "Prints a simple example message from log project" },
+            "export": { "description": "Exports projects" }
+        },
+        "empty_project": {}
+    })
+
+def test_index_find_matches_scan():
+    folders = sample_folders()
+    plain = dict(folders)
+    for command in ["clear", "example", "export", "missing", "Example"]:
+        assert find_command_in_folders(folders, command) == find_command_in_folders(plain, command)
+
+def test_index_find_returns_copy():
+    folders = sample_folders()
+    find_command_in_folders(folders, "example").append("mutated")
+    assert find_command_in_folders(folders, "example") == ["commands", "log_project"]
+
+def test_index_reindex_after_change():
+    folders = sample_folders()
+    folders["empty_project"]["clear"] = { "description": "Clear empty project" }
+    folders.reindex()
+    assert find_command_in_folders(folders, "clear") == ["commands", "empty_project"]
+
+def test_index_completion_and_ambiguity():
+    folders = sample_folders()
+    assert folders.index.complete("ex") == ["example", "export"]
+    assert folders.index.is_ambiguous("ex")
+    assert not folders.index.is_ambiguous("exa")
+    assert suggest_commands(folders, "c") == ["clear"]
+    assert suggest_commands(dict(folders), "c") == []
+
+def test_prefix_trie():
+    trie = PrefixTrie(["set", "setup", "settle", "run", "set"])
+    assert trie.count("") == 4
+    assert trie.count("set") == 3
+    assert "set" in trie and "se" not in trie
+    assert trie.complete("set", limit=2) == ["set", "settle"]
+    assert trie.unique_completion("r") == "run"
+    assert trie.unique_completion("se") is None
+    assert trie.complete("x") == []
@@ -0,0 +1,75 @@
+import json
+import os
+import pytest
+from unittest.mock import patch
+from cli_app.command_loader import load_command_tree
+from cli_app.command_manifest import CommandManifest
+
+@pytest.fixture
+def command_tree(tmp_path, monkeypatch):
+    """
+    Creates a small command tree and makes it the working directory.
+    """
+    (tmp_path / "folder1").mkdir()
+    (tmp_path / "folder1" / "__init__.py").touch()
+    (tmp_path / "folder1" / "command1.py").touch()
+    (tmp_path / "folder2").mkdir()
+    (tmp_path / "folder2" / "__init__.py").touch()
+    (tmp_path / "folder2" / "command2.py").touch()
+    (tmp_path / "descriptions.json").write_text(json.dumps({
+        "folder1": {"command1": {"description": "Command 1 description"}}
+    }))
+    (tmp_path / ".cache").mkdir()
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+def load_with_manifest(manifest_path):
+    manifest = CommandManifest.load(str(manifest_path))
+    folders, commands = load_command_tree(".", descriptions_file="descriptions.json", manifest=manifest)
+    manifest.save()
+    return folders, commands
+
+def test_manifest_cold_and_warm_start_match(command_tree):
+    manifest_path = command_tree / ".cache" / "manifest.json"
+    cold = load_with_manifest(manifest_path)
+    assert manifest_path.exists()
+
+    with patch("os.scandir", side_effect=AssertionError("tree walked on warm start")):
+        warm = load_with_manifest(manifest_path)
+
+    assert cold == warm
+    assert warm[0] == ["folder1", "folder2"]
+    assert warm[1]["folder1"]["command1"] == {"description": "Command 1 description"}
+
+def test_manifest_rescans_only_changed_folder(command_tree):
+    manifest_path = command_tree / ".cache" / "manifest.json"
+    load_with_manifest(manifest_path)
+
+    (command_tree / "folder2" / "command3.py").touch()
+    os.utime(command_tree / "folder2", ns=(1, 1))
+
+    scanned = []
+    scandir = os.scandir
+    with patch("os.scandir", side_effect=lambda path: scanned.append(path) or scandir(path)):
+        _, commands = load_with_manifest(manifest_path)
+
+    assert scanned == [os.path.join(".", "folder2")]
+    assert sorted(commands["folder2"]) == ["command2", "command3"]
+
+def test_manifest_rereads_changed_descriptions(command_tree):
+    manifest_path = command_tree / ".cache" / "manifest.json"
+    load_with_manifest(manifest_path)
+
+    (command_tree / "descriptions.json").write_text(json.dumps({
+        "folder2": {"command2": {"description": "Updated description"}}
+    }))
+
+    _, commands = load_with_manifest(manifest_path)
+    assert commands["folder2"]["command2"] == {"description": "Updated description"}
+
+def test_manifest_ignores_corrupt_file(tmp_path):
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text("{not json")
+
+    manifest = CommandManifest.load(str(manifest_path))
+    assert manifest.get_listing(str(tmp_path)) is None
@@ -0,0 +1,96 @@
+import os
+from unittest.mock import patch
+from cli_app.cli_helpers import get_help
+from cli_app.command_loader import load_command_tree
+from cli_app.command_manifest import CommandManifest
+from cli_app.command_metadata import extract_metadata, read_metadata
+
+def test_extract_metadata_reads_literal_assignments():
+    source = b'''
+import heavy_library
+
+description = "Converts things"
+aliases = ("conv", "c")
+background: bool = True
+cacheable = False
+
+def run(args):
+    pass
+'''
+    assert extract_metadata(source) == {
+        'description': "Converts things",
+        'aliases': ["conv", "c"],
+        'background': True,
+        'cacheable': False,
+    }
+
+def test_extract_metadata_skips_non_literals_and_wrong_types():
+    source = b'description = build_description()\naliases = [1, 2]\nbackground = "yes"\n'
+    assert extract_metadata(source) == {}
+
+def test_extract_metadata_uses_docstring():
+    assert extract_metadata(b'"""Shows a report.\n\nMore text."""\n') == {'description': "Shows a report."}
+
+def test_extract_metadata_tolerates_syntax_errors():
+    assert extract_metadata(b"def run(:\n") == {}
+
+def test_read_metadata_parses_each_content_once(tmp_path):
+    path = tmp_path / "command.py"
+    path.write_text('description = "Cached"\n')
+    manifest = CommandManifest()
+
+    assert read_metadata(str(path), manifest) == {'description': "Cached"}
+    os.utime(path, ns=(1, 1))
+    with patch("cli_app.command_metadata.extract_metadata") as extract:
+        assert read_metadata(str(path), manifest) == {'description': "Cached"}
+        extract.assert_not_called()
+
+    path.write_text('description = "Changed"\n')
+    assert read_metadata(str(path), manifest) == {'description': "Changed"}
+
+def test_metadata_is_read_on_demand_without_importing(tmp_path, monkeypatch):
+    folder = tmp_path / "tools"
+    folder.mkdir()
+    (folder / "__init__.py").write_text("")
+    (folder / "build.py").write_text('import not_installed_anywhere\ndescription = "Builds"\nbackground = True\n')
+    (folder / "clean.py").write_text('description = "From module"\n')
+    (tmp_path / "descriptions.json").write_text('{"tools": {"clean": {"description": "From file"}}}')
+    monkeypatch.chdir(tmp_path)
+
+    with patch("cli_app.command_index.read_metadata") as read:
+        _, commands = load_command_tree(".", "descriptions.json", [])
+        read.assert_not_called()
+
+    assert commands["tools"]["build"] == {'description': "Description for build not found"}
+    assert commands.details("tools", "build") == {'description': "Builds", 'background': True}
+    assert commands.details("tools", "clean") == {'description': "From file"}
+
+def test_help_shows_module_metadata(tmp_path, monkeypatch):
+    folder = tmp_path / "tools"
+    folder.mkdir()
+    (folder / "__init__.py").write_text("")
+    (folder / "build.py").write_text('description = "Builds"\naliases = ["b"]\nbackground = True\n')
+    monkeypatch.chdir(tmp_path)
+    manifest = CommandManifest(str(tmp_path / "manifest.json"))
+
+    _, commands = load_command_tree(".", "descriptions.json", [], manifest=manifest)
+    help_text = get_help(commands, None)
+
+    assert "Builds (aliases: b) [background]" in help_text
+    assert manifest.get_metadata(commands.command_paths[("tools", "build")])
+    assert not (tmp_path / "manifest.json").exists()
+
+def test_help_follows_edited_metadata(tmp_path, monkeypatch):
+    folder = tmp_path / "tools"
+    folder.mkdir()
+    (folder / "__init__.py").write_text("")
+    module = folder / "build.py"
+    module.write_text('description = "Builds"\n')
+    monkeypatch.chdir(tmp_path)
+
+    _, commands = load_command_tree(".", "descriptions.json", [], manifest=CommandManifest())
+    assert "Builds" in get_help(commands, None)
+
+    module.write_text('description = "Compiles everything"\n')
+    os.utime(module, ns=(1, 1))
+    assert "Compiles everything" in get_help(commands, None)
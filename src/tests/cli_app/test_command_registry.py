@@ -0,0 +1,61 @@
+import os
+import sys
+import pytest
+from unittest.mock import patch
+from cli_app.command_registry import CommandRegistry, command_registry
+from cli_app.command_runner import run_command
+
+@pytest.fixture
+def command_package(tmp_path, monkeypatch):
+    """
+    Creates an importable folder with a single command on sys.path.
+    """
+    package = tmp_path / "registry_folder"
+    package.mkdir()
+    (package / "__init__.py").touch()
+    (package / "greet.py").write_text("calls = []\ndef run(args = None):\n    calls.append(('v1', args))\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield package
+    command_registry.invalidate(folder="registry_folder")
+    for name in [name for name in sys.modules if name.startswith("registry_folder")]:
+        del sys.modules[name]
+
+def test_registry_resolves_run_once(command_package):
+    registry = CommandRegistry()
+    assert registry.get("registry_folder", "greet") is None
+
+    module = registry.load("registry_folder", "greet")
+    run = registry.register("registry_folder", "greet", module)
+
+    with patch("importlib.import_module", side_effect=AssertionError("imported again")):
+        assert registry.get("registry_folder", "greet") is run
+
+def test_registry_reloads_edited_command(command_package):
+    registry = CommandRegistry()
+    registry.register("registry_folder", "greet", registry.load("registry_folder", "greet"))
+
+    source = command_package / "greet.py"
+    source.write_text("calls = []\ndef run(args = None):\n    calls.append(('version 2', args))\n")
+    os.utime(source, ns=(1, 1))
+
+    assert registry.get("registry_folder", "greet") is None
+    module = registry.load("registry_folder", "greet")
+    registry.register("registry_folder", "greet", module)()
+    assert module.calls == [('version 2', None)]
+
+def test_registry_invalidate(command_package):
+    registry = CommandRegistry()
+    registry.register("registry_folder", "greet", registry.load("registry_folder", "greet"))
+    assert ("registry_folder", "greet") in registry
+
+    registry.invalidate(folder="registry_folder")
+    assert len(registry) == 0
+
+def test_run_command_uses_registry(command_package):
+    run_command("registry_folder", "greet", ["first"])
+
+    with patch("importlib.util.find_spec", side_effect=AssertionError("looked up again")):
+        run_command("registry_folder", "greet", ["second"])
+
+    module = sys.modules["registry_folder.greet"]
+    assert module.calls == [('v1', ['first']), ('v1', ['second'])]
@@ -0,0 +1,82 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from cli_app.command_runner import run_command
+from cli_app.command_stats import CommandStats, LatencyHistogram, command_stats, show_stats
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram(bounds=(0.01, 0.1, 1.0))
+    for _ in range(90):
+        histogram.observe(0.005)
+    for _ in range(10):
+        histogram.observe(0.5)
+
+    assert histogram.count == 100
+    assert histogram.percentile(0.5) <= 0.01
+    assert 0.1 < histogram.percentile(0.95) <= 0.5
+    assert histogram.percentile(0.99) <= 0.5
+    assert histogram.cumulative_counts() == [("0.01", 90), ("0.1", 90), ("1.0", 100), ("+Inf", 100)]
+
+def test_empty_histogram_has_no_percentile():
+    assert LatencyHistogram().percentile(0.5) is None
+
+def test_timed_counts_errors():
+    stats = CommandStats()
+    stats.record("tools", "build", "lookup", 0.0)
+    with pytest.raises(RuntimeError):
+        with stats.timed("tools", "build", "run"):
+            raise RuntimeError("boom")
+
+    assert stats.calls == {("tools", "build"): 1}
+    assert stats.errors == {("tools", "build"): 1}
+    assert stats.histogram("tools", "build", "run").count == 1
+
+@pytest.fixture
+def clean_stats():
+    """
+    Starts from empty global stats and resets them afterwards; conftest clears the registry.
+    """
+    command_stats.reset()
+    yield command_stats
+    command_stats.reset()
+
+def test_run_command_records_phases(clean_stats):
+    mock_module = MagicMock()
+    with patch("importlib.util.find_spec", return_value=True), \
+         patch("importlib.import_module", return_value=mock_module):
+        run_command("stats_folder", "timed_command", ["a"])
+        run_command("stats_folder", "timed_command", ["b"])
+
+    assert command_stats.calls[("stats_folder", "timed_command")] == 2
+    assert command_stats.histogram("stats_folder", "timed_command", "import").count == 1
+    assert command_stats.histogram("stats_folder", "timed_command", "run").count == 2
+    assert ("stats_folder", "timed_command") not in command_stats.errors
+
+def test_run_command_records_failures(clean_stats):
+    with patch("importlib.util.find_spec", return_value=None):
+        run_command("stats_folder", "missing_command")
+
+    assert command_stats.errors[("stats_folder", "missing_command")] == 1
+
+def test_openmetrics_dump(tmp_path):
+    stats = CommandStats()
+    stats.record("tools", 'say "hi"', "lookup", 0.0002)
+    stats.record("tools", 'say "hi"', "run", 0.003, failed=True)
+    path = tmp_path / "metrics" / "cli.prom"
+
+    assert show_stats(f"stats dump {path}", stats)
+
+    text = path.read_text()
+    assert 'cli_command_duration_seconds_bucket{folder="tools",command="say \\"hi\\"",phase="run",le="+Inf"} 1' in text
+    assert 'cli_command_calls_total{folder="tools",command="say \\"hi\\""} 1' in text
+    assert 'cli_command_errors_total{folder="tools",command="say \\"hi\\""} 1' in text
+    assert text.endswith("# EOF\n")
+
+def test_show_stats_table(capsys):
+    stats = CommandStats()
+    stats.record("tools", "build", "lookup", 0.0)
+    stats.record("tools", "build", "run", 0.002)
+    assert show_stats("stats", stats)
+
+    table = capsys.readouterr().out
+    assert "tools.build" in table
+    assert "0.0%" in table
@@ -0,0 +1,129 @@
+import io
+import logging
+import os
+import threading
+import pytest
+from unittest.mock import patch
+from cli_app.client import main as client_main, send_command
+from cli_app.command_index import CommandFolders
+from cli_app.daemon import CommandDaemon, decode_request, socket_in_use
+from cli_app.client import encode_request
+from cli_app.parallel_runner import output_capture
+
+commands = CommandFolders({
+    "commands": {"example": {"description": "Example"}, "report": {"description": "Report"}},
+    "log_project": {"example": {"description": "Example from log project"}},
+})
+
+def fake_run_command(folder, command, args=None):
+    print(f"{folder}.{command} {args}")
+    logging.getLogger("cli_app.command_runner").warning(f"ran {command}")
+    return command != "report" or args != ["fail"]
+
+@pytest.fixture
+def daemon(tmp_path):
+    socket_path = str(tmp_path / "cli.sock")
+    server = CommandDaemon(socket_path, commands)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    with patch("cli_app.daemon.run_command", side_effect=fake_run_command):
+        yield server
+    server.shutdown()
+    server.server_close()
+    thread.join(timeout=1)
+
+def run_client(daemon, argv, folder=None):
+    stdout, stderr = io.StringIO(), io.StringIO()
+    # pytest swaps sys.stdout between test phases, so the capture is installed while the test body runs, as serve_daemon does.
+    output_capture.install()
+    try:
+        code = send_command(argv, folder, daemon.socket_path, stdout, stderr)
+    finally:
+        output_capture.uninstall()
+    return code, stdout.getvalue(), stderr.getvalue()
+
+def test_request_round_trip():
+    assert decode_request(encode_request(["report", "a b", ""], "commands")[4:]) == ("commands", ["report", "a b", ""])
+    assert decode_request(encode_request(["report"])[4:]) == (None, ["report"])
+
+def test_daemon_streams_output_and_exit_code(daemon):
+    code, stdout, stderr = run_client(daemon, ["report", "two words"])
+
+    assert code == 0
+    assert stdout == "commands.report ['two words']\n"
+    assert "ran report" in stderr
+
+def test_daemon_reports_failures(daemon):
+    assert run_client(daemon, ["report", "fail"])[0] == 1
+    assert run_client(daemon, ["missing"])[0] == 2
+
+def test_daemon_needs_folder_for_ambiguous_commands(daemon):
+    assert run_client(daemon, ["example"])[0] == 2
+
+    code, stdout, _ = run_client(daemon, ["example"], folder="log_project")
+    assert code == 0
+    assert stdout == "log_project.example []\n"
+
+def test_daemon_serves_help(daemon):
+    code, stdout, _ = run_client(daemon, ["help", "log_project"])
+
+    assert code == 0
+    assert "log_project commands:" in stdout
+    assert "commands commands:" not in stdout
+
+def test_daemon_runs_builtins_and_parallel(daemon):
+    with patch("cli_app.parallel_runner.run_command", side_effect=fake_run_command):
+        code, stdout, _ = run_client(daemon, ["parallel", "report", "a", ";", "report", "b"], folder="commands")
+    assert code == 0
+    assert stdout == "commands.report ['a']\ncommands.report ['b']\n"
+
+    code, stdout, _ = run_client(daemon, ["jobs"])
+    assert code == 0 and "background jobs" in stdout.lower()
+
+    code, _, stderr = run_client(daemon, ["set_folder", "commands"])
+    assert code == 2 and "--folder" in stderr
+
+def test_concurrent_clients_keep_output_apart(daemon):
+    results = {}
+
+    def call(name):
+        results[name] = run_client(daemon, ["report", name])
+
+    threads = [threading.Thread(target=call, args=(f"client{index}",)) for index in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for name, (code, stdout, _) in results.items():
+        assert code == 0
+        assert stdout == f"commands.report ['{name}']\n"
+
+def test_socket_is_private_from_creation(tmp_path):
+    socket_path = str(tmp_path / "cli.sock")
+    umask = os.umask(0o022)
+    try:
+        server = CommandDaemon(socket_path, commands)
+        assert os.umask(0o022) == 0o022
+    finally:
+        os.umask(umask)
+    try:
+        assert os.stat(socket_path).st_mode & 0o777 == 0o600
+    finally:
+        server.server_close()
+
+def test_server_close_removes_socket_and_stale_socket_is_detected(tmp_path):
+    socket_path = str(tmp_path / "cli.sock")
+    server = CommandDaemon(socket_path, commands)
+    assert socket_in_use(socket_path)
+    server.server_close()
+    assert not os.path.exists(socket_path)
+
+    open(socket_path, 'w').close()
+    assert not socket_in_use(socket_path)
+    assert not os.path.exists(socket_path)
+
+def test_client_without_daemon(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("CLI_APP_SOCKET", str(tmp_path / "none.sock"))
+    assert client_main(["report"]) == 2
+    assert "Cannot reach the daemon" in capsys.readouterr().err
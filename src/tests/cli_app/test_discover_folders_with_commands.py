@@ -71,3 +71,20 @@ def test_nested_directories_with_init(tmp_path):
     (tmp_path / "nested" / "folder1" / "__init__.py").touch()
     result = discover_folders_with_commands(src_folder_with_commands=str(tmp_path))
     assert result == ["folder1"]
+
+def test_ignored_subtrees_are_pruned(tmp_path):
+    """
+    Tests that ignored folders and ignore patterns prune whole subtrees.
+    """
+    (tmp_path / "shared" / "validator").mkdir(parents=True)
+    (tmp_path / "shared" / "validator" / "__init__.py").touch()
+    (tmp_path / ".venv" / "package").mkdir(parents=True)
+    (tmp_path / ".venv" / "package" / "__init__.py").touch()
+    (tmp_path / "folder1").mkdir()
+    (tmp_path / "folder1" / "__init__.py").touch()
+
+    result = discover_folders_with_commands(src_folder_with_commands=str(tmp_path))
+    assert result == ["folder1"]
+
+    result = discover_folders_with_commands(src_folder_with_commands=str(tmp_path), ignore_these_folders=[], ignore_patterns=[".*", "folder*"])
+    assert result == ["validator"]
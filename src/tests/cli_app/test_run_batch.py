@@ -0,0 +1,68 @@
+import io
+from unittest.mock import patch
+from cli_app.batch_runner import BufferedOutput, read_batch, run_batch
+from cli_app.command_index import CommandFolders
+
+folders = ["commands", "log_project"]
+commands = CommandFolders({
+    "commands": {
+        "clear": { "description": "Clear the console screen" },
+        "example": { "description": "Prints a simple example message" }
+    },
+    "log_project": {
+        "example": { "description": "Prints a simple example message from log project" },
+        "report": { "description": "Prints a report" }
+    }
+})
+
+def fake_run_command(folder, command, args=None):
+    print(f"{folder}.{command} {args}")
+    return command != "clear"
+
+def test_read_batch_skips_blank_lines_and_comments(tmp_path):
+    batch_file = tmp_path / "batch.txt"
+    batch_file.write_text("# setup\n\nreport a\n  example  \n")
+    assert list(read_batch(str(batch_file))) == ["report a", "example"]
+
+def test_run_batch_success_buffers_output():
+    output = io.StringIO()
+    with patch("cli_app.batch_runner.run_command", side_effect=fake_run_command):
+        code = run_batch(["report a", "set_folder commands", "example"], folders, commands, output=output)
+
+    assert code == 0
+    assert output.getvalue() == "log_project.report ['a']\ncommands.example []\n"
+
+def test_run_batch_stops_at_first_failure():
+    output = io.StringIO()
+    with patch("cli_app.batch_runner.run_command", side_effect=fake_run_command) as mock_run_command:
+        code = run_batch(["clear", "report"], folders, commands, output=output)
+
+    assert code == 1
+    assert mock_run_command.call_count == 1
+
+def test_run_batch_keep_going_and_unresolved_commands():
+    output = io.StringIO()
+    with patch("cli_app.batch_runner.run_command", side_effect=fake_run_command) as mock_run_command:
+        code = run_batch(["example", "missing", "report", "exit", "report"], folders, commands, keep_going=True, output=output)
+
+    assert code == 1
+    assert mock_run_command.call_count == 1
+    assert output.getvalue() == "log_project.report []\n"
+
+def test_buffered_output_flushes_at_buffer_size():
+    stream = io.StringIO()
+    output = BufferedOutput(stream, buffer_size=10)
+    output.write("12345")
+    assert stream.getvalue() == ""
+    output.write("67890")
+    assert stream.getvalue() == "1234567890"
+    assert output.getvalue() == ""
+
+def test_run_batch_runs_builtins():
+    output = io.StringIO()
+    with patch("cli_app.batch_runner.run_command", side_effect=fake_run_command) as mock_run_command:
+        code = run_batch(["stats", "jobs", "kill 12345"], folders, commands, keep_going=True, output=output)
+
+    assert code == 1  # no job 12345 to kill
+    mock_run_command.assert_not_called()
+    assert "No background jobs." in output.getvalue()
@@ -0,0 +1,64 @@
+import sys
+import time
+import pytest
+from cli_app.command_index import CommandFolders
+from cli_app.command_registry import command_registry
+from cli_app.parallel_runner import is_parallel_input, output_capture, run_parallel, split_commands
+
+@pytest.fixture
+def parallel_commands(tmp_path, monkeypatch):
+    """
+    Creates an importable folder whose commands print, log and sleep.
+    """
+    package = tmp_path / "parallel_folder"
+    package.mkdir()
+    (package / "__init__.py").touch()
+    (package / "slow.py").write_text(
+        "import logging, time\n"
+        "def run(args = None):\n"
+        "    time.sleep(float(args[0]))\n"
+        "    logging.getLogger('parallel_folder').warning(f'slow {args[0]} done')\n"
+        "    print(f'slow {args[0]}')\n"
+    )
+    (package / "fail.py").write_text("def run(args = None):\n    raise RuntimeError('boom')\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield CommandFolders({"parallel_folder": {"slow": {"description": ""}, "fail": {"description": ""}}})
+    command_registry.invalidate(folder="parallel_folder")
+    for name in [name for name in sys.modules if name.startswith("parallel_folder")]:
+        del sys.modules[name]
+
+def test_split_commands():
+    assert split_commands("parallel a 1 ; b ;; c 'x;y'") == ["a 1", "b", "c 'x;y'"]
+    assert split_commands("parallel") == []
+    assert is_parallel_input("parallel a ; b")
+    assert not is_parallel_input("parallelize a")
+
+def test_run_parallel_prints_output_in_order(parallel_commands, capsys):
+    start = time.perf_counter()
+    ok = run_parallel("parallel slow 0.3 ; slow 0.0 ; slow 0.2", parallel_commands, workers=3)
+    elapsed = time.perf_counter() - start
+
+    assert ok
+    assert elapsed < 0.45
+    captured = capsys.readouterr()
+    assert captured.out == "slow 0.3\nslow 0.0\nslow 0.2\n"
+    assert captured.err.index("slow 0.3 done") < captured.err.index("slow 0.0 done") < captured.err.index("slow 0.2 done")
+    assert not output_capture.installed
+
+def test_run_parallel_reports_failures(parallel_commands, capsys):
+    assert not run_parallel("parallel slow 0 ; fail", parallel_commands)
+    assert "slow 0" in capsys.readouterr().out
+
+def test_run_parallel_unknown_command_runs_nothing(parallel_commands, capsys):
+    assert not run_parallel("parallel slow 0 ; missing", parallel_commands)
+    assert capsys.readouterr().out == ""
+
+def test_run_parallel_rejects_unknown_executor(parallel_commands):
+    with pytest.raises(ValueError):
+        run_parallel("parallel slow 0", parallel_commands, kind="fiber")
+
+def test_run_parallel_on_process_pool(parallel_commands, capsys):
+    assert run_parallel("parallel slow 0.1 ; slow 0", parallel_commands, kind="process", workers=2)
+    captured = capsys.readouterr()
+    assert captured.out == "slow 0.1\nslow 0\n"
+    assert "slow 0.1 done" in captured.err
@@ -0,0 +1,70 @@
+import io
+from unittest.mock import patch
+from cli_app.cli_helpers import build_help_lines, get_help, get_help_lines, show_help
+from cli_app.command_index import CommandFolders
+
+def make_folders():
+    return CommandFolders({
+        "editor": {"md_to_text": {"description": "Convert markdown"}},
+        "log_project": {
+            "project": {"description": "Add a project"},
+            "projects": {"description": "List projects"},
+            "task": {"description": "Add a task"},
+        },
+    })
+
+def test_help_lines_are_cached_per_version():
+    folders = make_folders()
+    first = get_help_lines(folders, None)
+
+    with patch("cli_app.cli_helpers.build_help_lines") as build:
+        assert get_help_lines(folders, None) is first
+        build.assert_not_called()
+
+def test_reindex_invalidates_cached_help():
+    folders = make_folders()
+    assert "new_command" not in get_help(folders, None)
+
+    folders["editor"]["new_command"] = {"description": "Fresh"}
+    folders.reindex()
+
+    assert "new_command" in get_help(folders, None)
+
+def test_help_entries_keep_a_space_before_the_dash():
+    lines = build_help_lines(make_folders(), None)
+
+    assert "  parallel cmd1 ; cmd2 - Run commands side by side" in lines
+    assert "  md_to_text          - Convert markdown" in lines
+
+def test_help_for_folder_lists_only_that_folder():
+    result = get_help(make_folders(), None, "editor")
+
+    assert "editor commands:" in result
+    assert "log_project commands:" not in result
+
+def test_help_for_prefix_lists_matching_commands():
+    lines = build_help_lines(make_folders(), None, "proj")
+
+    assert "log_project commands:" in lines
+    assert any(line.strip().startswith("projects") for line in lines)
+    assert not any(line.strip().startswith("task") for line in lines)
+    assert "editor commands:" not in lines
+
+def test_help_for_unknown_topic():
+    assert "No folder or command matches 'zzz'." in get_help(make_folders(), None, "zzz")
+
+def test_show_help_pages_until_stopped():
+    output = io.StringIO()
+    answers = iter([True, False])
+
+    show_help("help", make_folders(), None, page_size=5, output=output, ask_more=lambda: next(answers))
+
+    assert output.getvalue().count("\n") == 10
+
+def test_show_help_without_pager_writes_everything():
+    folders = make_folders()
+    output = io.StringIO()
+
+    show_help("help log_project", folders, None, page_size=2, output=output)
+
+    assert output.getvalue() == get_help(folders, None, "log_project") + "\n"
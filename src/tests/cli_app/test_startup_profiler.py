@@ -0,0 +1,60 @@
+import builtins
+import sys
+import shared.logger
+from cli_app.main import main
+from cli_app.startup_profiler import PROFILE_STARTUP_FLAG, StartupProfiler
+from shared.logger import get_console_handlers
+
+def test_profiler_disabled_by_default():
+    profiler = StartupProfiler()
+    with profiler.phase("discovery"):
+        pass
+    assert profiler.phases == {}
+
+def test_profiler_times_imports_and_phases(tmp_path, monkeypatch):
+    (tmp_path / "profiled_module.py").write_text("import profiled_child\n")
+    (tmp_path / "profiled_child.py").write_text("value = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    original_import = builtins.__import__
+    original_setup_logger = shared.logger.setup_logger
+    profiler = StartupProfiler()
+    profiler.enable()
+    try:
+        import profiled_module
+        with profiler.phase("discovery"):
+            pass
+        shared.logger.setup_logger("profiled_logger", {'log_to_file': False})
+    finally:
+        profiler.disable()
+        sys.modules.pop("profiled_module", None)
+        sys.modules.pop("profiled_child", None)
+
+    assert builtins.__import__ is original_import
+    assert shared.logger.setup_logger is original_setup_logger
+
+    imports = {name: (elapsed, self_time) for name, elapsed, self_time in profiler.imports}
+    assert "profiled_module" in imports and "profiled_child" in imports
+    assert imports["profiled_module"][0] >= imports["profiled_child"][0]
+    assert set(profiler.phases) == {"discovery", "logger setup"}
+
+    report = profiler.report()
+    assert "Phases (ms):" in report
+    assert "profiled_module" in report
+
+def test_batch_mode_prints_the_report_and_restores_imports(tmp_path, monkeypatch, capsys):
+    (tmp_path / "batch.txt").write_text("exit\n")
+    monkeypatch.chdir(tmp_path)
+    original_import = builtins.__import__
+    original_setup_logger = shared.logger.setup_logger
+    levels = {handler: handler.level for handler in get_console_handlers()}
+
+    try:
+        assert main([PROFILE_STARTUP_FLAG, "--batch", "batch.txt"]) == 0
+    finally:
+        for handler, level in levels.items():
+            handler.setLevel(level)
+
+    assert "Startup profile:" in capsys.readouterr().err
+    assert builtins.__import__ is original_import
+    assert shared.logger.setup_logger is original_setup_logger
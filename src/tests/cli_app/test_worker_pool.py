@@ -0,0 +1,105 @@
+import sys
+import time
+import pytest
+from cli_app.command_registry import command_registry
+from cli_app.command_runner import run_command
+from cli_app.worker_pool import WorkerPool, kill_job
+
+@pytest.fixture
+def background_commands(tmp_path, monkeypatch):
+    """
+    Creates an importable folder with background commands that record the worker pid.
+    """
+    package = tmp_path / "background_folder"
+    package.mkdir()
+    (package / "__init__.py").touch()
+    (package / "record.py").write_text(
+        "import os, time\n"
+        "background = True\n"
+        "def run(args = None):\n"
+        "    time.sleep(float(args[1]))\n"
+        "    with open(args[0], 'a') as f:\n"
+        "        f.write(f'{os.getpid()}\\n')\n"
+    )
+    (package / "fail.py").write_text("background = True\ndef run(args = None):\n    raise RuntimeError('boom')\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield tmp_path
+    command_registry.invalidate(folder="background_folder")
+    for name in [name for name in sys.modules if name.startswith("background_folder")]:
+        del sys.modules[name]
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+def test_worker_pool_reuses_a_bounded_set_of_processes(background_commands):
+    pool = WorkerPool(size=1)
+    output = str(background_commands / "pids.txt")
+    try:
+        first = pool.submit("background_folder", "record", [output, "0.1"])
+        second = pool.submit("background_folder", "record", [output, "0"])
+        assert second.status == 'queued'
+
+        assert wait_for(lambda: first.status == 'done' and second.status == 'done')
+        assert pool.process_count() == 1
+    finally:
+        pool.shutdown()
+
+    pids = open(output).read().split()
+    assert len(pids) == 2 and pids[0] == pids[1]
+
+def test_worker_pool_kill_replaces_worker(background_commands):
+    pool = WorkerPool(size=1)
+    output = str(background_commands / "pids.txt")
+    try:
+        slow = pool.submit("background_folder", "record", [output, "30"])
+        queued = pool.submit("background_folder", "record", [output, "0"])
+        old_pid = slow.pid
+
+        assert kill_job(f"kill {slow.id}", pool)
+        assert slow.status == 'killed'
+        assert not kill_job(f"kill {slow.id}", pool)
+
+        assert wait_for(lambda: queued.status == 'done')
+        assert queued.pid != old_pid
+        assert pool.process_count() == 1
+    finally:
+        pool.shutdown()
+
+def test_worker_pool_reports_failures(background_commands):
+    pool = WorkerPool(size=1)
+    try:
+        job = pool.submit("background_folder", "fail", [])
+        assert wait_for(lambda: job.status == 'failed')
+        assert "boom" in job.error
+    finally:
+        pool.shutdown()
+
+def test_run_command_submits_background_commands(background_commands, monkeypatch):
+    pool = WorkerPool(size=1)
+    monkeypatch.setattr("cli_app.worker_pool.worker_pool", pool)
+    output = str(background_commands / "pids.txt")
+    try:
+        assert run_command("background_folder", "record", [output, "0"])
+        assert wait_for(lambda: pool.list_jobs()[0].status == 'done')
+    finally:
+        pool.shutdown()
+
+def test_worker_pool_registers_one_exit_hook_across_restarts(background_commands, monkeypatch):
+    hooks = []
+    monkeypatch.setattr("cli_app.worker_pool.atexit.register", hooks.append)
+    pool = WorkerPool(size=1)
+    output = str(background_commands / "pids.txt")
+    try:
+        for _ in range(2):
+            job = pool.submit("background_folder", "record", [output, "0"])
+            assert wait_for(lambda: job.status == 'done')
+            pool.shutdown()
+    finally:
+        pool.shutdown()
+
+    assert hooks == [pool.shutdown]
@@ -0,0 +1,30 @@
+from shared.jsonl_log import replay_jsonl
+
+def test_torn_tail_is_cut_off(tmp_path, caplog):
+    path = tmp_path / "log.jsonl"
+    path.write_text('{"n": 1}\n[1]\n{"n": 2')
+    entries = []
+
+    replay_jsonl(str(path), lambda entry: entries.append(entry['n']))
+
+    assert entries == [1]
+    assert "unreadable line 2" in caplog.text and "unreadable line 3" in caplog.text
+    assert path.read_text() == '{"n": 1}\n[1]\n'
+
+def test_last_line_without_newline_is_completed(tmp_path):
+    path = tmp_path / "log.jsonl"
+    path.write_text('{"n": 1}')
+    entries = []
+
+    replay_jsonl(str(path), lambda entry: entries.append(entry['n']))
+
+    assert entries == [1]
+    assert path.read_text() == '{"n": 1}\n'
+
+def test_without_repair_the_file_is_left_alone(tmp_path):
+    path = tmp_path / "log.jsonl"
+    path.write_text('{"n": 1}\n{"n": 2')
+
+    replay_jsonl(str(path), lambda entry: None, repair=False)
+
+    assert path.read_text() == '{"n": 1}\n{"n": 2'
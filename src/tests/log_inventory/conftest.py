@@ -0,0 +1,8 @@
+import pytest
+from log_inventory.lib.inventory_backend import open_inventory
+
+# An empty inventory on each backend; test modules that need more override it and request it by the same name
+@pytest.fixture(params=["inventory.db", "inventory.json"])
+def inventory(request, tmp_path):
+    with open_inventory(str(tmp_path / request.param)) as inventory:
+        yield inventory
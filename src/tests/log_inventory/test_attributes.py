@@ -0,0 +1,101 @@
+import sqlite3
+import pytest
+from log_inventory.lib import script
+from log_inventory.lib.attributes import AttributeIndex, RangeTerm, parse_number, split_range_terms, typed_value
+from log_inventory.lib.sqlite_inventory import SqliteInventory
+
+PARTS = {
+    "Resistor 4k7": {'resistance': "4k7", 'quantity': "3"},
+    "Resistor 10k": {'resistance': "10k", 'quantity': "40"},
+    "ATmega328P": {'voltage': "5V", 'quantity': "1", 'package': "DIP-28"},
+    "ESP32": {'voltage': "3.3V", 'quantity': "8"},
+    "NE555 Timer": {'voltage': "4.5-16V", 'quantity': "4", 'package': "DIP-8"},
+    "Capacitor": {'capacitance': "100nF", 'quantity': "a few"},
+}
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("12", (12.0, None)),
+        ("4.7k", (4700.0, None)),
+        ("4k7", (4700.0, None)),
+        ("4R7", (4.7, 'ohm')),
+        ("10 kΩ", (10000.0, 'ohm')),
+        ("3.3V", (3.3, 'v')),
+        ("500mA", (0.5, 'a')),
+        ("16MHz", (16e6, 'hz')),
+        ("4.5-16V", None),
+        ("DIP-8", None),
+    ],
+)
+def test_parse_number(text, expected):
+    parsed = parse_number(text)
+    assert parsed == expected if expected is None else parsed == (pytest.approx(expected[0]), expected[1])
+
+def test_typed_value_checks_declared_units():
+    assert typed_value("quantity", "12") == 12
+    assert typed_value("quantity", "1.5") is None
+    assert typed_value("voltage", "3.3V") == pytest.approx(3.3)
+    assert typed_value("voltage", "500mA") is None
+    assert typed_value("Weight", "12g") is None
+    assert typed_value("Weight", "12") == 12
+
+def test_split_range_terms():
+    terms, rest = split_range_terms("resistor quantity<5 voltage=3.3..5 resistance>=4k7 key=package quantity<lots")
+
+    assert terms == [
+        RangeTerm('quantity', None, 5.0, high_inclusive=False),
+        RangeTerm('voltage', pytest.approx(3.3), 5.0),
+        RangeTerm('resistance', 4700.0, None),
+    ]
+    assert rest == "resistor key=package quantity<lots"
+
+def test_attribute_index_updates_and_ranges():
+    index = AttributeIndex()
+    for part_name, details in PARTS.items():
+        index.add(part_name, details)
+    index.add("ESP32", {'voltage': "3.3V", 'quantity': "2"})
+    index.remove("ATmega328P")
+
+    assert index.range(RangeTerm('quantity', None, 4, high_inclusive=False)) == [("ESP32", 2.0), ("Resistor 4k7", 3.0)]
+    assert index.range(RangeTerm('quantity', 3, 4)) == [("Resistor 4k7", 3.0), ("NE555 Timer", 4.0)]
+    assert index.range(RangeTerm('quantity', 40, None, low_inclusive=False)) == []
+    assert index.range(RangeTerm('missing', None, None)) == []
+
+@pytest.fixture
+def inventory(inventory):
+    inventory.upsert_many(PARTS.items())
+    return inventory
+
+def test_backends_answer_range_and_low_stock_queries(inventory):
+    assert inventory.low_stock() == [("ATmega328P", 1.0), ("Resistor 4k7", 3.0), ("NE555 Timer", 4.0)]
+    assert [name for name, _ in inventory.range_query(RangeTerm('voltage', 3.3, 5))] == ["ESP32", "ATmega328P"]
+    assert inventory.find("resistance>=4.7k quantity<10") == ["Resistor 4k7"]
+    assert inventory.find("key=package value=DIP* quantity<=1") == ["ATmega328P"]
+    assert inventory.find("capacitance<1u") == ["Capacitor"]
+
+    inventory["ESP32"] = {'voltage': "3.3V", 'quantity': "0"}
+    del inventory["ATmega328P"]
+    assert inventory.low_stock(2) == [("ESP32", 0.0)]
+
+def test_sqlite_fills_attributes_for_an_existing_database(tmp_path):
+    path = str(tmp_path / "inventory.db")
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE parts (name TEXT PRIMARY KEY, details TEXT NOT NULL) WITHOUT ROWID")
+    connection.execute("INSERT INTO parts VALUES ('LED', '{\"quantity\": \"2\"}')")
+    connection.commit()
+    connection.close()
+
+    with SqliteInventory(path) as inventory:
+        assert inventory.low_stock() == [("LED", 2.0)]
+
+def test_low_stock_report(inventory, capsys):
+    script.low_stock_report(inventory, threshold=2)
+    script.low_stock_report(inventory, threshold=0)
+
+    assert capsys.readouterr().out.splitlines() == [
+        "",
+        "Low stock (quantity below 2):",
+        "  ATmega328P: 1",
+        "No parts with a quantity below 0.",
+    ]
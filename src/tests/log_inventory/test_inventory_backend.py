@@ -0,0 +1,105 @@
+import io
+import json
+import pytest
+from log_inventory.lib import script
+from log_inventory.lib.inventory_backend import InventoryBackend, iter_csv_parts, iter_json_parts, open_inventory
+from log_inventory.lib.inventory_store import InventoryStore
+from log_inventory.lib.sqlite_inventory import SqliteInventory
+
+PARTS = {
+    "LED": {'color': "red", 'quantity': "12"},
+    "Resistor 10k": {'resistance': "10k"},
+    "Servo \"SG90\"": {},
+}
+
+def test_open_inventory_picks_the_backend(inventory):
+    expected = SqliteInventory if inventory.path.endswith(".db") else InventoryStore
+    assert type(inventory) is expected
+
+def test_mapping_and_bulk_upserts(inventory):
+    assert inventory.upsert_many(PARTS.items(), batch_size=2) == 3
+    inventory["LED"] = {'color': "green"}
+    del inventory["Resistor 10k"]
+
+    assert len(inventory) == 2 and "LED" in inventory and "Resistor 10k" not in inventory
+    assert inventory["LED"] == {'color': "green"}
+    assert inventory.search("green") == ["LED"]
+    with pytest.raises(KeyError):
+        del inventory["Resistor 10k"]
+
+def test_pages(inventory):
+    inventory.upsert_many((f"Part {index:03d}", {'index': str(index)}) for index in range(25))
+
+    pages = list(inventory.pages(10))
+
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert sorted(part_name for page in pages for part_name, _ in page) == [f"Part {index:03d}" for index in range(25)]
+
+def test_export_and_import_round_trip(inventory, tmp_path):
+    inventory.upsert_many(PARTS.items())
+    export_path = str(tmp_path / "export.json")
+
+    assert inventory.export_json(export_path, page_size=2) == 3
+    with open(export_path) as f:
+        assert json.load(f) == PARTS
+
+    with open_inventory(str(tmp_path / "copy.db")) as copy:
+        assert copy.import_file(export_path) == 3
+        assert dict(copy) == PARTS
+
+def test_import_csv(inventory, tmp_path):
+    path = tmp_path / "catalog.csv"
+    path.write_text("Package,Part,Quantity\nDIP-8,NE555,4\n,,\nTO-92,BC547,\n")
+
+    assert inventory.import_file(str(path)) == 2
+    assert inventory["NE555"] == {'Package': "DIP-8", 'Quantity': "4"}
+    assert inventory["BC547"] == {'Package': "TO-92"}
+
+def test_iter_json_parts_reads_across_chunks():
+    text = json.dumps({f"Part {index}": {'value': index * 1000, 'note': "x" * index} for index in range(50)}, indent=2)
+
+    parts = list(iter_json_parts(io.StringIO(text), chunk_size=7))
+
+    assert parts == list(json.loads(text).items())
+    assert list(iter_json_parts(io.StringIO(" { } "))) == []
+
+@pytest.mark.parametrize("text", ['["LED"]', '{"LED": [1]}', '{"LED": {} "Servo": {}}', '{"LED": {'])
+def test_iter_json_parts_rejects_malformed_input(text):
+    with pytest.raises(ValueError):
+        list(iter_json_parts(io.StringIO(text), chunk_size=4))
+
+def test_iter_csv_parts_uses_the_first_column_without_a_name_column():
+    assert list(iter_csv_parts(io.StringIO("Model,Voltage\nESP32,3.3V\n"))) == [("ESP32", {'Voltage': "3.3V"})]
+
+def test_view_inventory_pages(monkeypatch, capsys):
+    answers = iter(["", "q"])
+    monkeypatch.setattr("builtins.input", lambda _: next(answers))
+    inventory = {f"Part {index}": {} for index in range(7)}
+
+    script.view_inventory(inventory, page_size=2)
+
+    output = capsys.readouterr().out
+    assert "Part 3:" in output and "Part 4:" not in output
+
+def test_main_imports_and_exports(tmp_path, capsys):
+    source = tmp_path / "parts.json"
+    source.write_text(json.dumps(PARTS))
+    database = str(tmp_path / "inventory.sqlite")
+
+    script.main(["--file", database, "--import", str(source), "--export", str(tmp_path / "out.json")])
+
+    assert capsys.readouterr().out.splitlines() == [
+        f"Imported 3 part(s) from {source}.",
+        f"Exported 3 part(s) to {tmp_path / 'out.json'}.",
+    ]
+    assert json.loads((tmp_path / "out.json").read_text()) == PARTS
+
+def test_backends_must_implement_queries():
+    class PartialInventory(InventoryBackend):
+        __getitem__ = __setitem__ = __delitem__ = __iter__ = __len__ = None
+
+        def search(self, query):
+            return []
+
+    with pytest.raises(TypeError, match="range_query"):
+        PartialInventory()
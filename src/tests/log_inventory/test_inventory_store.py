@@ -0,0 +1,107 @@
+import json
+from log_inventory.lib import script
+from log_inventory.lib.inventory_store import InventoryStore
+
+def test_edits_append_to_the_log_and_reload(tmp_path):
+    path = str(tmp_path / "inventory.json")
+    with InventoryStore(path) as store:
+        store["LED"] = {'color': "red"}
+        store["Resistor"] = {'value': "10k"}
+        store["LED"] = {'color': "green"}
+        del store["Resistor"]
+
+    with open(f"{path}.log") as f:
+        assert [json.loads(line)['part'] for line in f] == ["LED", "Resistor", "LED", "Resistor"]
+    with InventoryStore(path) as reopened:
+        assert dict(reopened) == {"LED": {'color': "green"}}
+
+def test_torn_last_line_is_skipped(tmp_path, caplog):
+    path = str(tmp_path / "inventory.json")
+    with InventoryStore(path) as store:
+        store["LED"] = {'color': "red"}
+    with open(f"{path}.log", 'a') as f:
+        f.write('{"part": "Servo", "deta')
+
+    with InventoryStore(path) as reopened:
+        assert dict(reopened) == {"LED": {'color': "red"}}
+        reopened["Servo"] = {'angle': "180"}
+    assert "unreadable line 2" in caplog.text
+
+    caplog.clear()
+    with InventoryStore(path) as reopened:
+        assert dict(reopened) == {"LED": {'color': "red"}, "Servo": {'angle': "180"}}
+    assert "unreadable line" not in caplog.text
+
+def test_failed_append_leaves_the_store_unchanged(tmp_path, monkeypatch):
+    path = str(tmp_path / "inventory.json")
+    with InventoryStore(path) as store:
+        store["LED"] = {'color': "red"}
+
+        def fail(*entries):
+            raise OSError("disk full")
+        monkeypatch.setattr(store, "_append", fail)
+        for edit in (lambda: store.__setitem__("Servo", {'color': "red"}), lambda: store.__delitem__("LED")):
+            try:
+                edit()
+            except OSError:
+                pass
+        assert dict(store) == {"LED": {'color': "red"}}
+        assert store.search("red") == ["LED"]
+
+def test_compaction_folds_the_log_into_the_snapshot(tmp_path):
+    path = str(tmp_path / "inventory.json")
+    with InventoryStore(path, compact_threshold=200, sync=False) as store:
+        for index in range(50):
+            store[f"Part {index % 10}"] = {'quantity': str(index)}
+        store.compact()
+        store["Extra"] = {'quantity': "1"}
+
+    with open(path) as f:
+        snapshot = json.load(f)
+    assert snapshot["Part 9"] == {'quantity': "49"}
+    assert not (tmp_path / "inventory.json.log.compacting").exists()
+    with InventoryStore(path) as reopened:
+        assert len(reopened) == 11 and reopened["Extra"] == {'quantity': "1"}
+
+def test_compaction_after_a_failed_snapshot_keeps_the_rotated_entries(tmp_path, monkeypatch):
+    path = str(tmp_path / "inventory.json")
+    with InventoryStore(path, sync=False) as store:
+        store["LED"] = {'color': "red"}
+        with monkeypatch.context() as patched:
+            patched.setattr("log_inventory.lib.inventory_store.write_snapshot", lambda *args: (_ for _ in ()).throw(OSError("disk full")))
+            store.compact()
+        assert (tmp_path / "inventory.json.log.compacting").exists()
+        store["Servo"] = {'angle': "180"}
+        store.compact()
+        store["Fan"] = {}
+
+    assert not (tmp_path / "inventory.json.log.compacting").exists()
+    with open(path) as f:
+        assert json.load(f) == {"LED": {'color': "red"}, "Servo": {'angle': "180"}}
+    with InventoryStore(path) as reopened:
+        assert dict(reopened) == {"LED": {'color': "red"}, "Servo": {'angle': "180"}, "Fan": {}}
+
+def test_interrupted_compaction_is_finished_on_load(tmp_path):
+    path = str(tmp_path / "inventory.json")
+    with open(path, 'w') as f:
+        json.dump({"LED": {'color': "red"}}, f)
+    with open(f"{path}.log.compacting", 'w') as f:
+        f.write(json.dumps({'part': "LED", 'details': {'color': "blue"}}) + "\n")
+    with open(f"{path}.log", 'w') as f:
+        f.write(json.dumps({'part': "Servo", 'details': {}}) + "\n")
+
+    with InventoryStore(path) as store:
+        assert dict(store) == {"LED": {'color': "blue"}, "Servo": {}}
+    assert not (tmp_path / "inventory.json.log.compacting").exists()
+    with open(path) as f:
+        assert json.load(f)["LED"] == {'color': "blue"}
+
+def test_add_part_updates_the_store(tmp_path, monkeypatch):
+    answers = iter(["LED", "color", "red", ""])
+    monkeypatch.setattr("builtins.input", lambda _: next(answers))
+    path = str(tmp_path / "inventory.json")
+
+    with InventoryStore(path) as store:
+        assert script.add_part(store) is store
+    with InventoryStore(path) as reopened:
+        assert reopened["LED"] == {'color': "red"}
@@ -0,0 +1,122 @@
+import json
+import time
+import pytest
+from log_inventory.lib import script
+from log_inventory.lib.attributes import RangeTerm
+from log_inventory.lib.inventory_backend import open_inventory
+from log_inventory.lib.save_manager import SaveManager
+
+@pytest.fixture
+def backend(inventory, monkeypatch):
+    backend = inventory
+    backend.batches = []
+    upsert_many = backend.upsert_many
+
+    def record_batches(parts, batch_size=1000):
+        parts = list(parts)
+        count = upsert_many(parts, batch_size)
+        backend.batches.append(parts)
+        return count
+
+    monkeypatch.setattr(backend, "upsert_many", record_batches)
+    return backend
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+def test_edits_are_written_as_one_batch_after_an_idle_window(backend):
+    manager = SaveManager(backend, delay=0.1)
+    for index in range(5):
+        manager[f"Part {index}"] = {'quantity': str(index)}
+    manager["Part 0"] = {'quantity': "10"}
+
+    assert backend.batches == [] and "Part 0" not in backend
+    assert manager["Part 0"] == {'quantity': "10"} and "Part 4" in manager
+
+    assert wait_for(lambda: backend.batches)
+    assert len(backend.batches) == 1 and len(backend.batches[0]) == 5
+    assert backend["Part 0"] == {'quantity': "10"}
+
+def test_reads_over_many_parts_flush_first(backend):
+    manager = SaveManager(backend, delay=60)
+    manager["LED"] = {'quantity': "2"}
+
+    assert manager.range_query(RangeTerm('quantity', None, 5)) == [("LED", 2.0)]
+    assert manager.find("led") == ["LED"]
+    assert len(backend.batches) == 1
+
+def test_deletes_and_close(backend):
+    backend["Servo"] = {}
+    manager = SaveManager(backend, delay=60)
+    del manager["Servo"]
+    manager["LED"] = {'color': "red"}
+
+    assert "Servo" not in manager
+    with pytest.raises(KeyError):
+        manager["Servo"]
+    with pytest.raises(KeyError):
+        del manager["Missing"]
+
+    path = backend.path
+    manager.close()
+    with open_inventory(path) as reopened:
+        assert dict(reopened) == {"LED": {'color': "red"}}
+
+def test_deletes_are_written_as_one_batch(backend, monkeypatch):
+    backend.upsert_many((f"Part {index}", {}) for index in range(5))
+    delete_many = backend.delete_many
+    deleted = []
+
+    def record_deletes(part_names, batch_size=1000):
+        part_names = list(part_names)
+        deleted.append(part_names)
+        return delete_many(part_names, batch_size)
+
+    monkeypatch.setattr(backend, "delete_many", record_deletes)
+    manager = SaveManager(backend, delay=60)
+    for index in range(3):
+        del manager[f"Part {index}"]
+
+    assert manager.flush() == 3
+    assert deleted == [["Part 0", "Part 1", "Part 2"]]
+    assert sorted(backend) == ["Part 3", "Part 4"]
+
+def test_failed_flush_keeps_the_edits(backend, monkeypatch):
+    backend["Servo"] = {}
+    manager = SaveManager(backend, delay=60)
+    manager["LED"] = {'color': "red"}
+    del manager["Servo"]
+
+    with monkeypatch.context() as patched:
+        patched.setattr(backend, "delete_many", lambda *args: (_ for _ in ()).throw(OSError("disk full")))
+        with pytest.raises(OSError):
+            manager.flush()
+    assert "Servo" not in manager and manager["LED"] == {'color': "red"}
+
+    assert manager.flush() == 2
+    assert dict(backend) == {"LED": {'color': "red"}}
+
+def test_menu_session_saves_on_exit(tmp_path, monkeypatch):
+    path = str(tmp_path / "inventory.json")
+    answers = iter(["1", "LED", "color", "red", "", "1", "Servo", "", "5"])
+    monkeypatch.setattr("builtins.input", lambda _: next(answers))
+
+    script.main(["--file", path])
+
+    with open_inventory(path) as reopened:
+        assert dict(reopened) == {"LED": {'color': "red"}, "Servo": {}}
+    with open(f"{path}.log") as f:
+        assert len(f.readlines()) == 2
+
+def test_save_inventory_replaces_the_file_atomically(tmp_path, monkeypatch):
+    path = tmp_path / "inventory.json"
+    path.write_text("{}")
+    monkeypatch.setattr(script, "INVENTORY_FILE", str(path))
+
+    script.save_inventory({"LED": {'color': "red"}})
+
+    assert json.loads(path.read_text()) == {"LED": {'color': "red"}}
+    assert [file.name for file in tmp_path.iterdir()] == ["inventory.json"]
@@ -0,0 +1,60 @@
+from log_inventory.lib.inventory_store import InventoryStore
+from log_inventory.lib.search_index import SearchIndex, tokenize
+
+def sample_index():
+    index = SearchIndex()
+    index.add("Resistor 10k", {'resistance': "10k", 'package': "THT"})
+    index.add("ATmega328P", {'package': "DIP-28", 'voltage': "5V"})
+    index.add("NE555 Timer", {'package': "DIP-8", 'voltage': "4.5-16V"})
+    index.add("ESP32", {'voltage': "3.3V", 'module': "WROOM"})
+    return index
+
+def test_tokenize_keeps_dotted_numbers():
+    assert tokenize("ESP32 3.3V DIP-8") == ["esp32", "3.3v", "dip", "8"]
+
+def test_plain_terms_match_names_keys_and_values():
+    index = sample_index()
+
+    assert index.search("resistor 10k") == ["Resistor 10k"]
+    assert index.search("voltage") == ["ATmega328P", "ESP32", "NE555 Timer"]
+    assert index.search("wroom") == ["ESP32"]
+    assert index.search("dip timer") == ["NE555 Timer"]
+    assert index.search("at*") == ["ATmega328P"]
+    assert index.search("") == [] and index.search("missing") == []
+
+def test_key_and_value_filters():
+    index = sample_index()
+
+    assert index.search("key=package value=DIP*") == ["ATmega328P", "NE555 Timer"]
+    assert index.search("key=voltage value=DIP*") == []
+    assert index.search("key=module") == ["ESP32"]
+    assert index.search("value=3.3v") == ["ESP32"]
+    assert index.search('key=package value="DIP-8"') == ["NE555 Timer"]
+
+def test_updates_replace_and_remove_entries():
+    index = sample_index()
+    index.add("ESP32", {'voltage': "5V"})
+    index.remove("NE555 Timer")
+
+    assert index.search("wroom") == [] and index.search("timer") == []
+    assert index.search("key=voltage value=5v") == ["ATmega328P", "ESP32"]
+    assert len(index) == 3
+
+def test_store_keeps_the_index_current(tmp_path):
+    path = str(tmp_path / "inventory.json")
+    with InventoryStore(path) as store:
+        store["LED"] = {'color': "red"}
+        store["Servo"] = {'torque': "1.8kg"}
+        del store["Servo"]
+        assert store.search("red") == ["LED"] and store.search("servo") == []
+
+    with InventoryStore(path) as reopened:
+        assert reopened.search("key=color") == ["LED"]
+
+def test_search_on_a_large_index():
+    index = SearchIndex()
+    for number in range(20000):
+        index.add(f"Part {number}", {'package': "DIP-8" if number % 100 == 0 else "SMD", 'value': f"{number % 977}k"})
+
+    results = index.search("key=package value=DIP*")
+    assert results == sorted(f"Part {number}" for number in range(0, 20000, 100))
@@ -0,0 +1,65 @@
+from datetime import date
+from urllib.parse import urlparse
+import pytest
+from log_project.lib.model.project import Project
+from log_project.lib.model.status import Status
+
+def make_project(**fields):
+    data = {
+        'id': 7,
+        'name': "Project Alpha",
+        'description': "A project about alpha things",
+        'repo_link': "https://github.com/example/alpha",
+        'status': "Completed",
+        'start_date': "2024-01-01",
+        'end_date': "2024-03-15",
+    }
+    data.update(fields)
+    return Project.from_dict(data)
+
+def test_project_has_no_instance_dict():
+    project = make_project()
+
+    assert not hasattr(project, '__dict__')
+    with pytest.raises(AttributeError):
+        project.priority = 1
+
+def test_fields_read_back_as_before():
+    project = make_project()
+
+    assert project.repo_link == urlparse("https://github.com/example/alpha")
+    assert project.status == "Completed"
+    assert project.start_date == date(2024, 1, 1)
+    assert project.end_date == date(2024, 3, 15)
+
+def test_to_dict_and_repr():
+    project = make_project()
+
+    assert project.to_dict() == {
+        'id': 7,
+        'name': "Project Alpha",
+        'description': "A project about alpha things",
+        'repo_link': "https://github.com/example/alpha",
+        'status': "Completed",
+        'start_date': "2024-01-01",
+        'end_date': "2024-03-15",
+    }
+    assert repr(project) == (
+        "Project(id=7), name=Project Alpha, description=A project about alpha things, "
+        "repo_link=https://github.com/example/alpha, status=Completed, start_date=2024-01-01, end_date=2024-03-15)"
+    )
+
+def test_optional_fields_stay_empty():
+    project = Project(1, "Bare project", "Nothing optional here")
+
+    assert project.to_dict()['repo_link'] is None
+    assert project.status is None and project.start_date is None and project.end_date is None
+
+def test_status_reads_back_as_given():
+    project = Project(1, "Enum status", "Status given as an enum member", status=Status.ON_HOLD)
+    assert project.status is Status.ON_HOLD
+    assert project.to_dict()['status'] is Status.ON_HOLD
+    assert "status=Status.ON_HOLD" in repr(project)
+
+    project.status = "On Hold"
+    assert project.status == "On Hold"
@@ -0,0 +1,72 @@
+from datetime import date
+import pytest
+from log_project.lib.model.project import Project, ProjectColumns
+
+def record(id=1, **fields):
+    data = {
+        'id': id,
+        'name': "Project Alpha",
+        'description': "A project about alpha things",
+        'repo_link': "https://github.com/example/alpha",
+        'status': "In Progress",
+        'start_date': "2024-01-01",
+        'end_date': "2024-02-01",
+    }
+    data.update(fields)
+    return data
+
+def test_from_records_matches_from_dict():
+    records = [record(index, name=f"Project {index}", status="Completed" if index % 2 else "On Hold") for index in range(50)]
+
+    loaded = Project.from_records(records)
+
+    assert [project.to_dict() for project in loaded] == [Project.from_dict(data).to_dict() for data in records]
+
+def test_from_records_accepts_date_objects_and_missing_optionals():
+    records = [{'id': 3, 'name': "Bare project", 'description': "Nothing optional here", 'start_date': date(2024, 5, 1)}]
+
+    project = Project.from_records(records)[0]
+
+    assert project.start_date == date(2024, 5, 1)
+    assert project.repo_link is None and project.status is None and project.end_date is None
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {'id': -1},
+        {'name': ""},
+        {'description': None},
+        {'name': "Bad@Name"},
+        {'description': "short"},
+        {'repo_link': "not a link"},
+        {'status': "Done"},
+        {'start_date': "01/02/2024"},
+        {'end_date': "2023-12-31"},
+        {'name': "", 'status': "Done"},
+    ],
+)
+def test_from_records_reports_the_same_error_as_from_dict(fields):
+    data = record(**fields)
+    with pytest.raises(ValueError) as expected:
+        Project.from_dict(data)
+
+    errors = {}
+    assert Project.from_records([record(), data], errors=errors) and errors == {1: str(expected.value)}
+
+    with pytest.raises(ValueError, match="^Record 1: "):
+        Project.from_records([record(), data])
+
+def test_from_records_columns():
+    table = Project.from_records([record(1), record(2, status="Completed")], columns=True)
+
+    assert isinstance(table, ProjectColumns)
+    assert len(table) == 2
+    assert table.id == [1, 2]
+    assert table.status == ["In Progress", "Completed"]
+    assert table.row(1).to_dict() == Project.from_dict(record(2, status="Completed")).to_dict()
+
+def test_from_records_reuses_parsed_values():
+    projects = Project.from_records([record(1), record(2)])
+
+    assert projects[0].repo_link is projects[1].repo_link
+    assert projects[0].start_date == projects[1].start_date == date(2024, 1, 1)
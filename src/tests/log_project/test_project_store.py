@@ -0,0 +1,125 @@
+from datetime import date
+import json
+import pytest
+from log_project.lib.model.project import Project
+from log_project.lib.project_store import ProjectStore
+
+def make_project(id, status="In Progress", start="2024-01-01", end=None):
+    return Project.from_dict({
+        'id': id,
+        'name': f"Project {id}",
+        'description': "A project for the store tests",
+        'status': status,
+        'start_date': start,
+        'end_date': end,
+    })
+
+def test_put_get_and_reopen(tmp_path):
+    path = tmp_path / "projects.jsonl"
+    with ProjectStore(str(path)) as store:
+        store.put(make_project(1))
+        store.put(make_project(2, status="Completed"))
+        store.put(make_project(1, status="On Hold"))
+        assert store.delete(2) and not store.delete(2)
+
+    with ProjectStore(str(path)) as reopened:
+        assert len(reopened) == 1 and 2 not in reopened
+        assert reopened.get(1).status == "On Hold"
+        assert reopened.by_status("In Progress") == [] and reopened.by_status("Completed") == []
+        assert [project.id for project in reopened.by_status("On Hold")] == [1]
+
+def test_writes_only_append(tmp_path):
+    path = tmp_path / "projects.jsonl"
+    with ProjectStore(str(path)) as store:
+        store.put(make_project(1))
+        first = path.read_text()
+        store.put(make_project(1, status="Completed"))
+        store.delete(1)
+
+    content = path.read_text()
+    assert content.startswith(first)
+    assert [json.loads(line)['op'] for line in content.splitlines()] == ['put', 'put', 'delete']
+
+def test_date_range(tmp_path):
+    with ProjectStore(str(tmp_path / "projects.jsonl")) as store:
+        store.put(make_project(1, start="2024-01-10", end="2024-03-01"))
+        store.put(make_project(2, start="2024-02-01"))
+        store.put(make_project(3, start="2024-01-10", end="2024-01-20"))
+        store.put(make_project(2, start="2024-04-01"))
+
+        assert [p.id for p in store.date_range('start_date', date(2024, 1, 10), date(2024, 2, 1))] == [1, 3]
+        assert [p.id for p in store.date_range('start_date', start=date(2024, 1, 11))] == [2]
+        assert [p.id for p in store.date_range('end_date', end=date(2024, 2, 1))] == [3]
+
+def test_skips_unreadable_and_invalid_lines(tmp_path, caplog):
+    path = tmp_path / "projects.jsonl"
+    with ProjectStore(str(path)) as store:
+        store.put(make_project(1))
+    with open(path, 'a') as f:
+        f.write(json.dumps({'op': 'put', 'project': {'id': 2, 'name': "", 'description': "x"}}) + "\n")
+        f.write('{"op": "put", "proj')
+
+    with ProjectStore(str(path)) as reopened:
+        assert [project.id for project in reopened] == [1]
+        reopened.put(make_project(3))
+    assert "unreadable line 3" in caplog.text and "invalid project 2" in caplog.text
+
+    caplog.clear()
+    with ProjectStore(str(path)) as reopened:
+        assert [project.id for project in reopened] == [1, 3]
+    assert "unreadable line" not in caplog.text
+
+def test_keeps_last_line_without_newline(tmp_path):
+    path = tmp_path / "projects.jsonl"
+    path.write_text(json.dumps({'op': 'put', 'project': make_project(1).to_dict()}))
+
+    with ProjectStore(str(path)) as store:
+        store.put(make_project(2))
+    with ProjectStore(str(path)) as reopened:
+        assert sorted(project.id for project in reopened) == [1, 2]
+
+def test_read_only_store_leaves_the_disk_alone(tmp_path):
+    path = tmp_path / "data" / "projects.jsonl"
+    with ProjectStore(str(path), read_only=True) as store:
+        assert len(store) == 0
+        with pytest.raises(ValueError):
+            store.put(make_project(1))
+    assert not (tmp_path / "data").exists()
+
+    with ProjectStore(str(path)) as store:
+        store.put(make_project(1))
+    with open(path, 'a') as f:
+        f.write('{"op": "put", "proj')
+    torn = path.read_text()
+    with ProjectStore(str(path), read_only=True) as store:
+        assert [project.id for project in store] == [1]
+    assert path.read_text() == torn
+
+def test_compact_keeps_live_projects(tmp_path):
+    path = tmp_path / "projects.jsonl"
+    with ProjectStore(str(path)) as store:
+        for id in range(5):
+            store.put(make_project(id))
+        store.delete(0)
+        store.put(make_project(1, status="Completed"))
+        store.compact()
+        store.put(make_project(9))
+
+    assert len(path.read_text().splitlines()) == 5
+    with ProjectStore(str(path)) as reopened:
+        assert sorted(project.id for project in reopened) == [1, 2, 3, 4, 9]
+        assert reopened.get(1).status == "Completed"
+
+def test_queries_on_a_large_store(tmp_path):
+    path = tmp_path / "projects.jsonl"
+    statuses = ["In Progress", "Completed", "On Hold"]
+    with open(path, 'w') as f:
+        for id in range(100000):
+            project = make_project(id, status=statuses[id % 3], start=date.fromordinal(738000 + id % 1000).isoformat())
+            f.write(json.dumps({'op': 'put', 'project': project.to_dict()}) + "\n")
+
+    with ProjectStore(str(path)) as store:
+        assert store.get(99999).id == 99999
+        same_day = store.date_range('start_date', date.fromordinal(738500), date.fromordinal(738500))
+        assert [project.id for project in same_day] == list(range(500, 100000, 1000))
+        assert len(store.by_status("Completed")) == 33333
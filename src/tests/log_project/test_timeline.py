@@ -0,0 +1,96 @@
+from datetime import date, timedelta
+import random
+import pytest
+from log_project import timeline as timeline_command
+from log_project.lib.model.project import Project
+from log_project.lib.project_store import ProjectStore
+from log_project.lib.timeline import Timeline
+
+def make_project(id, start=None, end=None):
+    return Project(id, f"Project {id}", "A project for the timeline tests", start_date=start, end_date=end)
+
+def random_projects(count, seed=7):
+    rng = random.Random(seed)
+    base = date(2024, 1, 1)
+    projects = []
+    for id in range(count):
+        start = base + timedelta(days=rng.randrange(365))
+        end = start + timedelta(days=rng.randrange(60)) if rng.random() < 0.8 else None
+        projects.append(make_project(id, start, end))
+    projects.append(make_project(count))  # no dates: not on the timeline
+    return projects
+
+def is_active(project, low, high):
+    return project.start_date <= high and (project.end_date is None or project.end_date >= low)
+
+def test_queries_match_a_full_scan():
+    projects = random_projects(2000)
+    dated = [project for project in projects if project.start_date is not None]
+    timeline = Timeline(projects)
+    rng = random.Random(3)
+
+    assert len(timeline) == 2000
+    for _ in range(200):
+        low = date(2023, 12, 1) + timedelta(days=rng.randrange(450))
+        high = low + timedelta(days=rng.randrange(30))
+        expected = {project.id for project in dated if is_active(project, low, high)}
+        assert sorted(project.id for project in timeline.overlapping(low, high)) == sorted(expected)
+        assert timeline.count_active(low) == len(timeline.active_on(low))
+
+    target = dated[10]
+    expected = {project.id for project in dated if project.id != target.id and is_active(project, target.start_date, target.end_date or date.max)}
+    assert {project.id for project in timeline.overlapping_project(target)} == expected
+
+def test_boundaries_are_inclusive_and_open_ends_are_ongoing():
+    timeline = Timeline([
+        make_project(1, date(2024, 1, 1), date(2024, 1, 31)),
+        make_project(2, date(2024, 1, 31)),
+    ])
+
+    assert [project.id for project in timeline.active_on(date(2024, 1, 1))] == [1]
+    assert sorted(project.id for project in timeline.active_on(date(2024, 1, 31))) == [1, 2]
+    assert [project.id for project in timeline.active_on(date(2030, 1, 1))] == [2]
+    assert timeline.count_active(date(2024, 2, 1)) == 1
+    with pytest.raises(ValueError):
+        timeline.overlapping(date(2024, 2, 1), date(2024, 1, 1))
+
+def test_store_rebuilds_the_timeline_after_changes(tmp_path):
+    with ProjectStore(str(tmp_path / "projects.jsonl")) as store:
+        store.put(make_project(1, date(2024, 1, 1), date(2024, 1, 10)))
+        assert store.timeline() is store.timeline()
+        assert store.timeline().count_active(date(2024, 1, 5)) == 1
+
+        store.put(make_project(2, date(2024, 1, 3)))
+        assert store.timeline().count_active(date(2024, 1, 5)) == 2
+        store.delete(1)
+        assert [project.id for project in store.timeline().active_on(date(2024, 1, 5))] == [2]
+
+def test_timeline_command(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    with ProjectStore() as store:
+        store.put(make_project(1, date(2024, 1, 1), date(2024, 1, 10)))
+        store.put(make_project(2, date(2024, 1, 5)))
+
+    timeline_command.run(["active", "2024-01-06"])
+    timeline_command.run(["count", "2024-01-11"])
+    timeline_command.run(["overlaps", "2"])
+    timeline_command.run(["window", "2024-02-01", "2024-01-01"])
+    timeline_command.run(["active", "soon"])
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[:4] == [
+        "1: Project 1 (2024-01-01 - 2024-01-10)",
+        "2: Project 2 (2024-01-05 - ongoing)",
+        "1 project(s) active on 2024-01-11",
+        "1: Project 1 (2024-01-01 - 2024-01-10)",
+    ]
+    assert lines[4] == "End date must be on or after start date."
+    assert lines[5].startswith("Invalid argument") and lines[6] == "Usage:"
+
+def test_timeline_command_does_not_create_the_store(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+
+    timeline_command.run(["count", "2024-01-11"])
+
+    assert capsys.readouterr().out == "0 project(s) active on 2024-01-11\n"
+    assert list(tmp_path.iterdir()) == []
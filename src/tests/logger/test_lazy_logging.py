@@ -0,0 +1,81 @@
+import logging
+from shared.logger import LazyMessage, debug_lazy, get_console_handlers, log_lazy, set_console_level, setup_logger, stop_queue_listeners
+
+class CountingRepr:
+    def __init__(self):
+        self.calls = 0
+
+    def __repr__(self):
+        self.calls += 1
+        return "registry"
+
+def lazy_logger(name, tmp_path, level):
+    logging.getLogger(name).propagate = False
+    return setup_logger(name, {
+        'log_file': str(tmp_path / "logs" / "lazy.log"),
+        'log_to_file': False,
+        'mainLevel': level,
+        'consoleLevel': level,
+        'fileLevel': level,
+        'format': '%(message)s',
+    })
+
+def test_lazy_message_renders_once():
+    value = CountingRepr()
+    message = LazyMessage("Discovered commands: {commands!r}", {'commands': value})
+
+    assert str(message) == "Discovered commands: registry"
+    assert str(message) == "Discovered commands: registry"
+    assert value.calls == 1
+
+def test_lazy_message_calls_callable_fields():
+    message = LazyMessage("{count} commands", {'count': lambda: 3})
+    assert str(message) == "3 commands"
+
+def test_debug_lazy_skips_formatting_at_info_level(tmp_path):
+    logger = lazy_logger("test_debug_lazy_skips_formatting_at_info_level", tmp_path, logging.INFO)
+    value = CountingRepr()
+    expensive = []
+
+    debug_lazy(logger, "Discovered commands: {commands!r} {extra}", commands=value, extra=lambda: expensive.append(1))
+
+    assert value.calls == 0
+    assert expensive == []
+
+def test_log_lazy_keeps_structured_fields(tmp_path):
+    logger = lazy_logger("test_log_lazy_keeps_structured_fields", tmp_path, logging.DEBUG)
+    records = []
+
+    class Collect(logging.Handler):
+        def emit(self, record):
+            records.append(record)
+
+    logger.addHandler(Collect())
+    log_lazy(logger, logging.DEBUG, "Processing folder: {folder}", folder="editor")
+
+    assert records[0].getMessage() == "Processing folder: editor"
+    assert records[0].fields == {'folder': "editor"}
+    assert records[0].funcName == "test_log_lazy_keeps_structured_fields"
+
+def test_queue_handler_level_follows_console_level(tmp_path):
+    name = "test_queue_handler_level_follows_console_level"
+    logging.getLogger(name).propagate = False
+    logger = setup_logger(name, {
+        'log_file': str(tmp_path / "logs" / "lazy.log"),
+        'log_to_file': False,
+        'mainLevel': logging.DEBUG,
+        'consoleLevel': logging.WARNING,
+        'fileLevel': logging.DEBUG,
+        'format': '%(message)s',
+        'use_queue': True,
+    })
+    queue_handler = logger.handlers[0]
+    previous_levels = {handler: handler.level for handler in get_console_handlers()}
+    try:
+        assert queue_handler.level == logging.WARNING
+        set_console_level(logging.DEBUG)
+        assert queue_handler.level == logging.DEBUG
+    finally:
+        for handler, level in previous_levels.items():
+            handler.setLevel(level)
+        stop_queue_listeners()
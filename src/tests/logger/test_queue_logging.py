@@ -0,0 +1,102 @@
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler
+from shared.logger import BatchingQueueListener, get_console_handlers, set_console_level, setup_logger, stop_queue_listeners
+
+def queue_config(tmp_path):
+    return {
+        'log_file': str(tmp_path / "logs" / "queued.log"),
+        'log_to_file': True,
+        'mainLevel': logging.DEBUG,
+        'consoleLevel': logging.CRITICAL,
+        'fileLevel': logging.INFO,
+        'format': '%(levelname)s - %(message)s',
+        'use_queue': True,
+    }
+
+def isolated_logger(name, config):
+    # Without propagation, hasHandlers() ignores the capture handler pytest puts on the root logger.
+    logging.getLogger(name).propagate = False
+    return setup_logger(name, config)
+
+def test_queue_logger_writes_in_background(tmp_path):
+    logger = isolated_logger("test_queue_logger_writes_in_background", queue_config(tmp_path))
+
+    assert [type(handler) for handler in logger.handlers] == [QueueHandler]
+
+    for index in range(1000):
+        logger.info("record %d", index)
+    logger.debug("filtered by file level")
+    stop_queue_listeners()
+
+    lines = (tmp_path / "logs" / "queued.log").read_text().splitlines()
+    assert len(lines) == 1000
+    assert lines[0] == "INFO - record 0"
+    assert lines[-1] == "INFO - record 999"
+
+def test_queue_logger_does_not_write_on_calling_thread(tmp_path):
+    logger = isolated_logger("test_queue_logger_does_not_write_on_calling_thread", queue_config(tmp_path))
+    writer_threads = set()
+
+    listener_handlers = [handler for handler in get_console_handlers() if handler.level == logging.CRITICAL]
+    assert listener_handlers
+    original_handle = listener_handlers[0].handle
+
+    def record_thread(record):
+        writer_threads.add(threading.get_ident())
+        return original_handle(record)
+
+    listener_handlers[0].handle = record_thread
+    levels = {handler: handler.level for handler in get_console_handlers()}
+    set_console_level(logging.DEBUG)
+    try:
+        logger.info("hello")
+    finally:
+        stop_queue_listeners()
+        for handler, level in levels.items():
+            handler.setLevel(level)
+
+    assert writer_threads and threading.get_ident() not in writer_threads
+
+def test_batching_listener_flushes_once_per_batch():
+    flushes = []
+
+    class CountingHandler(logging.Handler):
+        def __init__(self):
+            super().__init__()
+            self.records = []
+
+        def emit(self, record):
+            self.records.append(record)
+
+        def flush(self):
+            flushes.append(len(self.records))
+
+    record_queue = queue.SimpleQueue()
+    handler = CountingHandler()
+    for index in range(10):
+        record_queue.put(logging.makeLogRecord({'msg': f"record {index}", 'levelno': logging.INFO}))
+    listener = BatchingQueueListener(record_queue, handler)
+    listener.start()
+    listener.stop()
+
+    assert len(handler.records) == 10
+    assert flushes[0] == 10
+
+def test_setup_after_stop_starts_a_new_listener(tmp_path):
+    config = queue_config(tmp_path)
+    name = "test_setup_after_stop_starts_a_new_listener"
+    first = isolated_logger(name, config)
+    first.info("before stop")
+    stop_queue_listeners()
+
+    assert not logging.getLogger(name).handlers
+    logger = isolated_logger(name, config)
+    other = isolated_logger(f"{name}.other", config)
+    logger.info("after stop")
+    other.info("from another logger")
+    stop_queue_listeners()
+
+    lines = (tmp_path / "logs" / "queued.log").read_text().splitlines()
+    assert lines == ["INFO - before stop", "INFO - after stop", "INFO - from another logger"]
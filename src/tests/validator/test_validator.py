@@ -139,3 +139,40 @@ class TestValidator:
     def test_validate_description_invalid(self, description, min_len, min_words):
         with pytest.raises(ValueError):
             Validator.validate_description(description, min_len, min_words)
+
+    # Test compiled pipelines
+    @pytest.mark.parametrize(
+        "name",
+        ["John Doe", "  Jane-Doe  ", "Jo", "Invalid@Name", "Trailing tab\t", "Inner\ttab", "   ", "x" * 51],
+    )
+    def test_compiled_name_matches_step_by_step_checks(self, name):
+        def step_by_step(value):
+            value = Validator.validate_length(value)
+            value = Validator.validate_format(value)
+            return Validator.validate_word_count(value)
+
+        try:
+            expected = step_by_step(name)
+        except ValueError as e:
+            with pytest.raises(ValueError, match=str(e).replace("(", r"\(").replace(")", r"\)")):
+                Validator.compile_name()(name)
+        else:
+            assert Validator.compile_name()(name) == expected
+
+    def test_compile_name_is_built_once(self):
+        assert Validator.compile_name(3, 50) is Validator.compile_name(3, 50)
+
+    def test_validate_many_with_pipeline(self):
+        values = ["Project One", "No!", "  Padded name  ", "Bad@Name here", "ok"]
+        results, errors = Validator.validate_many(values, Validator.compile_name())
+
+        assert results == ["Project One", None, "Padded name", None, None]
+        assert set(errors) == {1, 3, 4}
+        assert errors[3] == "Value must contain only alphanumeric characters, spaces, hyphens, and underscores."
+        assert errors[4] == "Value must be between 3 and 50 characters."
+
+    def test_validate_many_with_any_validator(self):
+        results, errors = Validator.validate_many(["apple", "grape"], lambda value: Validator.validate_enum(value, ["apple"]))
+
+        assert results == ["apple", None]
+        assert list(errors) == [1]